@@ -102,6 +102,9 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []  # Pas de champs supplémentaires requis pour createsuperuser
     
+    # Champs affichés dans le portfolio public (via get_full_name)
+    PUBLIC_FIELDS = ['first_name', 'last_name', 'email']
+    
     class Meta:
         verbose_name = 'Utilisateur'
         verbose_name_plural = 'Utilisateurs'
@@ -111,6 +114,33 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_public_values()
+        return instance
+    
+    def remember_public_values(self):
+        """Keep the stored value of the fields shown in the public portfolio."""
+        self._public_values = {
+            name: self.__dict__[name]
+            for name in self.PUBLIC_FIELDS
+            if name in self.__dict__
+        }
+    
+    def has_public_changes(self):
+        """
+        Check if a field shown in the public portfolio changed since the
+        user was loaded (always True for a user not loaded from the database).
+        """
+        public_values = getattr(self, '_public_values', None)
+        if public_values is None:
+            return True
+        return any(
+            name in self.__dict__ and self.__dict__[name] != public_values.get(name)
+            for name in self.PUBLIC_FIELDS
+        )
+    
     def get_full_name(self):
         """Return the first_name plus the last_name, with a space in between."""
         full_name = f"{self.first_name} {self.last_name}".strip()
@@ -0,0 +1,73 @@
+"""
+Write-behind buffers.
+
+Hot read paths (public profile views, recruiter link accesses) only add
+to an in-memory buffer, one per worker process. A background thread of
+that process writes the buffer to the database at a fixed interval, and
+whatever is left is written when the process exits.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBuffer:
+    """
+    Base class of the per-process write-behind buffers.
+
+    Subclasses keep their pending writes under `self._lock`, call
+    `self._ensure_flusher()` (lock held) when adding to them, and
+    implement flush().
+    """
+
+    # Name of the thread, for debugging
+    thread_name = 'write-behind-buffer'
+
+    def __init__(self, get_interval):
+        """
+        Args:
+            get_interval: Callable returning the seconds between two flushes
+                (read when the thread starts, after settings are loaded)
+        """
+        self._get_interval = get_interval
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        # Don't lose the last buffered writes when the worker stops
+        atexit.register(self.flush)
+
+    def flush(self):
+        """Write the buffered data to the database."""
+        raise NotImplementedError
+
+    def _ensure_flusher(self):
+        """Start the flush thread of this process if needed (lock held)."""
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+
+        # New process (e.g. forked worker): the parent's thread doesn't exist here
+        self._pid = pid
+        self._thread = threading.Thread(
+            target=self._run,
+            name=self.thread_name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self):
+        interval = self._get_interval()
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Échec de l'écriture différée (%s)", self.thread_name)
+            finally:
+                close_old_connections()
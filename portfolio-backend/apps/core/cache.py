@@ -0,0 +1,209 @@
+"""
+Response cache for the public read endpoints.
+
+Entries are keyed by action name, owner user_id and allowed visibilities,
+and hold the rendered JSON bytes. Each owner has a version number bumped
+on every content write (see invalidate_public_cache), which makes all of
+the owner's entries stale at once without touching other portfolios.
+
+Stale entries are kept for PUBLIC_CACHE_STALE_TIMEOUT seconds: while one
+request rebuilds an entry (guarded by a cache lock), concurrent requests
+keep receiving the stale copy instead of all hitting the database.
+
+Fresh responses carry ETag / Last-Modified validators derived from the
+portfolio snapshot build date, and conditional requests whose copy is
+still current get a 304 without any serialization.
+"""
+import time
+import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from .utils import get_allowed_visibilities, on_commit_once
+
+
+# Seconds a rebuild lock is held before another request may retry
+REBUILD_LOCK_TIMEOUT = 30
+
+# How long a cold miss waits for a concurrent rebuild before building itself
+COLD_MISS_WAIT = 1.0
+COLD_MISS_POLL_INTERVAL = 0.05
+
+
+def _version_key(user_id):
+    return f"public:version:{user_id}"
+
+
+def _version_timeout():
+    # An entry never outlives this: an expired version can't revive one
+    return settings.PUBLIC_CACHE_TIMEOUT + settings.PUBLIC_CACHE_STALE_TIMEOUT
+
+
+def _entry_key(name, user_id, visibilities):
+    return f"public:{name}:{user_id}:{'+'.join(sorted(visibilities))}"
+
+
+def _get_entry_and_version(entry_key, version_key):
+    """Fetch an entry and its owner's current version in one round trip."""
+    values = cache.get_many([entry_key, version_key])
+    version = values.get(version_key)
+
+    if version is None:
+        # Unknown (or evicted) version: start a new one, never reusing old numbers
+        cache.add(version_key, time.time_ns(), timeout=_version_timeout())
+        version = cache.get(version_key)
+
+    return values.get(entry_key), version
+
+
+def _store_entry(entry_key, version, content):
+    cache.set(
+        entry_key,
+        {
+            'version': version,
+            'fresh_until': time.time() + settings.PUBLIC_CACHE_TIMEOUT,
+            'content': content,
+        },
+        timeout=_version_timeout(),
+    )
+
+
+def _json_response(content):
+    return HttpResponse(content, content_type='application/json')
+
+
+def get_validators(last_modified, tier):
+    """
+    Return the (etag, last_modified timestamp) validators of a public read.
+
+    Args:
+        last_modified: Build date of the portfolio snapshot, or None
+        tier: Snapshot tier the response was rendered for
+    """
+    if last_modified is None:
+        return None
+    timestamp = last_modified.timestamp()
+    return f'"{tier}-{int(timestamp * 1_000_000)}"', int(timestamp)
+
+
+def get_not_modified_response(request, validators):
+    """Return a 304 response if the client's copy is still current, else None."""
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, validators):
+    """Add the validators to a response and require clients to revalidate."""
+    if validators is not None:
+        etag, last_modified = validators
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def invalidate_public_cache(user_id):
+    """
+    Mark every cached public response of an owner as stale.
+
+    Runs once the current transaction commits, so a concurrent reader
+    can't cache the pre-commit state under the new version.
+    """
+    if not user_id:
+        return
+
+    def _bump_version():
+        key = _version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=_version_timeout())
+
+    on_commit_once(('public_cache', user_id), _bump_version)
+
+
+def cached_public_action(name):
+    """
+    Cache the JSON response of a public viewset action.
+
+    The decorated action must take the owner from the `user_id` query
+    param and filter with get_allowed_visibilities(request, user_id). Only
+    successful responses are cached.
+
+    Args:
+        name: Unique cache name of the action (e.g. 'projects.public')
+    """
+    def decorator(action_func):
+        @wraps(action_func)
+        def wrapper(self, request, *args, **kwargs):
+            try:
+                user_id = str(uuid.UUID(request.query_params.get('user_id', '')))
+            except ValueError:
+                # Missing or malformed: let the action answer, uncached
+                return action_func(self, request, *args, **kwargs)
+
+            # Import inside function to avoid circular imports
+            from apps.profiles.models import Profile
+            from apps.profiles.snapshots import get_snapshot_built_at, get_snapshot_tier
+
+            visibilities = get_allowed_visibilities(request, user_id)
+            tier = get_snapshot_tier(visibilities)
+            # Read before the content: the content is never older than its validators
+            built_at = get_snapshot_built_at(user_id, tier)
+
+            if built_at is None and not Profile.objects.filter(user_id=user_id).exists():
+                # No such portfolio: nothing is written to the cache for it
+                return action_func(self, request, *args, **kwargs)
+
+            validators = get_validators(built_at, tier)
+
+            not_modified = get_not_modified_response(request, validators)
+            if not_modified is not None:
+                return set_validators(not_modified, validators)
+
+            entry_key = _entry_key(name, user_id, visibilities)
+            entry, version = _get_entry_and_version(entry_key, _version_key(user_id))
+
+            if entry is not None:
+                is_fresh = entry['version'] == version and time.time() < entry['fresh_until']
+                if is_fresh:
+                    return set_validators(_json_response(entry['content']), validators)
+
+            lock_key = f"{entry_key}:lock"
+            has_lock = cache.add(lock_key, 1, timeout=REBUILD_LOCK_TIMEOUT)
+
+            if not has_lock:
+                # Another request is rebuilding this entry: stale copies get no validators
+                if entry is not None:
+                    return set_validators(_json_response(entry['content']), None)
+
+                deadline = time.monotonic() + COLD_MISS_WAIT
+                while time.monotonic() < deadline:
+                    time.sleep(COLD_MISS_POLL_INTERVAL)
+                    entry = cache.get(entry_key)
+                    if entry is not None:
+                        return set_validators(_json_response(entry['content']), None)
+
+            try:
+                response = action_func(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+                content = JSONRenderer().render(response.data)
+                _store_entry(entry_key, version, content)
+                return set_validators(_json_response(content), validators)
+            finally:
+                if has_lock:
+                    cache.delete(lock_key)
+
+        return wrapper
+    return decorator
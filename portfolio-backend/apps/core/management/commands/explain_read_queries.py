@@ -0,0 +1,268 @@
+"""
+Check that the owner and public list queries are served by their index
+"""
+import datetime
+import re
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.core.enums import ProofType, SkillCategory, Visibility
+from apps.education.models import Diploma, Certification
+from apps.professional.models import Experience, Training
+from apps.projects.models import Project
+from apps.proofs.models import Proof
+from apps.skills.models import Skill
+
+
+# Models whose sections have an owner list and a public list
+SECTION_MODELS = [Project, Diploma, Certification, Experience, Training]
+
+# Plan lines reading a whole table
+SEQUENTIAL_SCAN_PATTERNS = {
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+    # "SCAN t" (or "SCAN TABLE t" before SQLite 3.36) without "USING ... INDEX"
+    'sqlite': re.compile(r'\bSCAN (?:TABLE )?(\w+)\s*$'),
+}
+
+# Plan lines sorting the rows: the index doesn't give the list order
+SORT_PATTERNS = {
+    # "Sort" or "Incremental Sort" node
+    'postgresql': re.compile(r'\bSort\b'),
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR .*ORDER BY'),
+}
+
+# Size of the dataset seeded for the plans (rolled back afterwards)
+SEED_OWNERS = 50
+SEED_ITEMS = 20
+
+
+def get_read_queries(user_id, object_id=None):
+    """
+    Return the (label, queryset, index name) list queries of the API and
+    the public portfolio, for one owner.
+
+    They mirror the viewsets (owner lists) and build_public_portfolio /
+    the `public` actions (visible, published items).
+
+    Args:
+        user_id: Owner of the listed rows
+        object_id: Project whose proofs are listed (default: none)
+    """
+    visibilities = [Visibility.PUBLIC, Visibility.RECRUTEUR]
+    queries = []
+
+    for model in SECTION_MODELS:
+        ordering = model._meta.ordering
+        name = model._meta.model_name
+        public = model.objects.filter(
+            user_id=user_id,
+            visibility__in=visibilities,
+            is_published=True,
+        ).order_by(*ordering)
+
+        queries.append((
+            f"{model._meta.label} (propriétaire)",
+            model.objects.filter(user_id=user_id).order_by(*ordering),
+            f'{name}_owner_order_idx',
+        ))
+        queries.append((f"{model._meta.label} (public)", public, f'{name}_public_idx'))
+
+        if model is Project:
+            queries.append((f"{model._meta.label} (mis en avant)", public.filter(is_featured=True), f'{name}_public_idx'))
+
+    queries += [
+        (
+            'skills.Skill (propriétaire)',
+            Skill.objects.filter(user_id=user_id).order_by('display_order', 'category', 'name'),
+            'skill_owner_order_idx',
+        ),
+        (
+            'skills.Skill (public)',
+            Skill.objects.filter(user_id=user_id).order_by('display_order', 'name'),
+            'skill_public_order_idx',
+        ),
+        (
+            'skills.Skill (principales)',
+            Skill.objects.filter(user_id=user_id, is_primary=True).order_by('display_order', 'name'),
+            'skill_public_order_idx',
+        ),
+        (
+            'proofs.Proof (propriétaire)',
+            Proof.objects.filter(user_id=user_id).order_by('display_order', 'created_at'),
+            'proof_owner_order_idx',
+        ),
+        (
+            'proofs.Proof (par élément)',
+            Proof.objects.filter(
+                user_id=user_id,
+                content_type=ContentType.objects.get_for_model(Project),
+                object_id=object_id or uuid.uuid4(),
+            ).order_by('display_order', 'created_at'),
+            'proof_object_order_idx',
+        ),
+    ]
+
+    return queries
+
+
+def seed_read_dataset():
+    """
+    Create SEED_OWNERS owners with SEED_ITEMS rows in every section, of
+    every visibility, so the planner sees tables where one owner's rows
+    are a small part of the whole. Rows are created without signals; the
+    caller rolls them back.
+
+    Returns:
+        (user_id, project_id) of one seeded owner and one of its projects
+    """
+    # Import inside function to avoid circular imports
+    from apps.accounts.models import User
+
+    visibilities = Visibility.values
+    categories = SkillCategory.values
+    users = User.objects.bulk_create([
+        User(email=f'explain-{uuid.uuid4().hex}@example.com', first_name='Plan', last_name=str(index))
+        for index in range(SEED_OWNERS)
+    ])
+
+    def rows(model, **fields):
+        return model.objects.bulk_create([
+            model(
+                user=user,
+                display_order=index % 5,
+                visibility=visibilities[index % len(visibilities)],
+                is_published=index % 4 != 0,
+                **{name: value(index) if callable(value) else value for name, value in fields.items()},
+            )
+            for user in users
+            for index in range(SEED_ITEMS)
+        ])
+
+    def month(index):
+        return f'20{10 + index % 15}-{1 + index % 12:02d}'
+
+    projects = rows(
+        Project, title='Projet', short_description='Projet de démonstration', description='Description',
+        start_date=month, technologies='Python', key_features='Démonstration', is_featured=lambda index: index % 3 == 0,
+    )
+    rows(Diploma, title='Diplôme', institution='Université', level='Master', field='Informatique', start_date=month, end_date=month)
+    rows(
+        Certification, name='Certification', organization='Organisme',
+        issue_date=lambda index: datetime.date(2010 + index % 15, 1 + index % 12, 1),
+    )
+    rows(Experience, position='Poste', company='Entreprise', start_date=month, description='Description', missions='Missions')
+    rows(Training, title='Formation', organization='Organisme', start_date=month, description='Description')
+
+    Skill.objects.bulk_create([
+        Skill(
+            user=user,
+            name=f'Compétence {index}',
+            category=categories[index % len(categories)],
+            display_order=index % 5,
+            is_primary=index % 3 == 0,
+        )
+        for user in users
+        for index in range(SEED_ITEMS)
+    ])
+
+    content_type = ContentType.objects.get_for_model(Project)
+    Proof.objects.bulk_create([
+        Proof(
+            user=project.user,
+            content_type=content_type,
+            object_id=project.pk,
+            title=f'Preuve {index}',
+            proof_type=ProofType.PDF,
+            display_order=index,
+        )
+        for project in projects[::SEED_ITEMS // 4]
+        for index in range(3)
+    ])
+
+    if connection.vendor == 'postgresql':
+        # Statistics of the seeded tables (rolled back with them)
+        with connection.cursor() as cursor:
+            for model in [*SECTION_MODELS, Skill, Proof]:
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+    return users[0].pk, projects[0].pk
+
+
+class Command(BaseCommand):
+    help = (
+        "Affiche le plan (EXPLAIN) des requêtes de liste du propriétaire et du "
+        "portfolio public sur un jeu de données représentatif (annulé ensuite), "
+        "et échoue si l'une d'elles n'utilise pas son index, parcourt une table "
+        "entière ou trie les lignes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            help="Email d'un propriétaire dont les données servent aux requêtes, au lieu du jeu de données généré"
+        )
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help="Afficher le plan de chaque requête, même sans problème"
+        )
+
+    def handle(self, *args, **options):
+        # Import inside function to avoid circular imports
+        from apps.accounts.models import User
+
+        scan_pattern = SEQUENTIAL_SCAN_PATTERNS.get(connection.vendor)
+        sort_pattern = SORT_PATTERNS.get(connection.vendor)
+        if scan_pattern is None:
+            raise CommandError(f"Base de données non prise en charge: {connection.vendor}")
+
+        failures = []
+
+        with transaction.atomic():
+            if options['user']:
+                user_id = User.objects.filter(email=options['user']).values_list('id', flat=True).first()
+                if user_id is None:
+                    raise CommandError(f"Utilisateur introuvable: {options['user']}")
+                object_id = Project.objects.filter(user_id=user_id).values_list('id', flat=True).first()
+            else:
+                user_id, object_id = seed_read_dataset()
+
+            if connection.vendor == 'postgresql':
+                # Sur de petites tables, le planificateur préfère un parcours
+                # séquentiel même avec un index utilisable: on ne le garde que
+                # s'il n'existe aucun autre plan.
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for label, queryset, index_name in get_read_queries(user_id, object_id):
+                plan = queryset.explain()
+                lines = plan.splitlines()
+
+                problems = []
+                scanned = [match.group(1) for match in map(scan_pattern.search, lines) if match]
+                if scanned:
+                    problems.append(f"parcours séquentiel de {', '.join(scanned)}")
+                if not re.search(rf'\b{re.escape(index_name)}\b', plan):
+                    problems.append(f"index {index_name} non utilisé")
+                if any(sort_pattern.search(line) for line in lines):
+                    problems.append("tri des lignes")
+
+                if problems:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f"{label}: {', '.join(problems)}"))
+                else:
+                    self.stdout.write(f"{label}: OK ({index_name})")
+
+                if problems or options['verbose_plans']:
+                    self.stdout.write(plan)
+
+            # Rien de ce qui précède n'est conservé
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} requête(s) sans leur index: {', '.join(failures)}")
+
+        self.stdout.write(self.style.SUCCESS("Toutes les requêtes de liste utilisent leur index"))
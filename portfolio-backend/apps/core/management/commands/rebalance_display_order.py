@@ -0,0 +1,48 @@
+"""
+Respace the display_order keys of lists running out of room
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.ordering import get_ordered_models, needs_rebalance, rebalance, sort_list
+
+
+class Command(BaseCommand):
+    help = (
+        "Réespace les ordres d'affichage (display_order) des listes dont les "
+        "écarts sont épuisés, pour que les déplacements n'écrivent qu'une ligne."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-gap',
+            type=int,
+            default=16,
+            help="Écart minimal toléré entre deux éléments (défaut: 16)"
+        )
+
+    def handle(self, *args, **options):
+        # Import inside function to avoid circular imports
+        from apps.profiles.signals import refresh_public_portfolio
+
+        lists_count = rows_count = 0
+
+        for model, scope_attnames in get_ordered_models():
+            manager = model._default_manager
+            scopes = manager.order_by().values_list(*scope_attnames).distinct()
+
+            for scope_values in scopes.iterator():
+                queryset = manager.filter(**dict(zip(scope_attnames, scope_values)))
+                orders = sort_list(queryset).values_list('display_order', flat=True)
+
+                if not needs_rebalance(orders, options['min_gap']):
+                    continue
+
+                with transaction.atomic():
+                    rows_count += rebalance(queryset)
+                    refresh_public_portfolio(queryset.values_list('user_id', flat=True).first())
+                lists_count += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{lists_count} liste(s) réespacée(s), {rows_count} élément(s) mis à jour"
+        ))
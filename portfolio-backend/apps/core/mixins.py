@@ -0,0 +1,169 @@
+"""
+Reusable viewset mixins
+"""
+import uuid
+
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from . import ordering
+from .serializers import DynamicFieldsMixin
+
+
+class SparseFieldsetMixin:
+    """
+    Load only the columns of the fields picked with `?fields=` / `?omit=`.
+
+    The serializer (apps.core.serializers.DynamicFieldsMixin) tells which
+    model fields the selected fields read; the queryset is restricted to
+    them with .only(). When a selected field can't be mapped to columns,
+    the whole row is loaded as before.
+    """
+
+    # Loaded whatever the selection (ownership checks read the owner)
+    always_loaded_fields = ['user']
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        serializer = self.get_serializer()
+        if not isinstance(serializer, DynamicFieldsMixin):
+            return queryset
+
+        params = self.request.query_params
+        if serializer.fields_query_param not in params and serializer.omit_query_param not in params:
+            return queryset
+
+        only_fields = serializer.get_only_fields(annotations=queryset.query.annotations)
+        if only_fields is None:
+            return queryset
+
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        only_fields.update(name for name in self.always_loaded_fields if name in model_fields)
+        return queryset.only(*only_fields)
+
+
+class ReorderMixin:
+    """
+    Add the `reorder` and `move` ordering actions to a viewset.
+
+    `reorder` writes the display order of many items at once:
+
+        POST reorder/  { "<reorder_key>": [{"id": "uuid", "display_order": 0}, ...] }
+
+    Ownership of every id is checked with one query: if any item doesn't
+    exist or belongs to someone else, nothing is written. The new orders
+    are then written with a single bulk UPDATE inside a transaction, and
+    the updated ordering is returned.
+
+    `move` places one item between two neighbours and usually only writes
+    that item (see apps.core.ordering):
+
+        POST <item>/move/  { "after": "uuid" | null, "before": "uuid" | null }
+    """
+
+    # Body key holding the items, e.g. 'projects'
+    reorder_key = None
+
+    # Error message when the list is missing or empty
+    reorder_required_message = 'Liste requise'
+
+    def get_reorder_queryset(self):
+        """Items the user may reorder."""
+        model = self.get_queryset().model
+        return model._default_manager.filter(user=self.request.user)
+
+    @action(detail=False, methods=['post'], parser_classes=[JSONParser])
+    def reorder(self, request):
+        """Reorder items (bulk update of display_order)."""
+        items = request.data.get(self.reorder_key)
+
+        if not items or not isinstance(items, list):
+            return Response(
+                {'error': self.reorder_required_message},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        orders = {}
+        try:
+            for item in items:
+                display_order = int(item['display_order'])
+                if display_order < 0:
+                    raise ValueError(display_order)
+                orders[uuid.UUID(str(item['id']))] = display_order
+        except (KeyError, TypeError, ValueError):
+            return Response(
+                {'error': 'Chaque élément doit avoir un id et un display_order (entier positif) valides'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = self.get_reorder_queryset()
+        objects = list(queryset.filter(pk__in=orders).only('id', 'user_id', 'display_order'))
+
+        if len(objects) != len(orders):
+            found_ids = {obj.pk for obj in objects}
+            return Response(
+                {
+                    'error': 'Éléments introuvables',
+                    'invalid_ids': [str(pk) for pk in orders if pk not in found_ids],
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        for obj in objects:
+            obj.display_order = orders[obj.pk]
+
+        with transaction.atomic():
+            queryset.bulk_update(objects, ['display_order'])
+            self.perform_reorder(objects)
+
+        ordering = sorted(objects, key=lambda obj: obj.display_order)
+
+        return Response({
+            'message': 'Ordre mis à jour',
+            self.reorder_key: [
+                {'id': str(obj.pk), 'display_order': obj.display_order}
+                for obj in ordering
+            ],
+        }, status=status.HTTP_200_OK)
+
+    def perform_reorder(self, objects):
+        """
+        Hook run after the bulk update, inside its transaction.
+
+        bulk_update doesn't send post_save, so the public portfolio of the
+        owner is refreshed here.
+        """
+        # Import inside function to avoid circular imports
+        from apps.profiles.signals import refresh_public_portfolio
+        refresh_public_portfolio(self.request.user.id)
+
+    @action(detail=True, methods=['post'], parser_classes=[JSONParser])
+    def move(self, request, pk=None):
+        """Move an item between two neighbours (sparse display_order)."""
+        obj = self.get_object()
+
+        try:
+            with transaction.atomic():
+                rebalanced = ordering.move(
+                    obj,
+                    before=request.data.get('before'),
+                    after=request.data.get('after'),
+                )
+                obj.save(update_fields=['display_order'])
+        except ordering.MoveError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'message': 'Élément déplacé',
+            'id': str(obj.pk),
+            'display_order': obj.display_order,
+            'rebalanced': rebalanced,
+        }, status=status.HTTP_200_OK)
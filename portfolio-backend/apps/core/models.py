@@ -2,7 +2,9 @@
 Base models and mixins for the application
 """
 from django.db import models
+from django.db.models.fields.files import FieldFile
 from django.conf import settings
+import copy
 import uuid
 
 from .enums import Visibility
@@ -17,6 +19,9 @@ class BaseModel(models.Model):
     - UUID as primary key
     - created_at and updated_at timestamps
     - Soft delete capability (optional)
+    - Dirty-field tracking: saving an instance loaded from the database
+      only writes the columns that changed, and a save without changes
+      doesn't touch the database (nor send signals)
     """
     
     id = models.UUIDField(
@@ -40,6 +45,85 @@ class BaseModel(models.Model):
         abstract = True
         ordering = ['-created_at']
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_loaded_values()
+        return instance
+
+    def _remember_loaded_values(self, fields=None):
+        """Keep the current value of the loaded fields, as stored in the database."""
+        loaded_values = getattr(self, '_loaded_values', None) or {}
+        for field in self._meta.concrete_fields:
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+            if field.attname in self.__dict__:
+                value = self.__dict__[field.attname]
+                # Files and mutable values (JSON) may be changed in place
+                if isinstance(value, FieldFile):
+                    value = value.name
+                elif isinstance(value, (dict, list)):
+                    value = copy.deepcopy(value)
+                loaded_values[field.attname] = value
+        self._loaded_values = loaded_values
+
+    def get_dirty_fields(self):
+        """
+        Return the names of the fields changed since the instance was loaded
+        or last saved (every field for an instance not loaded from the
+        database).
+        """
+        loaded_values = getattr(self, '_loaded_values', None)
+        dirty = []
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname not in self.__dict__:
+                continue
+            if loaded_values is None or field.attname not in loaded_values:
+                dirty.append(field.name)
+                continue
+            value = self.__dict__[field.attname]
+            if isinstance(value, FieldFile) and not value._committed:
+                # New upload, whatever its name
+                dirty.append(field.name)
+            elif value != loaded_values[field.attname]:
+                dirty.append(field.name)
+        return dirty
+
+    def has_changed(self, *field_names):
+        """Check if any of these fields changed since the instance was loaded."""
+        return bool(set(field_names) & set(self.get_dirty_fields()))
+
+    def save(self, *args, **kwargs):
+        """
+        Save only the changed fields of an instance loaded from the database.
+
+        An explicit update_fields is kept as is; new instances are inserted
+        as usual.
+        """
+        if (
+            not args
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+            and not self._state.adding
+            and getattr(self, '_loaded_values', None) is not None
+        ):
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            auto_now = [
+                field.name for field in self._meta.concrete_fields
+                if getattr(field, 'auto_now', False) and field.name not in dirty
+            ]
+            kwargs['update_fields'] = dirty + auto_now
+
+        super().save(*args, **kwargs)
+
+        self._remember_loaded_values(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._remember_loaded_values(kwargs.get('fields'))
+
 
 class VisibilityMixin(models.Model):
     """
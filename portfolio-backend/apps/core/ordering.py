@@ -0,0 +1,150 @@
+"""
+Sparse display_order keys.
+
+Ordered items are spaced ORDER_GAP apart, so moving one item between
+two neighbours only writes the moved row (the middle of the gap). When a
+gap is used up, the list is respaced once (rebalance); the
+`rebalance_display_order` command does it in the background for lists
+that are running out of room.
+
+Ordering is always read with the model's Meta.ordering (display_order
+first), completed by the primary key, so ties are stable.
+"""
+from django.apps import apps
+
+
+# Distance between two consecutive items after a rebalance
+ORDER_GAP = 1024
+
+# Ordered models and the fields delimiting one list
+ORDERED_MODELS = {
+    'projects.Project': ('user',),
+    'skills.Skill': ('user',),
+    'education.Diploma': ('user',),
+    'education.Certification': ('user',),
+    'professional.Experience': ('user',),
+    'professional.Training': ('user',),
+    'proofs.Proof': ('user', 'content_type', 'object_id'),
+}
+
+
+class MoveError(ValueError):
+    """Invalid move (unknown or non-adjacent neighbours)."""
+
+
+def get_ordered_models():
+    """Return the (model, scope attnames) pairs of every ordered model."""
+    return [
+        (apps.get_model(label), _get_scope_attnames(apps.get_model(label)))
+        for label in ORDERED_MODELS
+    ]
+
+
+def _get_scope_attnames(model):
+    return [model._meta.get_field(name).attname for name in ORDERED_MODELS[model._meta.label]]
+
+
+def get_list_queryset(obj):
+    """Return the items of the list obj belongs to (obj included)."""
+    model = type(obj)
+    scope = {attname: getattr(obj, attname) for attname in _get_scope_attnames(model)}
+    return model._default_manager.filter(**scope)
+
+
+def sort_list(queryset):
+    """Order a list queryset the way it is displayed."""
+    return queryset.order_by(*queryset.model._meta.ordering, 'pk')
+
+
+def needs_rebalance(orders, min_gap=2):
+    """
+    Check if a sorted list of display_order values is running out of room.
+
+    Args:
+        orders: display_order values in display order
+        min_gap: Smallest acceptable distance between two items (and
+            before the first one)
+    """
+    previous = -1
+    for order in orders:
+        if order - previous < min_gap:
+            return True
+        previous = order
+    return False
+
+
+def rebalance(queryset):
+    """
+    Respace a list to multiples of ORDER_GAP, keeping its current order.
+
+    Returns:
+        int: Number of rows written
+    """
+    objects = list(sort_list(queryset).only('id', 'display_order'))
+
+    changed = []
+    for index, obj in enumerate(objects, start=1):
+        order = index * ORDER_GAP
+        if obj.display_order != order:
+            obj.display_order = order
+            changed.append(obj)
+
+    if changed:
+        queryset.model._default_manager.bulk_update(changed, ['display_order'], batch_size=500)
+
+    return len(changed)
+
+
+def move(obj, before=None, after=None):
+    """
+    Move an item between two neighbours of its list.
+
+    Only obj is written, unless its neighbours have no room left between
+    them: the rest of the list is then rebalanced first. The caller saves
+    obj (display_order is set on the instance).
+
+    Args:
+        obj: Item to move
+        before: Id of the item that will follow obj (None: end of the list)
+        after: Id of the item that will precede obj (None: start of the list)
+
+    Returns:
+        bool: True if the list had to be rebalanced
+
+    Raises:
+        MoveError: If a neighbour is not in the list, or both are given
+            and aren't adjacent
+    """
+    others = get_list_queryset(obj).exclude(pk=obj.pk)
+    rebalanced = False
+
+    while True:
+        rows = list(sort_list(others).values_list('pk', 'display_order'))
+        ids = [str(pk) for pk, order in rows]
+
+        for neighbour in (after, before):
+            if neighbour is not None and str(neighbour) not in ids:
+                raise MoveError("Voisin introuvable dans cette liste")
+
+        if after is not None:
+            position = ids.index(str(after)) + 1
+            if before is not None and (position >= len(ids) or ids[position] != str(before)):
+                raise MoveError("Les voisins indiqués ne sont pas adjacents")
+        elif before is not None:
+            position = ids.index(str(before))
+        else:
+            position = len(ids)
+
+        low = rows[position - 1][1] if position > 0 else -1
+        if position == len(rows):
+            obj.display_order = max(low, 0) + ORDER_GAP
+            return rebalanced
+
+        high = rows[position][1]
+        if high - low >= 2:
+            obj.display_order = (low + high) // 2
+            return rebalanced
+
+        # No room left between the neighbours: respace the list once
+        rebalance(others)
+        rebalanced = True
@@ -0,0 +1,168 @@
+"""
+Opt-in cursor pagination for the owner list endpoints
+"""
+import base64
+import json
+from functools import reduce
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class OptionalCursorPagination(BasePagination):
+    """
+    Keyset pagination, only used when the client asks for it.
+
+    Without `page_size` or `cursor` in the query string the list is
+    returned whole, as before. Otherwise:
+
+        GET /api/projects/?page_size=20
+        -> { "next": ".../?page_size=20&cursor=<cursor>", "results": [...] }
+
+    The cursor holds the key of the last row returned, and the next page
+    is read with `WHERE key > cursor` on the cursor ordering, so the cost
+    of a page doesn't grow with its position and rows added or moved
+    meanwhile are neither skipped nor repeated. The ordering ends with
+    the primary key to make the key unique.
+
+    A viewset may set `cursor_ordering` to page on other fields (the
+    fields must be non-nullable model fields).
+    """
+
+    cursor_ordering = ('display_order', 'created_at', 'id')
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 20
+    max_page_size = 100
+
+    invalid_cursor_message = 'Curseur invalide'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_size_query_param not in params and self.cursor_query_param not in params:
+            return None
+
+        self.request = request
+        self.ordering = tuple(getattr(view, 'cursor_ordering', self.cursor_ordering))
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        # The cursor is read on the last row: keep its fields loaded when
+        # the queryset is restricted with .only()
+        loaded_fields, deferred = queryset.query.deferred_loading
+        if loaded_fields and not deferred:
+            queryset = queryset.only(*loaded_fields, *(field.lstrip('-') for field in self.ordering))
+
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self._after(position))
+
+        # One extra row tells whether there is a next page
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def _after(self, position):
+        """
+        Rows strictly after the position, in the cursor ordering:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z)...
+        """
+        conditions = []
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            equal = {
+                previous.lstrip('-'): position[previous.lstrip('-')]
+                for previous in self.ordering[:index]
+            }
+            conditions.append(Q(**equal, **{f'{name}__{lookup}': position[name]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    def decode_cursor(self, request, model):
+        """Return the position in the cursor, or None for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            names = [field.lstrip('-') for field in self.ordering]
+            if not isinstance(values, list) or len(values) != len(names):
+                raise ValueError(values)
+            return {
+                name: model._meta.get_field(name).to_python(value)
+                for name, value in zip(names, values)
+            }
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj):
+        values = [
+            obj._meta.get_field(field.lstrip('-')).value_to_string(obj)
+            for field in self.ordering
+        ]
+        encoded = base64.urlsafe_b64encode(json.dumps(values).encode()).decode('ascii')
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.page_size)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': "Nombre d'éléments par page (active la pagination)",
+                'schema': {'type': 'integer'},
+            },
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Curseur de la page suivante (lien `next`)',
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -61,14 +61,9 @@ class VisibilityPermission(permissions.BasePermission):
                 if obj.user == request.user:
                     return True
             
-            # Check for valid recruiter token
-            recruiter_token = request.query_params.get('access') or request.META.get('HTTP_X_RECRUITER_TOKEN')
-            if recruiter_token:
-                # Token validation will be done in recruiter_access app
-                from apps.recruiter_access.utils import validate_recruiter_token
-                return validate_recruiter_token(recruiter_token)
-            
-            return False
+            # Check for a valid recruiter token of the owner (validated once per request)
+            from apps.recruiter_access.utils import get_recruiter_context
+            return get_recruiter_context(request).grants_access_to(getattr(obj, 'user_id', None))
         
         return False
 
@@ -1,10 +1,97 @@
 """
 Base serializers for the application
 """
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 
 
-class BaseSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """
+    Let the client choose the fields of a read response:
+
+        GET /api/projects/?fields=id,title
+        GET /api/projects/?omit=description,challenges
+
+    Only applies to the top-level serializer (or the child of a top-level
+    list) of a GET request; unknown names are ignored. Nested serializers
+    and writes always use every field.
+
+    get_only_fields() tells which columns the selected fields read, so the
+    view can load only those (see apps.core.mixins.SparseFieldsetMixin).
+    Fields computed from model methods or properties declare their columns
+    in Meta.field_dependencies:
+
+        field_dependencies = {'duration_display': ['start_date', 'end_date']}
+    """
+
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+
+    def _get_query_names(self, request, param):
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        return {name.strip() for name in value.split(',') if name.strip()}
+
+    def _is_top_level(self):
+        if self.parent is None:
+            return True
+        return isinstance(self.parent, serializers.ListSerializer) and self.parent.parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS or not self._is_top_level():
+            return fields
+
+        selected = self._get_query_names(request, self.fields_query_param)
+        omitted = self._get_query_names(request, self.omit_query_param) or set()
+
+        for name in list(fields):
+            if (selected is not None and name not in selected) or name in omitted:
+                fields.pop(name)
+
+        return fields
+
+    def get_only_fields(self, annotations=()):
+        """
+        Return the model fields to load for the selected fields, or None
+        when they can't all be determined (the whole row is then loaded).
+
+        Args:
+            annotations: Names annotated on the queryset (no column needed)
+        """
+        model = self.Meta.model
+        dependencies = getattr(self.Meta, 'field_dependencies', {})
+        names = {model._meta.pk.name}
+
+        for field_name, field in self.fields.items():
+            if field_name in dependencies:
+                names.update(dependencies[field_name])
+                continue
+
+            if field.source == '*' or len(field.source_attrs) != 1:
+                return None
+
+            attr = field.source_attrs[0]
+            if attr in annotations:
+                continue
+
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                return None
+
+            # Many-to-many and reverse relations are read with their own query
+            if model_field.concrete and not model_field.many_to_many:
+                names.add(model_field.name)
+
+        return names
+
+
+class BaseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Base serializer with common configurations.
     """
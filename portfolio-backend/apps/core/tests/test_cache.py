@@ -0,0 +1,37 @@
+"""
+Tests for the public endpoint cache
+"""
+import uuid
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from apps.core.cache import _version_key
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_unknown_user_id_is_not_cached():
+    user_id = uuid.uuid4()
+
+    response = APIClient().get('/api/skills/public/', {'user_id': str(user_id)})
+
+    assert response.status_code == 200
+    assert response.data == []
+    assert cache.get(_version_key(user_id)) is None
+
+
+@pytest.mark.django_db
+def test_known_user_id_is_cached(user):
+    response = APIClient().get('/api/skills/public/', {'user_id': str(user.id).upper()})
+
+    assert response.status_code == 200
+    # Keys use the canonical form of the id, as invalidate_public_cache does
+    assert cache.get(_version_key(user.id)) is not None
@@ -0,0 +1,18 @@
+"""
+Tests for the explain_read_queries command
+"""
+import pytest
+from django.core.management import call_command
+
+from apps.accounts.models import User
+from apps.projects.models import Project
+
+
+@pytest.mark.django_db
+def test_list_queries_use_their_index(capsys):
+    call_command('explain_read_queries')
+
+    assert 'Toutes les requêtes de liste utilisent leur index' in capsys.readouterr().out
+    # The seeded dataset is rolled back
+    assert not User.objects.exists()
+    assert not Project.objects.exists()
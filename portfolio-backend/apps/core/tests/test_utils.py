@@ -0,0 +1,36 @@
+"""
+Tests for the core utility functions
+"""
+import pytest
+from django.db import transaction
+
+from apps.core.utils import on_commit_once
+
+
+@pytest.mark.django_db
+def test_on_commit_once_deduplicates(django_capture_on_commit_callbacks):
+    calls = []
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        on_commit_once('key', lambda: calls.append('first'))
+        on_commit_once('key', lambda: calls.append('second'))
+
+    assert len(callbacks) == 1
+    assert calls == ['first']
+
+
+@pytest.mark.django_db
+def test_on_commit_once_after_savepoint_rollback(django_capture_on_commit_callbacks):
+    calls = []
+    with django_capture_on_commit_callbacks(execute=True):
+        # Another callback stays queued across the rollback
+        on_commit_once('other', lambda: calls.append('other'))
+        try:
+            with transaction.atomic():
+                on_commit_once('key', lambda: calls.append('rolled back'))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        on_commit_once('key', lambda: calls.append('kept'))
+
+    assert calls == ['other', 'kept']
@@ -3,6 +3,7 @@ Utility functions for the core app
 """
 import os
 from datetime import datetime
+from django.db import transaction
 from django.utils.text import slugify
 
 
@@ -73,24 +74,46 @@ def validate_file_size(file, max_size_mb):
     return file.size <= max_size_bytes
 
 
-def get_allowed_visibilities(request):
+def get_allowed_visibilities(request, owner_id=None):
     """
     Return list of allowed visibilities based on request.
     Always includes PUBLIC.
-    Includes RECRUTEUR if a valid token is provided in 'access' query param.
-    """
-    from apps.core.enums import Visibility
+    Includes RECRUTEUR if a valid recruiter token of the owner is provided
+    ('access' query param or X-Recruiter-Token header).
     
-    visibilities = [Visibility.PUBLIC]
+    Args:
+        request: The request (its recruiter token is validated once per request)
+        owner_id: Owner of the content read (None: any owner)
+    """
+    # Import inside function to avoid circular imports
+    from apps.recruiter_access.utils import get_recruiter_context
     
-    token = request.query_params.get('access')
-    if token:
-        try:
-            # Import inside function to avoid circular imports
-            from apps.recruiter_access.utils import validate_recruiter_token
-            if validate_recruiter_token(token):
-                visibilities.append(Visibility.RECRUTEUR)
-        except ImportError:
-            pass
-            
-    return visibilities
\ No newline at end of file
+    return get_recruiter_context(request).get_visibilities(owner_id)
+
+
+def on_commit_once(key, func):
+    """
+    Run func once the current transaction commits, at most once per key.
+
+    Several calls with the same key inside one transaction (e.g. signals
+    fired by an import) only schedule a single callback. Outside of a
+    transaction, func runs immediately.
+
+    The pending callbacks are looked up in the connection's own queue, so
+    a callback dropped with a rolled back transaction or savepoint no
+    longer hides later calls with its key.
+
+    Args:
+        key: Hashable deduplication key
+        func: Callable without arguments
+    """
+    connection = transaction.get_connection()
+    for sids, callback, robust in connection.run_on_commit:
+        if getattr(callback, 'on_commit_key', None) == key:
+            return
+
+    def _run():
+        func()
+
+    _run.on_commit_key = key
+    transaction.on_commit(_run)
\ No newline at end of file
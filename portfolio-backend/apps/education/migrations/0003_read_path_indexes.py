@@ -0,0 +1,31 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0002_diploma_certification_is_published'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['user', 'display_order', '-issue_date'], name='certification_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['user', 'display_order', '-issue_date', 'visibility'], name='certification_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='diploma',
+            index=models.Index(fields=['user', 'display_order', '-end_date'], name='diploma_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='diploma',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['user', 'display_order', '-end_date', 'visibility'], name='diploma_public_idx'),
+        ),
+    ]
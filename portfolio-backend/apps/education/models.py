@@ -99,6 +99,16 @@ class Diploma(BaseModel, VisibilityMixin, OwnedModel):
         verbose_name_plural = 'Diplômes'
         ordering = ['display_order', '-end_date']
         db_table = 'education_diploma'
+        indexes = [
+            # Liste du propriétaire
+            models.Index(fields=['user', 'display_order', '-end_date'], name='diploma_owner_order_idx'),
+            # Sections publiques (seuls les éléments publiés y apparaissent)
+            models.Index(
+                fields=['user', 'display_order', '-end_date', 'visibility'],
+                name='diploma_public_idx',
+                condition=models.Q(is_published=True),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.institution}"
@@ -205,6 +215,16 @@ class Certification(BaseModel, VisibilityMixin, OwnedModel):
         verbose_name_plural = 'Certifications'
         ordering = ['display_order', '-issue_date']
         db_table = 'education_certification'
+        indexes = [
+            # Liste du propriétaire
+            models.Index(fields=['user', 'display_order', '-issue_date'], name='certification_owner_order_idx'),
+            # Sections publiques (seuls les éléments publiés y apparaissent)
+            models.Index(
+                fields=['user', 'display_order', '-issue_date', 'visibility'],
+                name='certification_public_idx',
+                condition=models.Q(is_published=True),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.organization}"
@@ -35,6 +35,9 @@ class DiplomaSerializer(BaseSerializer):
             'created_at',
             'updated_at',
         ]
+        field_dependencies = {
+            'duration_display': ['start_date', 'end_date'],
+        }
         read_only_fields = ['id', 'created_at', 'updated_at', 'duration_display']
     
     def validate(self, attrs):
@@ -178,6 +181,11 @@ class CertificationSerializer(BaseSerializer):
             'created_at',
             'updated_at',
         ]
+        field_dependencies = {
+            'is_expired': ['does_not_expire', 'expiration_date'],
+            'status': ['does_not_expire', 'expiration_date'],
+            'skills_list': ['skills_acquired'],
+        }
         read_only_fields = [
             'id',
             'created_at',
@@ -8,6 +8,9 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
+from apps.core.cache import cached_public_action
+from apps.core.mixins import ReorderMixin, SparseFieldsetMixin
+from apps.core.pagination import OptionalCursorPagination
 from apps.core.permissions import IsOwner, VisibilityPermission
 from apps.core.enums import Visibility
 from apps.core.utils import get_allowed_visibilities
@@ -51,7 +54,7 @@ from .serializers import (
         ]
     )
 )
-class DiplomaViewSet(viewsets.ModelViewSet):
+class DiplomaViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing diplomas.
     
@@ -63,7 +66,10 @@ class DiplomaViewSet(viewsets.ModelViewSet):
     - DELETE /api/education/diplomas/{id}/ - Delete diploma
     - GET /api/education/diplomas/public/ - List public diplomas
     """
+    reorder_key = 'diplomas'
+    reorder_required_message = 'Liste de diplômes requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         """Return diplomas for the authenticated user."""
@@ -80,6 +86,7 @@ class DiplomaViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('diplomas.public')
     def public(self, request):
         """
         Get all public diplomas for a specific user.
@@ -97,41 +104,13 @@ class DiplomaViewSet(viewsets.ModelViewSet):
         
         diplomas = Diploma.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
         ).order_by('display_order', '-end_date')
         
         serializer = DiplomaPublicSerializer(diplomas, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """
-        Reorder diplomas.
-        
-        Body: { "diplomas": [{"id": "uuid", "display_order": 0}, ...] }
-        """
-        diplomas_data = request.data.get('diplomas', [])
-        
-        if not diplomas_data:
-            return Response(
-                {'error': 'Liste de diplômes requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in diplomas_data:
-            diploma_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                diploma = Diploma.objects.get(id=diploma_id, user=request.user)
-                diploma.display_order = display_order
-                diploma.save(update_fields=['display_order'])
-            except Diploma.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Diploma ID')
@@ -179,7 +158,7 @@ class DiplomaViewSet(viewsets.ModelViewSet):
         ]
     )
 )
-class CertificationViewSet(viewsets.ModelViewSet):
+class CertificationViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing certifications.
     
@@ -192,7 +171,10 @@ class CertificationViewSet(viewsets.ModelViewSet):
     - GET /api/education/certifications/public/ - List public certifications
     - POST /api/education/certifications/{id}/toggle_publish/ - Toggle publish status of a certification
     """
+    reorder_key = 'certifications'
+    reorder_required_message = 'Liste de certifications requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         """Return certifications for the authenticated user."""
@@ -209,6 +191,7 @@ class CertificationViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('certifications.public')
     def public(self, request):
         """
         Get all public certifications for a specific user.
@@ -226,41 +209,13 @@ class CertificationViewSet(viewsets.ModelViewSet):
         
         certifications = Certification.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
         ).order_by('display_order', '-issue_date')
         
         serializer = CertificationPublicSerializer(certifications, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """
-        Reorder certifications.
-        
-        Body: { "certifications": [{"id": "uuid", "display_order": 0}, ...] }
-        """
-        certifications_data = request.data.get('certifications', [])
-        
-        if not certifications_data:
-            return Response(
-                {'error': 'Liste de certifications requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in certifications_data:
-            cert_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                cert = Certification.objects.get(id=cert_id, user=request.user)
-                cert.display_order = display_order
-                cert.save(update_fields=['display_order'])
-            except Certification.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Certification ID')
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professional', '0002_experience_training_is_published'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['user', 'display_order', '-start_date'], name='experience_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['user', 'display_order', '-start_date', 'visibility'], name='experience_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='training',
+            index=models.Index(fields=['user', 'display_order', '-start_date'], name='training_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='training',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['user', 'display_order', '-start_date', 'visibility'], name='training_public_idx'),
+        ),
+    ]
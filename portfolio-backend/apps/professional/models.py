@@ -115,6 +115,16 @@ class Experience(BaseModel, VisibilityMixin, OwnedModel):
         verbose_name_plural = 'Expériences professionnelles'
         ordering = ['display_order', '-start_date']
         db_table = 'professional_experience'
+        indexes = [
+            # Liste du propriétaire
+            models.Index(fields=['user', 'display_order', '-start_date'], name='experience_owner_order_idx'),
+            # Sections publiques (seuls les éléments publiés y apparaissent)
+            models.Index(
+                fields=['user', 'display_order', '-start_date', 'visibility'],
+                name='experience_public_idx',
+                condition=models.Q(is_published=True),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.position} - {self.company}"
@@ -260,6 +270,16 @@ class Training(BaseModel, VisibilityMixin, OwnedModel):
         verbose_name_plural = 'Formations complémentaires'
         ordering = ['display_order', '-start_date']
         db_table = 'professional_training'
+        indexes = [
+            # Liste du propriétaire
+            models.Index(fields=['user', 'display_order', '-start_date'], name='training_owner_order_idx'),
+            # Sections publiques (seuls les éléments publiés y apparaissent)
+            models.Index(
+                fields=['user', 'display_order', '-start_date', 'visibility'],
+                name='training_public_idx',
+                condition=models.Q(is_published=True),
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.organization}"
@@ -43,6 +43,12 @@ class ExperienceSerializer(BaseSerializer):
             'created_at',
             'updated_at',
         ]
+        field_dependencies = {
+            'duration_display': ['start_date', 'end_date', 'is_current'],
+            'missions_list': ['missions'],
+            'achievements_list': ['achievements'],
+            'technologies_list': ['technologies'],
+        }
         read_only_fields = [
             'id',
             'created_at',
@@ -235,6 +241,10 @@ class TrainingSerializer(BaseSerializer):
             'created_at',
             'updated_at',
         ]
+        field_dependencies = {
+            'duration_display': ['start_date', 'end_date', 'is_ongoing'],
+            'skills_list': ['skills_acquired'],
+        }
         read_only_fields = [
             'id',
             'created_at',
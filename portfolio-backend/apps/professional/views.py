@@ -8,6 +8,9 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
+from apps.core.cache import cached_public_action
+from apps.core.mixins import ReorderMixin, SparseFieldsetMixin
+from apps.core.pagination import OptionalCursorPagination
 from apps.core.permissions import IsOwner
 from apps.core.enums import Visibility
 from apps.core.utils import get_allowed_visibilities
@@ -51,7 +54,7 @@ from .serializers import (
         ]
     )
 )
-class ExperienceViewSet(viewsets.ModelViewSet):
+class ExperienceViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing professional experiences.
     
@@ -63,7 +66,10 @@ class ExperienceViewSet(viewsets.ModelViewSet):
     - DELETE /api/professional/experiences/{id}/ - Delete experience
     - GET /api/professional/experiences/public/ - List public experiences
     """
+    reorder_key = 'experiences'
+    reorder_required_message = 'Liste d\'expériences requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         """Return experiences for the authenticated user."""
@@ -80,6 +86,7 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('experiences.public')
     def public(self, request):
         """
         Get all public experiences for a specific user.
@@ -97,41 +104,13 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         
         experiences = Experience.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
         ).order_by('display_order', '-start_date')
         
         serializer = ExperiencePublicSerializer(experiences, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """
-        Reorder experiences.
-        
-        Body: { "experiences": [{"id": "uuid", "display_order": 0}, ...] }
-        """
-        experiences_data = request.data.get('experiences', [])
-        
-        if not experiences_data:
-            return Response(
-                {'error': 'Liste d\'expériences requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in experiences_data:
-            exp_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                exp = Experience.objects.get(id=exp_id, user=request.user)
-                exp.display_order = display_order
-                exp.save(update_fields=['display_order'])
-            except Experience.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Experience ID')
@@ -179,7 +158,7 @@ class ExperienceViewSet(viewsets.ModelViewSet):
         ]
     )
 )
-class TrainingViewSet(viewsets.ModelViewSet):
+class TrainingViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing training/formations.
     
@@ -192,7 +171,10 @@ class TrainingViewSet(viewsets.ModelViewSet):
     - GET /api/professional/trainings/public/ - List public trainings
     - POST /api/professional/trainings/{id}/toggle_publish/ - Toggle publish status
     """
+    reorder_key = 'trainings'
+    reorder_required_message = 'Liste de formations requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         """Return trainings for the authenticated user."""
@@ -209,6 +191,7 @@ class TrainingViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('trainings.public')
     def public(self, request):
         """
         Get all public trainings for a specific user.
@@ -226,41 +209,13 @@ class TrainingViewSet(viewsets.ModelViewSet):
         
         trainings = Training.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
         ).order_by('display_order', '-start_date')
         
         serializer = TrainingPublicSerializer(trainings, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """
-        Reorder trainings.
-        
-        Body: { "trainings": [{"id": "uuid", "display_order": 0}, ...] }
-        """
-        trainings_data = request.data.get('trainings', [])
-        
-        if not trainings_data:
-            return Response(
-                {'error': 'Liste de formations requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in trainings_data:
-            training_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                training = Training.objects.get(id=training_id, user=request.user)
-                training.display_order = display_order
-                training.save(update_fields=['display_order'])
-            except Training.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Training ID')
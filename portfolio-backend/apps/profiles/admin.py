@@ -5,7 +5,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 
 from apps.core.admin import BaseModelAdmin
-from .models import Profile
+from .models import Profile, ImportJob
 
 
 @admin.register(Profile)
@@ -119,4 +119,18 @@ class ProfileAdmin(BaseModelAdmin):
                 obj.photo.url
             )
         return 'Aucune photo'
-    photo_preview_large.short_description = 'Aperçu de la photo'
\ No newline at end of file
+    photo_preview_large.short_description = 'Aperçu de la photo'
+
+@admin.register(ImportJob)
+class ImportJobAdmin(BaseModelAdmin):
+    """
+    Admin interface for queued portfolio imports.
+    """
+    list_display = ['user', 'import_mode', 'status', 'processed_items', 'total_items', 'created_at', 'finished_at']
+    list_filter = ['status', 'import_mode', 'created_at']
+    search_fields = ['user__email']
+    exclude = ['payload']
+    readonly_fields = [
+        'id', 'user', 'import_mode', 'status', 'total_items', 'processed_items',
+        'result', 'error', 'started_at', 'finished_at', 'created_at', 'updated_at'
+    ]
@@ -0,0 +1,230 @@
+"""
+Streamed ZIP archive of a portfolio: the JSON export, a proofs manifest
+and every proof file (optionally the profile photo and project covers).
+
+Members are stored uncompressed (the files are mostly images, videos and
+PDFs) and written to a non-seekable sink, which zipfile supports with
+data descriptors: each file is read from storage in chunks and the bytes
+are yielded as soon as they are written, so neither the archive nor a
+whole file is ever staged in memory or on disk. Without compression the
+archive size only depends on the member names and sizes, so it is known
+before the first byte is sent (Proof.file_size for proofs). A file
+missing from storage or whose size no longer matches is padded with
+zeros or cut to the announced size, and logged as an error, so the
+archive always has the size announced.
+"""
+import json
+import logging
+import os
+import zipfile
+
+from django.utils import timezone
+
+from apps.projects.models import Project
+from apps.proofs.models import Proof
+
+from .exporter import iter_export_json
+
+logger = logging.getLogger(__name__)
+
+
+# Bytes read from storage at a time
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+# Bytes zipfile adds around a stored member written to a non-seekable
+# stream: local header (30) + data descriptor (16) + central directory
+# entry (46), plus the name twice; and the end of central directory record
+MEMBER_OVERHEAD = 30 + 16 + 46
+END_RECORD_SIZE = 22
+
+
+class ArchiveEntry:
+    """
+    One member of the archive: generated bytes or a stored file.
+    """
+
+    def __init__(self, name, size, data=None, field_file=None):
+        self.name = name
+        self.size = size
+        self.data = data
+        self.field_file = field_file
+
+    def chunks(self):
+        """Yield the member content."""
+        if self.data is not None:
+            yield self.data
+            return
+
+        self.field_file.open('rb')
+        try:
+            yield from self.field_file.chunks(chunk_size=ARCHIVE_CHUNK_SIZE)
+        finally:
+            self.field_file.close()
+
+
+class _ArchiveSink:
+    """Write-only, non-seekable file collecting what zipfile writes."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _basename(name):
+    return os.path.basename(name or '') or 'fichier'
+
+
+def _proof_path(proof):
+    return f"proofs/{proof.content_type.app_label}.{proof.content_type.model}/{proof.object_id}/{proof.pk}-{_basename(proof.file.name)}"
+
+
+def _stored_size(field_file):
+    """Size of a file in storage, or None if it is missing."""
+    try:
+        return field_file.size
+    except OSError:
+        logger.warning("Fichier introuvable pour l'archive: %s", field_file.name)
+        return None
+
+
+def get_archive_entries(user, include_media=False):
+    """
+    List the members of a user's archive, with their sizes.
+
+    The JSON documents are built here (they are small next to the files);
+    the files are only read when the archive is streamed.
+
+    Args:
+        user: Owner of the portfolio
+        include_media: Also add the profile photo and the project covers
+    """
+    proofs = list(
+        Proof.objects.filter(user=user).exclude(file='')
+        .select_related('content_type')
+        .order_by('content_type_id', 'object_id', 'display_order', 'created_at')
+    )
+
+    manifest = [
+        {
+            'id': str(proof.pk),
+            'content_type': f"{proof.content_type.app_label}.{proof.content_type.model}",
+            'object_id': str(proof.object_id),
+            'title': proof.title,
+            'description': proof.description,
+            'proof_type': proof.proof_type,
+            'visibility': proof.visibility,
+            'display_order': proof.display_order,
+            'file_name': proof.file_name,
+            'mime_type': proof.mime_type,
+            'file_size': proof.file_size,
+            'path': _proof_path(proof),
+        }
+        for proof in proofs
+    ]
+
+    export = b''.join(iter_export_json(user))
+    manifest_data = json.dumps(manifest, ensure_ascii=False, indent=2).encode()
+
+    entries = [
+        ArchiveEntry('portfolio.json', len(export), data=export),
+        ArchiveEntry('proofs.json', len(manifest_data), data=manifest_data),
+    ]
+
+    for proof in proofs:
+        size = proof.file_size if proof.file_size is not None else _stored_size(proof.file)
+        entries.append(ArchiveEntry(_proof_path(proof), size or 0, field_file=proof.file))
+
+    if include_media:
+        media = []
+        if user.profile.photo:
+            media.append((f"media/profile/{_basename(user.profile.photo.name)}", user.profile.photo))
+
+        for project in Project.objects.filter(user=user).exclude(cover_image='').only('id', 'cover_image'):
+            media.append((f"media/projects/{project.pk}-{_basename(project.cover_image.name)}", project.cover_image))
+
+        for name, field_file in media:
+            size = _stored_size(field_file)
+            if size is not None:
+                entries.append(ArchiveEntry(name, size, field_file=field_file))
+
+    return entries
+
+
+def get_archive_size(entries):
+    """
+    Exact size of the archive of these entries, in bytes.
+
+    Returns None when the archive would need ZIP64 records (members or
+    offsets above 4 GiB, or more than 65535 members).
+    """
+    size = END_RECORD_SIZE
+    for entry in entries:
+        size += MEMBER_OVERHEAD + 2 * len(entry.name.encode('utf-8')) + entry.size
+
+    if size * 1.05 > zipfile.ZIP64_LIMIT or len(entries) >= zipfile.ZIP_FILECOUNT_LIMIT:
+        return None
+    return size
+
+
+def _iter_member_chunks(entry):
+    """
+    Yield the content of a member, exactly `entry.size` bytes long.
+
+    The size was announced before streaming: a file missing from storage
+    or shorter than announced is padded with zeros, a longer one is cut.
+    """
+    remaining = entry.size
+    chunks = entry.chunks()
+    try:
+        for chunk in chunks:
+            if len(chunk) > remaining:
+                logger.error("Fichier plus long qu'annoncé, tronqué dans l'archive: %s", entry.name)
+                chunk = chunk[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+            if not remaining:
+                break
+        else:
+            if remaining:
+                logger.error("Fichier plus court qu'annoncé, complété dans l'archive: %s", entry.name)
+    except OSError:
+        logger.error("Fichier illisible, remplacé par des zéros dans l'archive: %s", entry.name, exc_info=True)
+    finally:
+        chunks.close()
+
+    while remaining:
+        padding = min(remaining, ARCHIVE_CHUNK_SIZE)
+        remaining -= padding
+        yield bytes(padding)
+
+
+def iter_archive(entries):
+    """Yield the ZIP archive of these entries, chunk by chunk."""
+    sink = _ArchiveSink()
+    date_time = timezone.localtime().timetuple()[:6]
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for entry in entries:
+            zinfo = zipfile.ZipInfo(entry.name, date_time=date_time)
+            zinfo.file_size = entry.size
+
+            with archive.open(zinfo, 'w') as member:
+                yield sink.pop()
+                for chunk in _iter_member_chunks(entry):
+                    member.write(chunk)
+                    yield sink.pop()
+
+        yield sink.pop()
+
+    yield sink.pop()
@@ -0,0 +1,73 @@
+"""
+Write-behind profile view counter.
+
+Public profile reads only add to an in-memory buffer (one per worker
+process). A background thread flushes it every PROFILE_VIEWS_FLUSH_INTERVAL
+seconds with atomic F() updates, one UPDATE per distinct increment, so hot
+portfolios no longer serialize on a row lock and no increment is lost.
+"""
+import logging
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from apps.core.buffers import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileViewCounter(WriteBehindBuffer):
+    """
+    Buffer of pending profile view increments for the current process.
+    """
+
+    thread_name = 'profile-view-counter'
+
+    def __init__(self):
+        super().__init__(lambda: settings.PROFILE_VIEWS_FLUSH_INTERVAL)
+        self._counts = Counter()
+
+    def add(self, profile_id, count=1):
+        """Buffer `count` views of a profile (no database access)."""
+        with self._lock:
+            self._counts[profile_id] += count
+            self._ensure_flusher()
+
+    def flush(self):
+        """
+        Write the buffered views to the database.
+
+        Returns:
+            int: Number of views written
+        """
+        from .models import Profile
+
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+
+        if not counts:
+            return 0
+
+        ids_by_increment = defaultdict(list)
+        for profile_id, count in counts.items():
+            ids_by_increment[count].append(profile_id)
+
+        try:
+            with transaction.atomic():
+                for increment, profile_ids in ids_by_increment.items():
+                    Profile.objects.filter(pk__in=profile_ids).update(
+                        profile_views=F('profile_views') + increment
+                    )
+        except DatabaseError:
+            # Keep the views for the next flush
+            with self._lock:
+                self._counts.update(counts)
+            logger.exception("Échec de l'écriture des vues de profil")
+            return 0
+
+        return sum(counts.values())
+
+
+profile_view_counter = ProfileViewCounter()
@@ -0,0 +1,163 @@
+"""
+Portfolio export (schema_version 1, read back by apps.profiles.importer).
+
+Besides the buffered JSON document, the export can be streamed: the
+sections are read with queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+and encoded one record at a time, so memory stays flat whatever the
+portfolio size. Two streamed formats are available:
+
+- json: the same document as the buffered export, byte for byte parsable
+  by the importer
+- ndjson: one JSON object per line: a header line
+  {"schema_version": 1, "exported_at": ...}, then one
+  {"section": <name>, "record": {...}} line per record (the profile
+  included). read_ndjson_export() turns it back into the document.
+"""
+import json
+
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.projects.models import Project
+from apps.projects.serializers import ProjectSerializer
+from apps.education.models import Diploma, Certification
+from apps.education.serializers import DiplomaSerializer, CertificationSerializer
+from apps.professional.models import Experience, Training
+from apps.professional.serializers import ExperienceSerializer, TrainingSerializer
+from apps.skills.models import Skill
+from apps.skills.serializers import SkillSerializer
+from apps.skills.utils import with_justifications
+
+from .importer import SCHEMA_VERSION
+from .serializers import ProfileSerializer
+
+
+# Rows fetched per database round trip while streaming
+EXPORT_CHUNK_SIZE = 200
+
+# (section, model, serializer), in export order
+EXPORT_SECTIONS = [
+    ('projects', Project, ProjectSerializer),
+    ('skills', Skill, SkillSerializer),
+    ('diplomas', Diploma, DiplomaSerializer),
+    ('certifications', Certification, CertificationSerializer),
+    ('experiences', Experience, ExperienceSerializer),
+    ('trainings', Training, TrainingSerializer),
+]
+
+
+class ExportFormatError(ValueError):
+    """Unreadable NDJSON export."""
+
+
+def _encode(data):
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False)
+
+
+def get_section_queryset(user, model):
+    """Items of a section, in display order (model Meta.ordering)."""
+    queryset = model.objects.filter(user=user)
+    if model is Skill:
+        queryset = with_justifications(queryset)
+    return queryset
+
+
+def iter_section(user, model, serializer_class):
+    """Yield the serialized items of a section, one chunk of rows at a time."""
+    serializer = serializer_class()
+    queryset = get_section_queryset(user, model)
+    for obj in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield serializer.to_representation(obj)
+
+
+def build_export(user):
+    """Return the whole export document (buffered)."""
+    export = {
+        'schema_version': SCHEMA_VERSION,
+        'exported_at': timezone.now().isoformat(),
+        'profile': ProfileSerializer(user.profile).data,
+    }
+    for section, model, serializer_class in EXPORT_SECTIONS:
+        export[section] = serializer_class(get_section_queryset(user, model), many=True).data
+    return export
+
+
+def iter_export_json(user):
+    """Yield the export document as encoded JSON chunks."""
+    header = {
+        'schema_version': SCHEMA_VERSION,
+        'exported_at': timezone.now().isoformat(),
+        'profile': ProfileSerializer(user.profile).data,
+    }
+    # Reopen the header object to append the sections
+    yield _encode(header)[:-1].encode()
+
+    for section, model, serializer_class in EXPORT_SECTIONS:
+        yield f', {_encode(section)}: ['.encode()
+        separator = ''
+        for record in iter_section(user, model, serializer_class):
+            yield (separator + _encode(record)).encode()
+            separator = ', '
+        yield b']'
+
+    yield b'}\n'
+
+
+def iter_export_ndjson(user):
+    """Yield the export as NDJSON lines."""
+    yield (_encode({
+        'schema_version': SCHEMA_VERSION,
+        'exported_at': timezone.now().isoformat(),
+    }) + '\n').encode()
+
+    yield (_encode({'section': 'profile', 'record': ProfileSerializer(user.profile).data}) + '\n').encode()
+
+    for section, model, serializer_class in EXPORT_SECTIONS:
+        for record in iter_section(user, model, serializer_class):
+            yield (_encode({'section': section, 'record': record}) + '\n').encode()
+
+
+def read_ndjson_export(lines):
+    """
+    Rebuild the export document from NDJSON lines.
+
+    Args:
+        lines: Iterable of str or bytes lines
+
+    Raises:
+        ExportFormatError: If a line isn't valid JSON or has no section
+    """
+    sections = [section for section, model, serializer_class in EXPORT_SECTIONS]
+    export = {section: [] for section in sections}
+    header_read = False
+
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError:
+            raise ExportFormatError(f"Ligne {number}: JSON invalide")
+
+        if not header_read:
+            if not isinstance(data, dict) or 'schema_version' not in data:
+                raise ExportFormatError("La première ligne doit contenir schema_version")
+            export.update(data)
+            header_read = True
+            continue
+
+        section = data.get('section') if isinstance(data, dict) else None
+        if section == 'profile':
+            export['profile'] = data.get('record') or {}
+        elif section in sections:
+            export[section].append(data.get('record') or {})
+        else:
+            raise ExportFormatError(f"Ligne {number}: section inconnue")
+
+    if not header_read:
+        raise ExportFormatError("Export vide")
+
+    return export
@@ -0,0 +1,478 @@
+"""
+Portfolio import engine (payloads produced by PortfolioExportView).
+
+The stored rows of each section are read with one query and compared
+with the incoming records (fingerprint of the provided fields); new and
+changed rows are then written with bulk_create(update_conflicts=True).
+Skill links are diffed the same way, one read and one bulk insert per
+M2M table, so an import runs a bounded number of queries whatever the
+payload size, and writes nothing for unchanged records.
+"""
+import datetime
+import hashlib
+import json
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+
+import slugify
+from django.db import transaction
+from django.db.models import Q
+
+from apps.projects.models import Project
+from apps.education.models import Diploma, Certification
+from apps.professional.models import Experience, Training
+from apps.skills.models import Skill
+
+from .models import Profile
+from .signals import refresh_public_portfolio
+from .slugs import build_base_slug, next_free_slug, write_with_free_slug
+
+
+SCHEMA_VERSION = 1
+
+IMPORT_MODES = ('merge', 'replace')
+
+# Rows per INSERT statement
+BULK_BATCH_SIZE = 500
+
+PROFILE_ALLOWED = [
+    'portfolio_slug',
+    'professional_title',
+    'bio',
+    'tagline',
+    'professional_email',
+    'phone',
+    'location',
+    'website_url',
+    'github_url',
+    'linkedin_url',
+    'twitter_url',
+    'availability',
+    'availability_date',
+    'show_email',
+    'show_phone',
+    'show_location',
+    'public_template',
+    'empty_about_text',
+    'empty_skills_text',
+    'empty_experience_text',
+    'empty_projects_text',
+    'empty_education_text',
+    'trait_1_title', 'trait_1_description',
+    'trait_2_title', 'trait_2_description',
+    'trait_3_title', 'trait_3_description',
+]
+
+PROJECT_ALLOWED = [
+    'title', 'short_description', 'description', 'project_type', 'status',
+    'role', 'team_size', 'organization', 'start_date', 'end_date',
+    'technologies', 'key_features', 'challenges', 'solutions',
+    'achievements', 'learning_outcomes',
+    'github_url', 'demo_url', 'video_url', 'documentation_url',
+    'is_featured', 'is_published', 'visibility', 'display_order',
+]
+
+DIPLOMA_ALLOWED = [
+    'title', 'institution', 'level', 'field',
+    'start_date', 'end_date',
+    'honors', 'description', 'grade',
+    'visibility', 'display_order', 'is_published',
+]
+
+CERTIFICATION_ALLOWED = [
+    'name', 'organization', 'platform',
+    'issue_date', 'expiration_date', 'does_not_expire',
+    'credential_id', 'credential_url',
+    'description', 'skills_acquired',
+    'visibility', 'display_order', 'is_published',
+]
+
+EXPERIENCE_ALLOWED = [
+    'position', 'company', 'company_url', 'location',
+    'experience_type', 'start_date', 'end_date', 'is_current',
+    'description', 'missions', 'achievements', 'technologies',
+    'visibility', 'display_order', 'is_published',
+]
+
+TRAINING_ALLOWED = [
+    'title', 'organization', 'training_type', 'url',
+    'start_date', 'end_date', 'is_ongoing', 'duration_hours',
+    'description', 'skills_acquired',
+    'has_certificate', 'certificate_url',
+    'visibility', 'display_order', 'is_published',
+]
+
+SKILL_ALLOWED = [
+    'name', 'category', 'level', 'description', 'years_of_experience',
+    'is_primary', 'display_order',
+]
+
+# (payload key, model, allowed fields, date fields parsed before saving)
+# Skills come last: their links point to the other sections.
+SECTIONS = [
+    ('projects', Project, PROJECT_ALLOWED, []),
+    ('diplomas', Diploma, DIPLOMA_ALLOWED, []),
+    ('certifications', Certification, CERTIFICATION_ALLOWED, ['issue_date', 'expiration_date']),
+    ('experiences', Experience, EXPERIENCE_ALLOWED, []),
+    ('trainings', Training, TRAINING_ALLOWED, []),
+    ('skills', Skill, SKILL_ALLOWED, []),
+]
+
+# (Skill M2M field, related model)
+SKILL_RELATIONS = [
+    ('related_projects', Project),
+    ('related_certifications', Certification),
+    ('related_trainings', Training),
+]
+
+
+class PortfolioImportError(Exception):
+    """Invalid import request (mode or schema version)."""
+
+
+def _pick(data, allowed):
+    return {k: data.get(k) for k in allowed if k in data}
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _parse_uuid(value):
+    if not value:
+        return None
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def validate_import(payload, import_mode):
+    """
+    Check the import mode and the payload schema version.
+
+    Raises:
+        PortfolioImportError: With the message to show to the user
+    """
+    if import_mode not in IMPORT_MODES:
+        raise PortfolioImportError('import_mode invalide (valeurs: merge, replace)')
+
+    if payload.get('schema_version') != SCHEMA_VERSION:
+        raise PortfolioImportError('schema_version invalide ou non supporté')
+
+
+def _normalize(field, value):
+    """Bring an incoming or stored value to a comparable form."""
+    if value is None:
+        return None
+    value = field.to_python(value)
+    if isinstance(value, Decimal):
+        # 2, 2.0 and 2.00 are the same stored value
+        value = value.normalize()
+    return value
+
+
+def fingerprint(model, values, field_names):
+    """
+    Fingerprint of a record over some fields.
+
+    Args:
+        model: Model of the record
+        values: Field values (incoming payload item or stored row)
+        field_names: Fields covered by the fingerprint
+    """
+    normalized = [
+        [name, _normalize(model._meta.get_field(name), values.get(name))]
+        for name in sorted(field_names)
+    ]
+    encoded = json.dumps(normalized, default=str, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode()).hexdigest()
+
+
+def _plan_section(user, model, items, allowed, date_fields, import_mode):
+    """
+    Compare the items of one section with the stored rows.
+
+    Ids belonging to another user are never touched: those items are
+    imported as new rows. Skills without a known id are matched by name
+    (unique per user), other items without id by fingerprint. Only the
+    fields provided by an item are compared and written.
+
+    Returns:
+        dict: stored_ids (aligned with items), id_map ({incoming id:
+        stored id}), writes ({field names: {id: instance}}), delete_ids
+        and counts
+    """
+    incoming_ids = [_parse_uuid(item.get('id')) for item in items]
+
+    # One query: the stored rows matching incoming ids, plus every row of
+    # the user when they can be matched otherwise (skill names, items
+    # without id, replace mode)
+    scope = Q(pk__in=[item_id for item_id in incoming_ids if item_id])
+    if model is Skill or import_mode == 'replace' or None in incoming_ids:
+        scope |= Q(user=user)
+    stored_rows = {row['id']: row for row in model.objects.filter(scope).values('id', 'user_id', *allowed)}
+
+    owned_rows = {pk: row for pk, row in stored_rows.items() if row['user_id'] == user.id}
+    existing_by_name = {}
+    if model is Skill:
+        existing_by_name = {row['name']: pk for pk, row in owned_rows.items()}
+
+    # Items without id are matched with an identical stored row that no
+    # other item references, so syncing them again doesn't duplicate them
+    unclaimed_ids = set(owned_rows) - set(incoming_ids)
+    fingerprint_index = {}
+
+    def claim_identical_row(fields):
+        field_names = frozenset(fields)
+        if field_names not in fingerprint_index:
+            index = defaultdict(list)
+            for pk in unclaimed_ids:
+                index[fingerprint(model, owned_rows[pk], field_names)].append(pk)
+            fingerprint_index[field_names] = index
+
+        for pk in fingerprint_index[field_names].get(fingerprint(model, fields, field_names), []):
+            if pk in unclaimed_ids:
+                unclaimed_ids.discard(pk)
+                return pk
+        return None
+
+    writes = defaultdict(dict)
+    stored_ids = []
+    id_map = {}
+    counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+
+    for item, item_id in zip(items, incoming_ids):
+        fields = _pick(item, allowed)
+        for name in date_fields:
+            if name in fields:
+                fields[name] = _parse_date(fields[name])
+
+        target_id = item_id
+        if target_id is not None and target_id in stored_rows and target_id not in owned_rows:
+            target_id = None
+        if target_id is None and fields.get('name') in existing_by_name:
+            target_id = existing_by_name[fields['name']]
+            unclaimed_ids.discard(target_id)
+        if target_id is None and fields:
+            target_id = claim_identical_row(fields)
+        if target_id is None:
+            target_id = uuid.uuid4()
+
+        stored_ids.append(target_id)
+        if item_id is not None:
+            id_map[item_id] = target_id
+
+        row = owned_rows.get(target_id)
+        if row is None:
+            counts['created'] += 1
+        elif fingerprint(model, fields, fields) == fingerprint(model, row, fields):
+            counts['unchanged'] += 1
+            continue
+        else:
+            counts['updated'] += 1
+
+        # Items providing the same fields are upserted together (one statement per batch)
+        writes[frozenset(fields)][target_id] = model(id=target_id, user=user, **fields)
+
+    delete_ids = []
+    if import_mode == 'replace':
+        kept_ids = set(stored_ids)
+        delete_ids = [pk for pk in owned_rows if pk not in kept_ids]
+        counts['deleted'] = len(delete_ids)
+
+    return {
+        'stored_ids': stored_ids,
+        'id_map': id_map,
+        'writes': writes,
+        'delete_ids': delete_ids,
+        'counts': counts,
+    }
+
+
+def _apply_section(model, plan):
+    """Write the new and changed rows of a section, delete the missing ones."""
+    if plan['delete_ids']:
+        model.objects.filter(pk__in=plan['delete_ids']).delete()
+
+    for field_names, objects in plan['writes'].items():
+        model.objects.bulk_create(
+            list(objects.values()),
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=sorted(field_names) + ['updated_at'],
+        )
+
+
+def _sync_skill_relations(user, skill_items, skill_ids, id_maps, dry_run=False):
+    """
+    Bring the links of the imported skills to the payload (like
+    related_*.set()), writing only the links that changed.
+
+    One read, one delete and one bulk insert per M2M table; links to items
+    the user doesn't own are dropped.
+
+    Returns:
+        dict: Number of links added and removed
+    """
+    counts = {'added': 0, 'removed': 0}
+
+    for relation, related_model in SKILL_RELATIONS:
+        field = Skill._meta.get_field(relation)
+        through = field.remote_field.through
+        related_column = f"{field.m2m_reverse_field_name()}_id"
+        id_map = id_maps.get(related_model, {})
+
+        wanted = {}
+        for item, skill_id in zip(skill_items, skill_ids):
+            related_ids = {_parse_uuid(value) for value in item.get(relation) or []}
+            wanted[skill_id] = {id_map.get(value, value) for value in related_ids if value}
+
+        all_related_ids = set().union(*wanted.values()) if wanted else set()
+        owned_ids = set(related_model.objects.filter(
+            user=user,
+            pk__in=all_related_ids
+        ).values_list('pk', flat=True)) if all_related_ids else set()
+
+        wanted_links = {
+            (skill_id, related_id)
+            for skill_id, related_ids in wanted.items()
+            for related_id in related_ids
+            if related_id in owned_ids
+        }
+        current_links = {
+            (row['skill_id'], row[related_column]): row['pk']
+            for row in through.objects.filter(skill_id__in=list(wanted)).values('pk', 'skill_id', related_column)
+        } if wanted else {}
+
+        removed = [pk for link, pk in current_links.items() if link not in wanted_links]
+        added = [link for link in wanted_links if link not in current_links]
+        counts['removed'] += len(removed)
+        counts['added'] += len(added)
+
+        if dry_run:
+            continue
+
+        if removed:
+            through.objects.filter(pk__in=removed).delete()
+        through.objects.bulk_create(
+            [through(skill_id=skill_id, **{related_column: related_id}) for skill_id, related_id in added],
+            batch_size=BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    return counts
+
+
+def count_import_items(payload):
+    """Return the number of section items in a payload."""
+    return sum(len(payload.get(key) or []) for key, model, allowed, date_fields in SECTIONS)
+
+
+def import_portfolio(user, payload, import_mode='merge', progress=None, dry_run=False):
+    """
+    Import a portfolio payload (schema_version 1) for a user.
+
+    Every incoming record is compared with the stored row (fingerprint of
+    the fields it provides): only new and changed rows are written, so a
+    repeated sync of the same payload writes nothing and keeps the public
+    caches.
+
+    Args:
+        user: Owner of the imported content
+        payload: Exported portfolio (dict)
+        import_mode: 'merge' (create or update) or 'replace' (also delete
+            the stored items missing from the payload)
+        progress: Optional callable, called with the number of items
+            imported so far after each section
+        dry_run: Compute the diff without writing anything
+
+    Returns:
+        dict: {section: {'created', 'updated', 'unchanged', 'deleted'}},
+        plus 'profile' ({'updated', 'unchanged'}) and 'skill_links'
+        ({'added', 'removed'})
+
+    Raises:
+        PortfolioImportError: If the mode or the payload is invalid
+        ValidationError: If a field value can't be stored
+    """
+    validate_import(payload, import_mode)
+
+    summary = {}
+
+    with transaction.atomic():
+        # Profile
+        profile_update = _pick(payload.get('profile') or {}, PROFILE_ALLOWED)
+        if 'availability_date' in profile_update:
+            profile_update['availability_date'] = _parse_date(profile_update.get('availability_date'))
+
+        profile_changed = False
+        if profile_update:
+            stored_profile = Profile.objects.filter(user=user).values('id', *profile_update).first() or {}
+            if 'portfolio_slug' in profile_update:
+                # Slug taken by another portfolio: next free variant, as for a sign-up
+                base_slug = slugify.slugify(profile_update['portfolio_slug'] or '') or build_base_slug(user)
+                profile_update['portfolio_slug'] = next_free_slug(base_slug, exclude_pk=stored_profile.get('id'))
+            profile_changed = (
+                fingerprint(Profile, profile_update, profile_update)
+                != fingerprint(Profile, stored_profile, profile_update)
+            )
+        summary['profile'] = {
+            'updated': int(profile_changed),
+            'unchanged': int(bool(profile_update) and not profile_changed),
+        }
+
+        if profile_changed and not dry_run:
+            if 'portfolio_slug' in profile_update:
+                def write_profile(slug):
+                    Profile.objects.filter(user=user).update(**{**profile_update, 'portfolio_slug': slug})
+
+                profile_update['portfolio_slug'] = write_with_free_slug(
+                    base_slug, write_profile, exclude_pk=stored_profile.get('id')
+                )
+            else:
+                Profile.objects.filter(user=user).update(**profile_update)
+
+        id_maps = {}
+        skill_ids = []
+        processed = 0
+        for key, model, allowed, date_fields in SECTIONS:
+            items = payload.get(key) or []
+            plan = _plan_section(user, model, items, allowed, date_fields, import_mode)
+            if not dry_run:
+                _apply_section(model, plan)
+
+            id_maps[model] = plan['id_map']
+            summary[key] = plan['counts']
+            if model is Skill:
+                skill_ids = plan['stored_ids']
+
+            processed += len(items)
+            if progress is not None:
+                progress(processed)
+
+        summary['skill_links'] = _sync_skill_relations(
+            user, payload.get('skills') or [], skill_ids, id_maps, dry_run=dry_run
+        )
+
+        changed = profile_changed or any(summary['skill_links'].values()) or any(
+            summary[key]['created'] or summary[key]['updated'] or summary[key]['deleted']
+            for key, model, allowed, date_fields in SECTIONS
+        )
+
+        # update() and bulk writes don't send signals
+        if changed and not dry_run:
+            refresh_public_portfolio(user.id)
+
+    return summary
@@ -0,0 +1,160 @@
+"""
+Background portfolio imports.
+
+PortfolioImportView only validates the payload and queues an ImportJob.
+The `run_import_jobs` worker command claims pending jobs one at a time
+and runs them with the import engine (apps.profiles.importer).
+
+The import itself stays a single transaction, so a failed job leaves the
+portfolio untouched. It runs in its own thread (hence on its own database
+connection) while the worker thread writes the progress, which makes the
+progress visible before the import transaction commits. The worker
+thread also bumps the job's `updated_at` while it waits (heartbeat), so
+only the jobs whose worker stopped are failed by fail_stale_jobs.
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from .importer import PortfolioImportError, import_portfolio
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds between two progress writes of a running job
+PROGRESS_INTERVAL = 1
+
+# Seconds between two heartbeats of a running job without progress
+HEARTBEAT_INTERVAL = 30
+
+
+def claim_next_job():
+    """
+    Mark the oldest pending job as running and return it.
+
+    Several workers can poll the queue: locked rows are skipped, so a job
+    is only claimed once.
+
+    Returns:
+        ImportJob or None: The claimed job, None if the queue is empty
+    """
+    with transaction.atomic():
+        job = ImportJob.objects.select_for_update(skip_locked=True).filter(
+            status=ImportJob.STATUS_PENDING
+        ).order_by('created_at').first()
+
+        if job is None:
+            return None
+
+        job.status = ImportJob.STATUS_RUNNING
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'started_at', 'updated_at'])
+
+    return job
+
+
+def fail_stale_jobs():
+    """
+    Mark as failed the running jobs without a heartbeat for more than
+    IMPORT_JOB_TIMEOUT seconds (their worker was stopped during the import).
+
+    Returns:
+        int: Number of jobs marked as failed
+    """
+    deadline = timezone.now() - timedelta(seconds=settings.IMPORT_JOB_TIMEOUT)
+
+    return ImportJob.objects.filter(
+        status=ImportJob.STATUS_RUNNING,
+        updated_at__lt=deadline
+    ).update(
+        status=ImportJob.STATUS_FAILED,
+        error="Import interrompu, veuillez le relancer",
+        payload=None,
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+
+
+def run_import_job(job):
+    """
+    Run a claimed job and store its outcome.
+
+    Returns:
+        ImportJob: The finished job
+    """
+    state = {'processed': 0, 'result': None, 'error': None}
+
+    def report(processed):
+        state['processed'] = processed
+
+    def target():
+        try:
+            state['result'] = import_portfolio(job.user, job.payload, job.import_mode, progress=report)
+        except PortfolioImportError as exc:
+            state['error'] = str(exc)
+        except ValidationError as exc:
+            # Invalid field value in the payload (e.g. a malformed date)
+            state['error'] = ' '.join(exc.messages)
+        except Exception:
+            logger.exception("Échec du job d'import %s", job.pk)
+            state['error'] = "Erreur lors de l'import"
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=target, name=f'import-job-{job.pk}', daemon=True)
+    thread.start()
+
+    written = 0
+    beat_at = time.monotonic()
+    while thread.is_alive():
+        thread.join(PROGRESS_INTERVAL)
+        if state['processed'] == written and time.monotonic() - beat_at < HEARTBEAT_INTERVAL:
+            continue
+
+        # Progress and heartbeat: updated_at tells the job is still running
+        try:
+            ImportJob.objects.filter(pk=job.pk, status=ImportJob.STATUS_RUNNING).update(
+                processed_items=state['processed'],
+                updated_at=timezone.now(),
+            )
+        except DatabaseError:
+            # Progress is informative only: the next write will catch up
+            logger.warning("Progression du job d'import %s non enregistrée", job.pk)
+        else:
+            written = state['processed']
+            beat_at = time.monotonic()
+
+    job.processed_items = state['processed']
+    if state['error'] is None:
+        job.status = ImportJob.STATUS_SUCCEEDED
+        job.result = state['result']
+    else:
+        job.status = ImportJob.STATUS_FAILED
+        job.error = state['error']
+
+    job.payload = None
+    job.finished_at = timezone.now()
+
+    # Only a job still running is finished here: one already failed as
+    # stale keeps the outcome its owner has seen
+    finished = ImportJob.objects.filter(pk=job.pk, status=ImportJob.STATUS_RUNNING).update(
+        status=job.status,
+        processed_items=job.processed_items,
+        result=job.result,
+        error=job.error,
+        payload=None,
+        finished_at=job.finished_at,
+        updated_at=timezone.now(),
+    )
+    if not finished:
+        logger.warning("Job d'import %s déjà terminé, résultat ignoré", job.pk)
+        job.refresh_from_db()
+
+    return job
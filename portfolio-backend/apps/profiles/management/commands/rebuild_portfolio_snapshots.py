@@ -0,0 +1,29 @@
+"""
+Rebuild the pre-encoded public portfolio snapshots
+"""
+from django.core.management.base import BaseCommand
+
+from apps.profiles.models import Profile
+from apps.profiles.snapshots import rebuild_portfolio_snapshots
+
+
+class Command(BaseCommand):
+    help = "Reconstruit les instantanés des portfolios publics (tous ou un seul slug)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--slug',
+            help='Slug du portfolio à reconstruire (par défaut: tous)'
+        )
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.all()
+        if options['slug']:
+            profiles = profiles.filter(portfolio_slug=options['slug'])
+
+        count = 0
+        for user_id in profiles.values_list('user_id', flat=True).iterator():
+            rebuild_portfolio_snapshots(user_id)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{count} portfolio(s) reconstruit(s)"))
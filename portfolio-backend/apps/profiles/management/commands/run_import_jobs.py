@@ -0,0 +1,51 @@
+"""
+Worker processing the queued portfolio imports
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.profiles.jobs import claim_next_job, fail_stale_jobs, run_import_job
+
+
+class Command(BaseCommand):
+    help = "Traite les imports de portfolio en file d'attente."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Traiter les jobs en attente puis s'arrêter"
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            help="Secondes entre deux consultations de la file (défaut: IMPORT_JOB_POLL_INTERVAL)"
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval'] or settings.IMPORT_JOB_POLL_INTERVAL
+
+        try:
+            while True:
+                close_old_connections()
+
+                stale = fail_stale_jobs()
+                if stale:
+                    self.stderr.write(f"{stale} job(s) interrompu(s) marqué(s) en échec")
+
+                job = claim_next_job()
+                if job is not None:
+                    job = run_import_job(job)
+                    self.stdout.write(f"Job {job.pk}: {job.get_status_display()}")
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("Worker d'import arrêté"))
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.5 on 2026-10-18 01:44
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_profile_public_template'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PortfolioSnapshot',
+            fields=[
+                ('key', models.CharField(help_text='Format: {tier}:{portfolio_slug}', max_length=140, primary_key=True, serialize=False, verbose_name='Clé')),
+                ('tier', models.CharField(choices=[('public', 'Public'), ('recruiter', 'Public + Recruteur')], max_length=20, verbose_name='Niveau de visibilité')),
+                ('profile_payload', models.BinaryField(help_text='JSON du profil public', verbose_name='Profil encodé')),
+                ('portfolio_payload', models.BinaryField(help_text='JSON du portfolio public complet', verbose_name='Portfolio encodé')),
+                ('built_at', models.DateTimeField(auto_now=True, verbose_name='Date de génération')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='portfolio_snapshots', to=settings.AUTH_USER_MODEL, verbose_name='Utilisateur')),
+            ],
+            options={
+                'verbose_name': 'Instantané de portfolio',
+                'verbose_name_plural': 'Instantanés de portfolio',
+                'db_table': 'profiles_portfolio_snapshot',
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:05
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_portfolio_snapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Identifiant unique UUID', primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date de création')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Date de modification')),
+                ('import_mode', models.CharField(default='merge', max_length=10, verbose_name="Mode d'import")),
+                ('status', models.CharField(choices=[('pending', 'En attente'), ('running', 'En cours'), ('succeeded', 'Terminé'), ('failed', 'Échoué')], default='pending', max_length=10, verbose_name='Statut')),
+                ('payload', models.JSONField(blank=True, help_text='Vidé une fois le job terminé', null=True, verbose_name='Contenu importé')),
+                ('total_items', models.PositiveIntegerField(default=0, verbose_name='Éléments à importer')),
+                ('processed_items', models.PositiveIntegerField(default=0, verbose_name='Éléments importés')),
+                ('result', models.JSONField(blank=True, null=True, verbose_name='Résultat')),
+                ('error', models.TextField(blank=True, verbose_name='Erreur')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Début du traitement')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Fin du traitement')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Utilisateur')),
+            ],
+            options={
+                'verbose_name': "Job d'import",
+                'verbose_name_plural': "Jobs d'import",
+                'db_table': 'profiles_import_job',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='import_job_queue_idx')],
+            },
+        ),
+    ]
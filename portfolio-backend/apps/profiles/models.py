@@ -5,12 +5,11 @@ from django.db import models
 from django.conf import settings
 from django.core.validators import URLValidator, RegexValidator
 from django.core.exceptions import ValidationError
-import slugify
-
-
 from apps.core.models import BaseModel
 from apps.core.utils import generate_filename
 
+from .slugs import build_base_slug, write_with_free_slug
+
 
 class Profile(BaseModel):
     """
@@ -296,56 +295,246 @@ class Profile(BaseModel):
             'twitter': self.twitter_url,
         }
     
+    # Fields the completeness depends on
+    COMPLETENESS_FIELDS = ('professional_title', 'bio', 'location')
+
+    def compute_profile_completeness(self):
+        """Return True if the profile has the minimum required information."""
+        required_fields = [getattr(self, name) for name in self.COMPLETENESS_FIELDS]
+
+        # At least 2 out of 3 required fields must be filled
+        filled_count = sum(1 for field in required_fields if field)
+        return filled_count >= 2
+
     def check_profile_completeness(self):
         """
         Check if the profile has minimum required information.
-        Updates is_profile_complete field.
+        Updates is_profile_complete field (only written if it changed).
         """
-        required_fields = [
-            self.professional_title,
-            self.bio,
-            self.location,
-        ]
-        
-        # At least 2 out of 3 required fields must be filled
-        filled_count = sum(1 for field in required_fields if field)
-        self.is_profile_complete = filled_count >= 2
-        self.save(update_fields=['is_profile_complete'])
-        
+        is_complete = self.compute_profile_completeness()
+        if is_complete != self.is_profile_complete:
+            self.is_profile_complete = is_complete
+            self.save(update_fields=['is_profile_complete'])
+
         return self.is_profile_complete
     
     def increment_views(self):
-        """Increment the profile view counter."""
-        self.profile_views += 1
-        self.save(update_fields=['profile_views'])
+        """
+        Record a profile view.
+
+        Views are buffered and written in batches (see counters.py),
+        so the read path never writes to the database.
+        """
+        from .counters import profile_view_counter
+        profile_view_counter.add(self.pk)
     
     def save(self, *args, **kwargs):
-        if not self.portfolio_slug:
-            if not self.user.get_full_name():
-                # Fallback très basique si vraiment rien
-                base = self.user.first_name or f"user-{self.user.id}"
-            else:
-                base = self.user.get_full_name() or self.user.email.split('@')[0]
+        # Completeness is computed before the write, and only when one of
+        # its inputs changed (no second UPDATE)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            inputs_changed = self._state.adding or self.has_changed(*self.COMPLETENESS_FIELDS)
+        else:
+            inputs_changed = bool(set(update_fields) & set(self.COMPLETENESS_FIELDS))
+
+        if inputs_changed:
+            self.is_profile_complete = self.compute_profile_completeness()
+            if update_fields is not None and 'is_profile_complete' not in update_fields:
+                kwargs['update_fields'] = [*kwargs['update_fields'], 'is_profile_complete']
 
-            base_slug = slugify.slugify(base.strip())
-            slug = base_slug
-            counter = 1
+        if self.portfolio_slug:
+            super().save(*args, **kwargs)
+            return
 
-            while Profile.objects.filter(portfolio_slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
+        # Génération automatique du slug (nom de l'utilisateur, suffixe si déjà pris)
+        if kwargs.get('update_fields') is not None and 'portfolio_slug' not in kwargs['update_fields']:
+            kwargs['update_fields'] = [*kwargs['update_fields'], 'portfolio_slug']
 
-            self.portfolio_slug = slug
+        parent_save = super().save
 
-        super().save(*args, **kwargs)
+        def write(slug):
+            self.portfolio_slug = slug
+            parent_save(*args, **kwargs)
 
-        # Check profile completeness after saving (override to avoid recursion)
-        if 'update_fields' not in kwargs:
-            self.check_profile_completeness()
+        write_with_free_slug(build_base_slug(self.user), write, exclude_pk=self.pk)
             
     @property
     def public_url(self):
         if self.portfolio_slug:
             return f"/{self.portfolio_slug}"
         # Fallback temporaire pour anciens profils (à retirer après migration complète)
-        return f"/u/{self.user.username}"
\ No newline at end of file
+        return f"/u/{self.user.username}"
+
+
+class PortfolioSnapshot(models.Model):
+    """
+    Pre-encoded public portfolio, one row per portfolio and visibility tier.
+
+    Derived data rebuilt by signals whenever portfolio content changes
+    (see apps.profiles.snapshots). The primary key is built from the tier
+    and the portfolio slug, so a public read is a single primary-key lookup
+    returning ready-to-send JSON bytes.
+    """
+
+    TIER_PUBLIC = 'public'
+    TIER_RECRUITER = 'recruiter'
+
+    TIER_CHOICES = [
+        (TIER_PUBLIC, 'Public'),
+        (TIER_RECRUITER, 'Public + Recruteur'),
+    ]
+
+    key = models.CharField(
+        max_length=140,
+        primary_key=True,
+        verbose_name='Clé',
+        help_text='Format: {tier}:{portfolio_slug}'
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='portfolio_snapshots',
+        verbose_name='Utilisateur'
+    )
+
+    tier = models.CharField(
+        max_length=20,
+        choices=TIER_CHOICES,
+        verbose_name='Niveau de visibilité'
+    )
+
+    profile_payload = models.BinaryField(
+        verbose_name='Profil encodé',
+        help_text='JSON du profil public'
+    )
+
+    portfolio_payload = models.BinaryField(
+        verbose_name='Portfolio encodé',
+        help_text='JSON du portfolio public complet'
+    )
+
+    built_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Date de génération'
+    )
+
+    class Meta:
+        verbose_name = 'Instantané de portfolio'
+        verbose_name_plural = 'Instantanés de portfolio'
+        db_table = 'profiles_portfolio_snapshot'
+
+    def __str__(self):
+        return self.key
+
+    @classmethod
+    def build_key(cls, tier, portfolio_slug):
+        """Return the primary key of the snapshot of a portfolio for a tier."""
+        return f"{tier}:{portfolio_slug}"
+
+
+class ImportJob(BaseModel):
+    """
+    Portfolio import queued for background processing.
+
+    Created by PortfolioImportView and run by the `run_import_jobs`
+    worker command (see apps.profiles.jobs). The payload is dropped once
+    the job is finished; the per-section summary is kept in `result`.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'En attente'),
+        (STATUS_RUNNING, 'En cours'),
+        (STATUS_SUCCEEDED, 'Terminé'),
+        (STATUS_FAILED, 'Échoué'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='import_jobs',
+        verbose_name='Utilisateur'
+    )
+
+    import_mode = models.CharField(
+        max_length=10,
+        default='merge',
+        verbose_name="Mode d'import"
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name='Statut'
+    )
+
+    payload = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='Contenu importé',
+        help_text='Vidé une fois le job terminé'
+    )
+
+    total_items = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Éléments à importer'
+    )
+
+    processed_items = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Éléments importés'
+    )
+
+    result = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name='Résultat'
+    )
+
+    error = models.TextField(
+        blank=True,
+        verbose_name='Erreur'
+    )
+
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Début du traitement'
+    )
+
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fin du traitement'
+    )
+
+    class Meta:
+        verbose_name = "Job d'import"
+        verbose_name_plural = "Jobs d'import"
+        db_table = 'profiles_import_job'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='import_job_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"Import {self.import_mode} de {self.user} ({self.get_status_display()})"
+
+    @property
+    def progress(self):
+        """Completion percentage (0-100)."""
+        if self.status == self.STATUS_SUCCEEDED:
+            return 100
+        if not self.total_items:
+            return 0
+        return min(99, self.processed_items * 100 // self.total_items)
+
+    @property
+    def is_finished(self):
+        return self.status in (self.STATUS_SUCCEEDED, self.STATUS_FAILED)
@@ -0,0 +1,21 @@
+"""
+Request parsers for the profiles app
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .exporter import ExportFormatError, read_ndjson_export
+
+
+class NDJSONExportParser(BaseParser):
+    """
+    Parse an NDJSON portfolio export (see apps.profiles.exporter) into the
+    export document, so it can be imported like the JSON one.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return read_ndjson_export(stream)
+        except (ExportFormatError, UnicodeDecodeError) as exc:
+            raise ParseError(f"Export NDJSON invalide: {exc}")
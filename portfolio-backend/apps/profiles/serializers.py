@@ -6,7 +6,7 @@ from django.contrib.auth import get_user_model
 from typing import Optional
 
 from apps.core.serializers import BaseSerializer
-from .models import Profile
+from .models import Profile, ImportJob
 
 User = get_user_model()
 
@@ -249,4 +249,30 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         """Debug validation errors."""
         # This method is called after individual field validation
-        return attrs
\ No newline at end of file
+        return attrs
+
+
+class ImportJobSerializer(BaseSerializer):
+    """
+    Status, progress and result of a queued portfolio import.
+    """
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    progress = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            'id',
+            'import_mode',
+            'status',
+            'status_display',
+            'progress',
+            'total_items',
+            'processed_items',
+            'result',
+            'error',
+            'created_at',
+            'started_at',
+            'finished_at',
+        ]
+        read_only_fields = fields
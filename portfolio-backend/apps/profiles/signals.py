@@ -1,11 +1,20 @@
 """
-Signals for automatic profile creation
+Signals for automatic profile creation and public portfolio refresh
 """
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.conf import settings
 
+from apps.projects.models import Project
+from apps.education.models import Diploma, Certification
+from apps.professional.models import Experience, Training
+from apps.skills.models import Skill
+from apps.proofs.models import Proof
+
+from apps.core.cache import invalidate_public_cache
+
 from .models import Profile
+from .snapshots import schedule_snapshot_rebuild
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -18,12 +27,111 @@ def create_user_profile(sender, instance, created, **kwargs):
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs):
+def save_user_profile(sender, instance, created, update_fields=None, **kwargs):
     """
-    Automatically save the Profile when the User is saved.
+    Save the pending changes of the Profile loaded with the User.
+
+    Only the changed Profile fields are written (nothing when none
+    changed). Partial User saves, like the last_login update of every
+    login, don't touch the profile at all.
     """
+    if created:
+        return
+
+    if type(instance).profile.is_cached(instance):
+        try:
+            instance.profile.save()
+            return
+        except Profile.DoesNotExist:
+            pass
+    elif update_fields:
+        return
+
     # Create profile if it doesn't exist (edge case)
-    if not hasattr(instance, 'profile'):
-        Profile.objects.create(user=instance)
-    else:
-        instance.profile.save()
\ No newline at end of file
+    Profile.objects.get_or_create(user=instance)
+
+
+# ========== PUBLIC PORTFOLIO REFRESH ==========
+
+# Models whose content is part of the public portfolio
+PORTFOLIO_MODELS = [
+    Profile,
+    Project,
+    Skill,
+    Diploma,
+    Certification,
+    Experience,
+    Training,
+    Proof,
+]
+
+# Fields that never appear in the public portfolio
+PORTFOLIO_IGNORED_FIELDS = {'profile_views', 'is_profile_complete', 'updated_at'}
+
+
+def refresh_public_portfolio(user_id):
+    """Invalidate the cached responses and rebuild the snapshots of a portfolio."""
+    # Cache first: the snapshot build date is the validator of cached responses
+    invalidate_public_cache(user_id)
+    schedule_snapshot_rebuild(user_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='portfolio_refresh_save_User')
+def refresh_portfolio_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Refresh the public portfolio when the owner's name (or email) changes.
+
+    The profile isn't saved with the user anymore, so its own refresh
+    doesn't cover these fields.
+    """
+    if created:
+        return
+    if update_fields and not set(update_fields) & set(instance.PUBLIC_FIELDS):
+        return
+    if not instance.has_public_changes():
+        return
+
+    refresh_public_portfolio(instance.id)
+    instance.remember_public_values()
+
+
+def refresh_portfolio_on_save(sender, instance, update_fields=None, **kwargs):
+    """Refresh the owner's public portfolio after a content change."""
+    if update_fields and set(update_fields) <= PORTFOLIO_IGNORED_FIELDS:
+        return
+    refresh_public_portfolio(instance.user_id)
+
+
+def refresh_portfolio_on_delete(sender, instance, **kwargs):
+    """Refresh the owner's public portfolio after a deletion."""
+    refresh_public_portfolio(instance.user_id)
+
+
+def refresh_portfolio_on_m2m_change(sender, instance, action, **kwargs):
+    """Refresh the owner's public portfolio after skill links change."""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        refresh_public_portfolio(instance.user_id)
+
+
+for model in PORTFOLIO_MODELS:
+    post_save.connect(
+        refresh_portfolio_on_save,
+        sender=model,
+        dispatch_uid=f'portfolio_refresh_save_{model.__name__}'
+    )
+    post_delete.connect(
+        refresh_portfolio_on_delete,
+        sender=model,
+        dispatch_uid=f'portfolio_refresh_delete_{model.__name__}'
+    )
+
+for through in (
+    Skill.related_projects.through,
+    Skill.related_certifications.through,
+    Skill.related_trainings.through,
+):
+    m2m_changed.connect(
+        refresh_portfolio_on_m2m_change,
+        sender=through,
+        dispatch_uid=f'portfolio_refresh_m2m_{through.__name__}'
+    )
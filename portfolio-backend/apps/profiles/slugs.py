@@ -0,0 +1,102 @@
+"""
+Portfolio slug allocation.
+
+The free slug for a base ("jean-dupont", "jean-dupont-1", ...) is found
+with one prefix query instead of one query per taken candidate. Two
+concurrent sign-ups can still pick the same slug: the unique constraint
+rejects the second write, which is retried with the next free slug.
+"""
+import re
+
+import slugify
+from django.db import IntegrityError, transaction
+
+
+# Attempts before giving up on a slug race
+SLUG_MAX_ATTEMPTS = 5
+
+# Room kept at the end of the base for the "-N" suffix
+SLUG_SUFFIX_MAX_LENGTH = 10
+
+
+def _max_length():
+    # Import inside function to avoid circular imports
+    from .models import Profile
+    return Profile._meta.get_field('portfolio_slug').max_length
+
+
+def build_base_slug(user):
+    """Return the slug a user's portfolio is named after (before suffixing)."""
+    # Fallback très basique si vraiment rien
+    base = user.get_full_name() or user.first_name or f"user-{user.id}"
+    return slugify.slugify(base.strip()) or f"user-{user.id}"
+
+
+def next_free_slug(base_slug, exclude_pk=None):
+    """
+    Return base_slug, or base_slug-N with the smallest free N.
+
+    All the taken candidates are fetched with one prefix query.
+
+    Args:
+        base_slug: Wanted slug
+        exclude_pk: Profile whose own slug doesn't count as taken
+    """
+    # Import inside function to avoid circular imports
+    from .models import Profile
+
+    base_slug = base_slug[:_max_length() - SLUG_SUFFIX_MAX_LENGTH].strip('-')
+
+    taken = Profile.objects.filter(portfolio_slug__startswith=base_slug)
+    if exclude_pk is not None:
+        taken = taken.exclude(pk=exclude_pk)
+
+    candidate = re.compile(rf'^{re.escape(base_slug)}(?:-(\d+))?$')
+    used = set()
+    for slug in taken.values_list('portfolio_slug', flat=True):
+        match = candidate.match(slug)
+        if match:
+            used.add(int(match.group(1) or 0))
+
+    if 0 not in used:
+        return base_slug
+
+    suffix = 1
+    while suffix in used:
+        suffix += 1
+    return f"{base_slug}-{suffix}"
+
+
+def write_with_free_slug(base_slug, write, exclude_pk=None):
+    """
+    Allocate a free slug and write it, retrying if another profile takes
+    it first.
+
+    Args:
+        base_slug: Wanted slug
+        write: Callable writing the profile with the given slug (run in a
+            savepoint)
+        exclude_pk: Profile being written (its own slug is free for it)
+
+    Returns:
+        str: The slug written
+
+    Raises:
+        IntegrityError: If the write fails for another reason, or the
+            slug is still taken after SLUG_MAX_ATTEMPTS attempts
+    """
+    # Import inside function to avoid circular imports
+    from .models import Profile
+
+    for attempt in range(1, SLUG_MAX_ATTEMPTS + 1):
+        slug = next_free_slug(base_slug, exclude_pk=exclude_pk)
+        try:
+            with transaction.atomic():
+                write(slug)
+            return slug
+        except IntegrityError:
+            taken = Profile.objects.filter(portfolio_slug=slug)
+            if exclude_pk is not None:
+                taken = taken.exclude(pk=exclude_pk)
+            if attempt == SLUG_MAX_ATTEMPTS or not taken.exists():
+                raise
@@ -0,0 +1,153 @@
+"""
+Pre-encoded public portfolio snapshots.
+
+Public portfolios change rarely but are read often. Each portfolio is
+rendered once per visibility tier into a PortfolioSnapshot row, rebuilt
+by signals (see signals.py) whenever its content changes. Public reads
+then only fetch ready-to-send JSON bytes by primary key.
+"""
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.enums import Visibility
+from apps.core.utils import on_commit_once
+from .models import Profile, PortfolioSnapshot
+from .utils import build_public_portfolio
+
+
+# Visibilities rendered in each snapshot tier
+TIER_VISIBILITIES = {
+    PortfolioSnapshot.TIER_PUBLIC: [Visibility.PUBLIC],
+    PortfolioSnapshot.TIER_RECRUITER: [Visibility.PUBLIC, Visibility.RECRUTEUR],
+}
+
+
+class SiteRequest:
+    """
+    Stand-in for the request in the snapshot serializer context.
+
+    Snapshots are built outside of any request, but their file URLs must
+    stay absolute like those of the live endpoints: they are built on
+    SITE_URL (absolute media URLs, e.g. on S3, are kept as is).
+    """
+
+    def build_absolute_uri(self, location):
+        return urljoin(settings.SITE_URL, location)
+
+
+def get_snapshot_tier(visibilities):
+    """Return the snapshot tier matching a list of allowed visibilities."""
+    if Visibility.RECRUTEUR in visibilities:
+        return PortfolioSnapshot.TIER_RECRUITER
+    return PortfolioSnapshot.TIER_PUBLIC
+
+
+def rebuild_portfolio_snapshots(user_id):
+    """
+    Rebuild every snapshot tier of a user's portfolio.
+
+    Stale rows (e.g. left behind by a slug change) are removed.
+
+    Returns:
+        list of PortfolioSnapshot instances written (empty if no profile)
+    """
+    profile = Profile.objects.select_related('user').filter(user_id=user_id).first()
+
+    if not profile or not profile.portfolio_slug:
+        PortfolioSnapshot.objects.filter(user_id=user_id).delete()
+        return []
+
+    renderer = JSONRenderer()
+    context = {'request': SiteRequest()}
+    snapshots = []
+
+    for tier, visibilities in TIER_VISIBILITIES.items():
+        data = build_public_portfolio(profile, visibilities, context)
+        snapshots.append(PortfolioSnapshot(
+            key=PortfolioSnapshot.build_key(tier, profile.portfolio_slug),
+            user_id=user_id,
+            tier=tier,
+            profile_payload=renderer.render(data['profile']),
+            portfolio_payload=renderer.render(data),
+        ))
+
+    with transaction.atomic():
+        PortfolioSnapshot.objects.filter(user_id=user_id).exclude(
+            key__in=[snapshot.key for snapshot in snapshots]
+        ).delete()
+        PortfolioSnapshot.objects.bulk_create(
+            snapshots,
+            update_conflicts=True,
+            unique_fields=['key'],
+            update_fields=['user', 'tier', 'profile_payload', 'portfolio_payload', 'built_at'],
+        )
+
+    return snapshots
+
+
+def schedule_snapshot_rebuild(user_id):
+    """
+    Rebuild a user's snapshots once the current transaction commits.
+
+    Several writes on the same portfolio inside one transaction (e.g. an
+    import) only trigger a single rebuild.
+    """
+    if not user_id:
+        return
+
+    on_commit_once(
+        ('portfolio_snapshot', user_id),
+        lambda: rebuild_portfolio_snapshots(user_id)
+    )
+
+
+def get_snapshot_payload(portfolio_slug, tier, field):
+    """
+    Return the pre-encoded JSON of a portfolio snapshot, its build date and owner.
+
+    Falls back to building the snapshots when they don't exist yet.
+
+    Args:
+        portfolio_slug: Slug of the portfolio
+        tier: PortfolioSnapshot tier
+        field: 'profile_payload' or 'portfolio_payload'
+
+    Returns:
+        (bytes, datetime, user_id) tuple, or (None, None, None) if no
+        portfolio uses this slug
+    """
+    key = PortfolioSnapshot.build_key(tier, portfolio_slug)
+    row = PortfolioSnapshot.objects.filter(pk=key).values_list(field, 'built_at', 'user_id').first()
+
+    if row is None:
+        user_id = Profile.objects.filter(
+            portfolio_slug=portfolio_slug
+        ).values_list('user_id', flat=True).first()
+        if not user_id:
+            return None, None, None
+
+        for snapshot in rebuild_portfolio_snapshots(user_id):
+            if snapshot.key == key:
+                row = (getattr(snapshot, field), snapshot.built_at, user_id)
+
+    if row is None:
+        return None, None, None
+
+    payload, built_at, user_id = row
+    return bytes(payload), built_at, user_id
+
+
+def get_snapshot_built_at(user_id, tier):
+    """
+    Return when a user's portfolio snapshot was last built, or None.
+
+    Snapshots are rebuilt on every content change, so this is the
+    last-modified date of the whole public portfolio for the tier.
+    """
+    return PortfolioSnapshot.objects.filter(
+        user_id=user_id,
+        tier=tier
+    ).values_list('built_at', flat=True).first()
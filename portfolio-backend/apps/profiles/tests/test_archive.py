@@ -0,0 +1,47 @@
+"""
+Tests for the streamed portfolio archive
+"""
+import io
+import zipfile
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+
+from apps.profiles.archive import _proof_path, get_archive_entries, get_archive_size, iter_archive
+from apps.projects.models import Project
+from apps.proofs.models import Proof
+
+
+@pytest.fixture
+def proofs(user, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    project = Project.objects.create(user=user, title='Portfolio', description='Site personnel')
+    content_type = ContentType.objects.get_for_model(Project)
+
+    proofs = []
+    for index in range(3):
+        proof = Proof(user=user, content_type=content_type, object_id=project.id, title=f'Preuve {index}')
+        proof.file.save(f'preuve{index}.pdf', ContentFile(b'%PDF' * 1000), save=False)
+        proof.save()
+        proofs.append(proof)
+    return proofs
+
+
+@pytest.mark.django_db
+def test_archive_keeps_announced_size_when_files_changed(user, proofs):
+    missing, shorter, longer = proofs
+    missing.file.storage.delete(missing.file.name)
+    Proof.objects.filter(pk=shorter.pk).update(file_size=5000)
+    Proof.objects.filter(pk=longer.pk).update(file_size=10)
+
+    entries = get_archive_entries(user)
+    body = b''.join(iter_archive(entries))
+
+    assert len(body) == get_archive_size(entries)
+
+    archive = zipfile.ZipFile(io.BytesIO(body))
+    assert archive.testzip() is None
+    assert archive.getinfo(_proof_path(missing)).file_size == 4000
+    assert archive.getinfo(_proof_path(shorter)).file_size == 5000
+    assert archive.getinfo(_proof_path(longer)).file_size == 10
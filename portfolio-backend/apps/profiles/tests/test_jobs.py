@@ -0,0 +1,50 @@
+"""
+Tests for the background portfolio imports
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.profiles import jobs
+from apps.profiles.models import ImportJob
+
+
+def _running_job(user, started, beat):
+    job = ImportJob.objects.create(user=user, payload={}, status=ImportJob.STATUS_RUNNING)
+    ImportJob.objects.filter(pk=job.pk).update(started_at=started, updated_at=beat)
+    return job
+
+
+@pytest.mark.django_db
+def test_fail_stale_jobs_spares_jobs_with_a_heartbeat(user, settings):
+    settings.IMPORT_JOB_TIMEOUT = 300
+    now = timezone.now()
+    alive = _running_job(user, started=now - timedelta(hours=2), beat=now - timedelta(seconds=30))
+    lost = _running_job(user, started=now - timedelta(hours=2), beat=now - timedelta(minutes=10))
+
+    assert jobs.fail_stale_jobs() == 1
+
+    alive.refresh_from_db()
+    lost.refresh_from_db()
+    assert alive.status == ImportJob.STATUS_RUNNING
+    assert lost.status == ImportJob.STATUS_FAILED
+
+
+# The import runs in its own thread, on its own connection
+@pytest.mark.django_db(transaction=True)
+def test_run_import_job_keeps_a_job_failed_meanwhile(user, monkeypatch):
+    job = ImportJob.objects.create(user=user, payload={})
+    job = jobs.claim_next_job()
+
+    def import_portfolio(user, payload, import_mode, progress):
+        # Failed as stale by another worker while the import runs
+        ImportJob.objects.filter(pk=job.pk).update(status=ImportJob.STATUS_FAILED, error='Import interrompu')
+        return {}
+
+    monkeypatch.setattr(jobs, 'import_portfolio', import_portfolio)
+
+    job = jobs.run_import_job(job)
+
+    assert job.status == ImportJob.STATUS_FAILED
+    assert ImportJob.objects.get(pk=job.pk).error == 'Import interrompu'
@@ -0,0 +1,38 @@
+"""
+Tests for the public portfolio refresh signals
+"""
+import json
+
+import pytest
+
+from apps.accounts.models import User
+from apps.profiles.models import PortfolioSnapshot
+from apps.profiles.snapshots import get_snapshot_payload
+
+
+def _public_full_name(slug):
+    payload, built_at, owner_id = get_snapshot_payload(slug, PortfolioSnapshot.TIER_PUBLIC, 'profile_payload')
+    return json.loads(payload)['user_full_name']
+
+
+# Real commits: the snapshots are rebuilt by on_commit callbacks
+@pytest.mark.django_db(transaction=True)
+def test_renaming_user_refreshes_public_portfolio(user):
+    slug = user.profile.portfolio_slug
+    assert _public_full_name(slug) == 'Jean Dupont'
+
+    # Loaded without its profile, like the account views do
+    user = User.objects.get(pk=user.pk)
+    user.first_name = 'Paul'
+    user.save()
+
+    assert _public_full_name(slug) == 'Paul Dupont'
+
+
+@pytest.mark.django_db
+def test_login_update_does_not_refresh_public_portfolio(user, django_capture_on_commit_callbacks):
+    user = User.objects.get(pk=user.pk)
+    with django_capture_on_commit_callbacks() as callbacks:
+        user.save(update_fields=['last_login'])
+
+    assert callbacks == []
@@ -0,0 +1,22 @@
+"""
+Tests for the public portfolio snapshots
+"""
+import json
+
+import pytest
+from django.test import override_settings
+
+from apps.profiles.models import Profile
+from apps.profiles.snapshots import rebuild_portfolio_snapshots
+
+
+@pytest.mark.django_db
+@override_settings(SITE_URL='https://api.example.com', MEDIA_URL='/media/')
+def test_snapshot_file_urls_are_absolute(user):
+    Profile.objects.filter(user=user).update(photo='profiles/photos/jean.jpg')
+
+    snapshots = rebuild_portfolio_snapshots(user.id)
+
+    for snapshot in snapshots:
+        profile = json.loads(snapshot.profile_payload)
+        assert profile['photo'] == 'https://api.example.com/media/profiles/photos/jean.jpg'
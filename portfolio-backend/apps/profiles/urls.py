@@ -5,11 +5,16 @@ from django.urls import path
 
 from .views import (
     MyProfileView,
+    DashboardView,
     PublicProfileBySlugView,
+    PublicPortfolioBySlugView,
     PublicProfileView,
     DefaultProfileView,
     PortfolioExportView,
+    PortfolioArchiveView,
     PortfolioImportView,
+    ImportJobListView,
+    ImportJobDetailView,
     upload_profile_photo,
     delete_profile_photo,
     check_profile_completeness
@@ -20,8 +25,12 @@ app_name = 'profiles'
 urlpatterns = [
     # Authenticated user's profile
     path('me/', MyProfileView.as_view(), name='my_profile'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
     path('export/', PortfolioExportView.as_view(), name='portfolio_export'),
+    path('export/archive/', PortfolioArchiveView.as_view(), name='portfolio_archive'),
     path('import/', PortfolioImportView.as_view(), name='portfolio_import'),
+    path('import/jobs/', ImportJobListView.as_view(), name='import_jobs'),
+    path('import/jobs/<uuid:pk>/', ImportJobDetailView.as_view(), name='import_job_detail'),
     path('upload-photo/', upload_profile_photo, name='upload_photo'),
     path('delete-photo/', delete_profile_photo, name='delete_photo'),
     path('check-completeness/', check_profile_completeness, name='check_completeness'),
@@ -30,4 +39,5 @@ urlpatterns = [
     path('public/default/', DefaultProfileView.as_view(), name='default_profile'),
     path('public/<uuid:user_id>/', PublicProfileView.as_view(), name='public_profile'),
     path('public/slug/<str:slug>/', PublicProfileBySlugView.as_view(), name='public-profile-slug'),
+    path('public/slug/<str:slug>/full/', PublicPortfolioBySlugView.as_view(), name='public-portfolio-slug'),
 ]
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Utility functions for the profiles app
+"""
+from django.db.models import Count, Q
+
+from apps.projects.models import Project
+from apps.projects.serializers import ProjectPublicSerializer
+
+from apps.education.models import Diploma, Certification
+from apps.education.serializers import DiplomaPublicSerializer, CertificationPublicSerializer
+
+from apps.professional.models import Experience, Training
+from apps.professional.serializers import ExperiencePublicSerializer, TrainingPublicSerializer
+
+from apps.skills.models import Skill
+from apps.skills.serializers import SkillGroupedSerializer
+from apps.skills.utils import get_skill_statistics, group_skills_by_category
+
+from .serializers import PublicProfileSerializer
+
+
+def build_public_portfolio(profile, visibilities, context=None):
+    """
+    Build the complete public portfolio of a profile.
+
+    Runs one query per section whatever the number of items, so the
+    cost of a full portfolio page stays constant.
+
+    Args:
+        profile: Profile instance (with `user` already selected)
+        visibilities: List of allowed visibilities (see get_allowed_visibilities)
+        context: Serializer context, whose `request` builds the absolute file URLs
+
+    Returns:
+        dict with the profile and every visible section
+    """
+    user_id = profile.user_id
+
+    projects = Project.objects.filter(
+        user_id=user_id,
+        visibility__in=visibilities,
+        is_published=True,
+    ).order_by('display_order', '-start_date')
+
+    diplomas = Diploma.objects.filter(
+        user_id=user_id,
+        visibility__in=visibilities,
+        is_published=True,
+    ).order_by('display_order', '-end_date')
+
+    certifications = Certification.objects.filter(
+        user_id=user_id,
+        visibility__in=visibilities,
+        is_published=True,
+    ).order_by('display_order', '-issue_date')
+
+    experiences = Experience.objects.filter(
+        user_id=user_id,
+        visibility__in=visibilities,
+        is_published=True,
+    ).order_by('display_order', '-start_date')
+
+    trainings = Training.objects.filter(
+        user_id=user_id,
+        visibility__in=visibilities,
+        is_published=True,
+    ).order_by('display_order', '-start_date')
+
+    # Skills: one ordered query, grouped by category in Python
+    grouped_skills = group_skills_by_category(
+        Skill.objects.filter(user_id=user_id).order_by('display_order', 'name')
+    )
+
+    context = context or {}
+
+    return {
+        'profile': PublicProfileSerializer(profile, context=context).data,
+        'projects': ProjectPublicSerializer(projects, many=True, context=context).data,
+        'skills': SkillGroupedSerializer(grouped_skills, many=True, context=context).data,
+        'diplomas': DiplomaPublicSerializer(diplomas, many=True, context=context).data,
+        'certifications': CertificationPublicSerializer(certifications, many=True, context=context).data,
+        'experiences': ExperiencePublicSerializer(experiences, many=True, context=context).data,
+        'trainings': TrainingPublicSerializer(trainings, many=True, context=context).data,
+    }
+
+
+def build_dashboard_summary(profile):
+    """
+    Build every count shown on the owner's dashboard.
+
+    Runs one aggregate query per model instead of loading the
+    collections, plus the (cached) recruiter link statistics.
+
+    Args:
+        profile: Profile instance of the authenticated user
+
+    Returns:
+        dict with one entry per section
+    """
+    # Import inside function to avoid circular imports
+    from apps.recruiter_access.utils import get_link_summary
+
+    user_id = profile.user_id
+
+    projects = Project.objects.filter(user_id=user_id).aggregate(
+        total=Count('id'),
+        featured=Count('id', filter=Q(is_featured=True)),
+    )
+
+    experiences = Experience.objects.filter(user_id=user_id).aggregate(
+        total=Count('id'),
+        current=Count('id', filter=Q(is_current=True)),
+    )
+
+    return {
+        'profile': {
+            'is_complete': profile.is_profile_complete,
+            'profile_views': profile.profile_views,
+        },
+        'projects': projects,
+        'skills': get_skill_statistics(user_id),
+        'diplomas': Diploma.objects.filter(user_id=user_id).aggregate(total=Count('id')),
+        'certifications': Certification.objects.filter(user_id=user_id).aggregate(total=Count('id')),
+        'experiences': experiences,
+        'trainings': Training.objects.filter(user_id=user_id).aggregate(total=Count('id')),
+        'recruiter_access': get_link_summary(user_id),
+    }
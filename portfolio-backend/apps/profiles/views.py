@@ -1,9 +1,9 @@
 """
 Views for Profile management
 """
-from django.db import transaction
-from django.utils import timezone
-import datetime
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from rest_framework import generics, status, serializers as s
 from rest_framework.views import APIView
 from rest_framework.decorators import api_view, permission_classes
@@ -14,24 +14,26 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
-from .models import Profile
+from .models import Profile, PortfolioSnapshot, ImportJob
+from .snapshots import get_snapshot_payload, get_snapshot_tier
+from .utils import build_dashboard_summary
+from .exporter import build_export, iter_export_json, iter_export_ndjson
+from .archive import get_archive_entries, get_archive_size, iter_archive
+from .parsers import NDJSONExportParser
+from .importer import import_portfolio, validate_import, count_import_items, PortfolioImportError
 from .serializers import (
     ProfileSerializer,
     PublicProfileSerializer,
-    ProfileUpdateSerializer
+    ProfileUpdateSerializer,
+    ImportJobSerializer
 )
 
-from apps.projects.models import Project
-from apps.projects.serializers import ProjectSerializer
-
-from apps.education.models import Diploma, Certification
-from apps.education.serializers import DiplomaSerializer, CertificationSerializer
-
-from apps.professional.models import Experience, Training
-from apps.professional.serializers import ExperienceSerializer, TrainingSerializer
-
-from apps.skills.models import Skill
-from apps.skills.serializers import SkillSerializer
+from apps.core.cache import (
+    get_validators,
+    get_not_modified_response,
+    set_validators,
+)
+from apps.recruiter_access.utils import get_recruiter_context
 
 
 class MyProfileView(generics.RetrieveUpdateAPIView):
@@ -55,234 +57,153 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
         """Get the profile of the authenticated user."""
         return self.request.user.profile
 
+    def perform_update(self, serializer):
+        # Slug chosen by the user but taken in the meantime (the automatic
+        # slug of a blank value is retried by Profile.save)
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            if not Profile.objects.filter(
+                portfolio_slug=serializer.validated_data.get('portfolio_slug') or None
+            ).exclude(pk=serializer.instance.pk).exists():
+                raise
+            raise s.ValidationError({'portfolio_slug': ["Ce slug est déjà utilisé par un autre profil."]})
+
 
 class PortfolioExportView(APIView):
+    """
+    Export the portfolio of the authenticated user (schema_version 1).
+
+    `?stream=json` streams the same document and `?stream=ndjson` one record
+    per line (see apps.profiles.exporter): the sections are encoded while
+    they are read, so memory stays flat whatever the portfolio size.
+    """
+    permission_classes = [IsAuthenticated]
+
+    STREAM_FORMATS = {
+        'json': (iter_export_json, 'application/json', 'json'),
+        'ndjson': (iter_export_ndjson, 'application/x-ndjson', 'ndjson'),
+    }
+
+    def get(self, request):
+        stream = request.query_params.get('stream')
+        if not stream:
+            return Response(build_export(request.user), status=status.HTTP_200_OK)
+
+        if stream not in self.STREAM_FORMATS:
+            return Response(
+                {'error': 'stream invalide (valeurs: json, ndjson)'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        generate, content_type, extension = self.STREAM_FORMATS[stream]
+        filename = f"portfolio-{request.user.profile.portfolio_slug or 'export'}.{extension}"
+
+        response = StreamingHttpResponse(generate(request.user), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class PortfolioArchiveView(APIView):
+    """
+    Download the portfolio as a streamed ZIP archive: the JSON export,
+    a proofs manifest and every proof file (see apps.profiles.archive).
+
+    `?media=1` also adds the profile photo and the project covers. The
+    archive size is sent up front in the X-Archive-Size header so clients
+    can show a progress bar.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        profile = request.user.profile
-
-        projects = Project.objects.filter(user=request.user).order_by('display_order', '-start_date')
-        skills = Skill.objects.filter(user=request.user).order_by('display_order', 'category', 'name')
-        diplomas = Diploma.objects.filter(user=request.user).order_by('display_order', '-end_date')
-        certifications = Certification.objects.filter(user=request.user).order_by('display_order', '-issue_date')
-        experiences = Experience.objects.filter(user=request.user).order_by('display_order', '-start_date')
-        trainings = Training.objects.filter(user=request.user).order_by('display_order', '-start_date')
-
-        return Response({
-            'schema_version': 1,
-            'exported_at': timezone.now().isoformat(),
-            'profile': ProfileSerializer(profile).data,
-            'projects': ProjectSerializer(projects, many=True).data,
-            'skills': SkillSerializer(skills, many=True).data,
-            'diplomas': DiplomaSerializer(diplomas, many=True).data,
-            'certifications': CertificationSerializer(certifications, many=True).data,
-            'experiences': ExperienceSerializer(experiences, many=True).data,
-            'trainings': TrainingSerializer(trainings, many=True).data,
-        }, status=status.HTTP_200_OK)
+        include_media = request.query_params.get('media') in ('1', 'true')
+        entries = get_archive_entries(request.user, include_media=include_media)
+
+        filename = f"portfolio-{request.user.profile.portfolio_slug or 'export'}.zip"
+        response = StreamingHttpResponse(iter_archive(entries), content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        size = get_archive_size(entries)
+        if size is not None:
+            response['X-Archive-Size'] = str(size)
+
+        return response
 
 
 class PortfolioImportView(APIView):
+    """
+    Queue a portfolio import.
+
+    The payload is validated, then stored in an ImportJob processed by the
+    `run_import_jobs` worker: poll the returned job for progress and result.
+    With `dry_run`, the diff (created/updated/unchanged/deleted counts) is
+    returned right away and nothing is written.
+    """
     permission_classes = [IsAuthenticated]
-    parser_classes = [JSONParser]
+    parser_classes = [JSONParser, NDJSONExportParser]
 
+    @extend_schema(responses={202: ImportJobSerializer})
     def post(self, request):
         payload = request.data or {}
 
         import_mode = request.query_params.get('mode') or payload.get('import_mode') or 'merge'
-        if import_mode not in ('merge', 'replace'):
-            return Response(
-                {'error': 'import_mode invalide (valeurs: merge, replace)'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
 
-        if payload.get('schema_version') != 1:
+        try:
+            validate_import(payload, import_mode)
+        except PortfolioImportError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        dry_run = request.query_params.get('dry_run') or payload.get('dry_run')
+        if dry_run and str(dry_run).lower() not in ('0', 'false'):
+            # Nothing is written: the diff is computed right away
+            try:
+                summary = import_portfolio(request.user, payload, import_mode, dry_run=True)
+            except ValidationError as exc:
+                return Response({'error': ' '.join(exc.messages)}, status=status.HTTP_400_BAD_REQUEST)
+
             return Response(
-                {'error': 'schema_version invalide ou non supporté'},
-                status=status.HTTP_400_BAD_REQUEST
+                {
+                    'message': "Simulation terminée, aucune donnée n'a été modifiée",
+                    'import_mode': import_mode,
+                    'dry_run': True,
+                    'summary': summary,
+                },
+                status=status.HTTP_200_OK
             )
 
-        def _pick(data: dict, allowed: list[str]):
-            return {k: data.get(k) for k in allowed if k in data}
-
-        def _parse_date(value):
-            if not value:
-                return None
-            if isinstance(value, datetime.date):
-                return value
-            if isinstance(value, str):
-                try:
-                    return datetime.date.fromisoformat(value)
-                except ValueError:
-                    return value
-            return value
-
-        profile_allowed = [
-            'portfolio_slug',
-            'professional_title',
-            'bio',
-            'tagline',
-            'professional_email',
-            'phone',
-            'location',
-            'website_url',
-            'github_url',
-            'linkedin_url',
-            'twitter_url',
-            'availability',
-            'availability_date',
-            'show_email',
-            'show_phone',
-            'show_location',
-            'public_template',
-            'empty_about_text',
-            'empty_skills_text',
-            'empty_experience_text',
-            'empty_projects_text',
-            'empty_education_text',
-            'trait_1_title', 'trait_1_description',
-            'trait_2_title', 'trait_2_description',
-            'trait_3_title', 'trait_3_description',
-        ]
-
-        project_allowed = [
-            'title', 'short_description', 'description', 'project_type', 'status',
-            'role', 'team_size', 'organization', 'start_date', 'end_date',
-            'technologies', 'key_features', 'challenges', 'solutions',
-            'achievements', 'learning_outcomes',
-            'github_url', 'demo_url', 'video_url', 'documentation_url',
-            'is_featured', 'is_published', 'visibility', 'display_order',
-        ]
-
-        diploma_allowed = [
-            'title', 'institution', 'level', 'field',
-            'start_date', 'end_date',
-            'honors', 'description', 'grade',
-            'visibility', 'display_order', 'is_published',
-        ]
-
-        certification_allowed = [
-            'name', 'organization', 'platform',
-            'issue_date', 'expiration_date', 'does_not_expire',
-            'credential_id', 'credential_url',
-            'description', 'skills_acquired',
-            'visibility', 'display_order', 'is_published',
-        ]
-
-        experience_allowed = [
-            'position', 'company', 'company_url', 'location',
-            'experience_type', 'start_date', 'end_date', 'is_current',
-            'description', 'missions', 'achievements', 'technologies',
-            'visibility', 'display_order', 'is_published',
-        ]
-
-        training_allowed = [
-            'title', 'organization', 'training_type', 'url',
-            'start_date', 'end_date', 'is_ongoing', 'duration_hours',
-            'description', 'skills_acquired',
-            'has_certificate', 'certificate_url',
-            'visibility', 'display_order', 'is_published',
-        ]
-
-        skill_allowed = [
-            'name', 'category', 'level', 'description', 'years_of_experience',
-            'is_primary', 'display_order',
-        ]
-
-        with transaction.atomic():
-            if import_mode == 'replace':
-                # Purge totale du contenu portfolio (ne supprime pas le compte ni le Profile)
-                # On supprime d'abord les skills pour éviter des effets de bord sur les M2M.
-                Skill.objects.filter(user=request.user).delete()
-                Project.objects.filter(user=request.user).delete()
-                Diploma.objects.filter(user=request.user).delete()
-                Certification.objects.filter(user=request.user).delete()
-                Experience.objects.filter(user=request.user).delete()
-                Training.objects.filter(user=request.user).delete()
-
-            # Profile
-            profile_data = payload.get('profile') or {}
-            profile_update = _pick(profile_data, profile_allowed)
-            if 'availability_date' in profile_update:
-                profile_update['availability_date'] = _parse_date(profile_update.get('availability_date'))
-            Profile.objects.filter(pk=request.user.profile.pk).update(**profile_update)
-
-            # Projects
-            for item in payload.get('projects') or []:
-                item_id = item.get('id')
-                defaults = _pick(item, project_allowed)
-                if item_id:
-                    Project.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Project.objects.create(user=request.user, **defaults)
-
-            # Education
-            for item in payload.get('diplomas') or []:
-                item_id = item.get('id')
-                defaults = _pick(item, diploma_allowed)
-                if item_id:
-                    Diploma.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Diploma.objects.create(user=request.user, **defaults)
-
-            for item in payload.get('certifications') or []:
-                item_id = item.get('id')
-                defaults = _pick(item, certification_allowed)
-                if 'issue_date' in defaults:
-                    defaults['issue_date'] = _parse_date(defaults.get('issue_date'))
-                if 'expiration_date' in defaults:
-                    defaults['expiration_date'] = _parse_date(defaults.get('expiration_date'))
-                if item_id:
-                    Certification.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Certification.objects.create(user=request.user, **defaults)
-
-            # Professional
-            for item in payload.get('experiences') or []:
-                item_id = item.get('id')
-                defaults = _pick(item, experience_allowed)
-                if item_id:
-                    Experience.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Experience.objects.create(user=request.user, **defaults)
-
-            for item in payload.get('trainings') or []:
-                item_id = item.get('id')
-                defaults = _pick(item, training_allowed)
-                if item_id:
-                    Training.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Training.objects.create(user=request.user, **defaults)
-
-            # Skills (create/update first, then set M2M)
-            skills_payload = payload.get('skills') or []
-            for item in skills_payload:
-                item_id = item.get('id')
-                defaults = _pick(item, skill_allowed)
-                if item_id:
-                    Skill.objects.update_or_create(id=item_id, user=request.user, defaults=defaults)
-                else:
-                    Skill.objects.create(user=request.user, **defaults)
-
-            # restore M2M relationships for skills
-            for item in skills_payload:
-                skill_id = item.get('id')
-                if not skill_id:
-                    continue
-                try:
-                    skill = Skill.objects.get(id=skill_id, user=request.user)
-                except Skill.DoesNotExist:
-                    continue
-
-                project_ids = item.get('related_projects') or []
-                cert_ids = item.get('related_certifications') or []
-                training_ids = item.get('related_trainings') or []
-
-                skill.related_projects.set(Project.objects.filter(user=request.user, id__in=project_ids))
-                skill.related_certifications.set(Certification.objects.filter(user=request.user, id__in=cert_ids))
-                skill.related_trainings.set(Training.objects.filter(user=request.user, id__in=training_ids))
-
-        return Response({'message': 'Import terminé', 'import_mode': import_mode}, status=status.HTTP_200_OK)
+        job = ImportJob.objects.create(
+            user=request.user,
+            import_mode=import_mode,
+            payload=payload,
+            total_items=count_import_items(payload),
+        )
+
+        return Response(
+            {
+                'message': "Import en file d'attente",
+                'job': ImportJobSerializer(job).data,
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+class ImportJobListView(generics.ListAPIView):
+    """Latest import jobs of the authenticated user."""
+    permission_classes = [IsAuthenticated]
+    serializer_class = ImportJobSerializer
+
+    def get_queryset(self):
+        return ImportJob.objects.filter(user=self.request.user).defer('payload')[:20]
+
+
+class ImportJobDetailView(generics.RetrieveAPIView):
+    """Progress and result of an import job (polled by the client)."""
+    permission_classes = [IsAuthenticated]
+    serializer_class = ImportJobSerializer
+
+    def get_queryset(self):
+        return ImportJob.objects.filter(user=self.request.user).defer('payload')
 
 
 class PublicProfileView(generics.RetrieveAPIView):
@@ -325,14 +246,51 @@ class PublicProfileBySlugView(generics.RetrieveAPIView):
         return Profile.objects.select_related('user').all()
     
     def retrieve(self, request, *args, **kwargs):
-        """Override retrieve to increment view counter."""
-        instance = self.get_object()
+        """Serve the pre-encoded profile from the portfolio snapshot."""
+        # Le profil public est identique pour tous les niveaux de visibilité
+        tier = PortfolioSnapshot.TIER_PUBLIC
+        payload, built_at, owner_id = get_snapshot_payload(kwargs[self.lookup_url_kwarg], tier, 'profile_payload')
+        if payload is None:
+            raise Http404("Aucun portfolio pour ce slug")
         
         # Optionnel : incrémenter un compteur de vues publiques
         # instance.increment_public_views()  # à implémenter si souhaité
         
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        validators = get_validators(built_at, tier)
+        response = get_not_modified_response(request, validators)
+        if response is None:
+            response = HttpResponse(payload, content_type='application/json')
+        return set_validators(response, validators)
+
+# ========== FULL PUBLIC PORTFOLIO BY SLUG ==========
+class PublicPortfolioBySlugView(APIView):
+    """
+    Portfolio public complet (profil + toutes les sections visibles) en une seule requête.
+    Servi depuis l'instantané pré-encodé du niveau de visibilité demandé.
+    GET /api/profile/public/slug/<str:slug>/full/
+
+    Query params:
+    - access: token recruteur (optionnel)
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        recruiter_context = get_recruiter_context(request)
+        tier = get_snapshot_tier(recruiter_context.get_visibilities())
+        payload, built_at, owner_id = get_snapshot_payload(slug, tier, 'portfolio_payload')
+        if payload is None:
+            raise Http404("Aucun portfolio pour ce slug")
+
+        # Le token recruteur ne donne accès qu'au portfolio de son propriétaire
+        if tier == PortfolioSnapshot.TIER_RECRUITER and not recruiter_context.grants_access_to(owner_id):
+            tier = PortfolioSnapshot.TIER_PUBLIC
+            payload, built_at, owner_id = get_snapshot_payload(slug, tier, 'portfolio_payload')
+
+        validators = get_validators(built_at, tier)
+        response = get_not_modified_response(request, validators)
+        if response is None:
+            response = HttpResponse(payload, content_type='application/json')
+        return set_validators(response, validators)
 
 # ========== UPLOAD PROFILE PHOTO - AVEC SCHEMA ==========
 class PhotoUploadResponseSerializer(s.Serializer):
@@ -453,6 +411,33 @@ def check_profile_completeness(request):
     }, status=status.HTTP_200_OK)
 
 
+# ========== OWNER DASHBOARD - AVEC SCHEMA ==========
+class DashboardResponseSerializer(s.Serializer):
+    """Response for the owner dashboard summary"""
+    profile = s.DictField()
+    projects = s.DictField()
+    skills = s.DictField()
+    diplomas = s.DictField()
+    certifications = s.DictField()
+    experiences = s.DictField()
+    trainings = s.DictField()
+    recruiter_access = s.DictField()
+
+class DashboardView(APIView):
+    """
+    Tous les compteurs du tableau de bord en une seule requête.
+    GET /api/profile/dashboard/
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        responses={200: DashboardResponseSerializer},
+        description="Statistiques du tableau de bord (profil, sections, accès recruteurs)"
+    )
+    def get(self, request):
+        return Response(build_dashboard_summary(request.user.profile), status=status.HTTP_200_OK)
+
+
 class DefaultProfileView(generics.RetrieveAPIView):
     """
     View to retrieve the default public profile (first found).
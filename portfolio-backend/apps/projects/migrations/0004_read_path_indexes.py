@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_is_published'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'display_order', '-start_date'], name='project_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['user', 'display_order', '-start_date', 'visibility'], name='project_public_idx'),
+        ),
+    ]
@@ -190,6 +190,16 @@ class Project(BaseModel, VisibilityMixin, OwnedModel):
         verbose_name_plural = 'Projets'
         ordering = ['display_order', '-start_date']
         db_table = 'projects_project'
+        indexes = [
+            # Liste du propriétaire
+            models.Index(fields=['user', 'display_order', '-start_date'], name='project_owner_order_idx'),
+            # Sections publiques (seuls les éléments publiés y apparaissent)
+            models.Index(
+                fields=['user', 'display_order', '-start_date', 'visibility'],
+                name='project_public_idx',
+                condition=models.Q(is_published=True),
+            ),
+        ]
     
     def __str__(self):
         return self.title
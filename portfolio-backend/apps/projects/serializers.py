@@ -8,6 +8,16 @@ from apps.core.enums import Visibility, ProjectStatus
 from .models import Project
 
 
+# Columns read by the computed fields (see DynamicFieldsMixin)
+PROJECT_FIELD_DEPENDENCIES = {
+    'duration_display': ['start_date', 'end_date', 'status'],
+    'technologies_list': ['technologies'],
+    'features_list': ['key_features'],
+    'achievements_list': ['achievements'],
+    'has_links': ['github_url', 'demo_url', 'video_url', 'documentation_url'],
+}
+
+
 class ProjectSerializer(BaseSerializer):
     """
     Complete project serializer for authenticated owner.
@@ -55,6 +65,7 @@ class ProjectSerializer(BaseSerializer):
             'created_at',
             'updated_at',
         ]
+        field_dependencies = PROJECT_FIELD_DEPENDENCIES
         read_only_fields = [
             'id',
             'created_at',
@@ -249,7 +260,7 @@ class ProjectPublicSerializer(serializers.ModelSerializer):
         ]
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(BaseSerializer):
     """
     Lightweight serializer for project lists.
     """
@@ -273,4 +284,5 @@ class ProjectListSerializer(serializers.ModelSerializer):
             'is_featured',
             'is_published',
             'visibility',
-        ]
\ No newline at end of file
+        ]
+        field_dependencies = PROJECT_FIELD_DEPENDENCIES
\ No newline at end of file
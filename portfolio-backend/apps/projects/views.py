@@ -9,6 +9,9 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
+from apps.core.cache import cached_public_action
+from apps.core.mixins import ReorderMixin, SparseFieldsetMixin
+from apps.core.pagination import OptionalCursorPagination
 from apps.core.permissions import IsOwner
 from apps.core.enums import Visibility
 from apps.core.utils import get_allowed_visibilities
@@ -49,7 +52,7 @@ from .serializers import (
         ]
     )
 )
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing projects.
     
@@ -62,7 +65,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
     - GET /api/projects/public/ - List public projects
     - GET /api/projects/featured/ - List featured projects
     """
+    reorder_key = 'projects'
+    reorder_required_message = 'Liste de projets requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     
     def get_queryset(self):
@@ -82,6 +88,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('projects.public')
     def public(self, request):
         """
         Get all public projects for a specific user.
@@ -99,7 +106,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         
         projects = Project.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
         ).order_by('display_order', '-start_date')
         
@@ -107,6 +114,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('projects.featured')
     def featured(self, request):
         """
         Get all featured public projects for a specific user.
@@ -124,7 +132,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         
         projects = Project.objects.filter(
             user_id=user_id,
-            visibility__in=get_allowed_visibilities(request),
+            visibility__in=get_allowed_visibilities(request, user_id),
             is_published=True,
             is_featured=True
         ).order_by('display_order', '-start_date')
@@ -132,34 +140,6 @@ class ProjectViewSet(viewsets.ModelViewSet):
         serializer = ProjectPublicSerializer(projects, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """
-        Reorder projects.
-        
-        Body: { "projects": [{"id": "uuid", "display_order": 0}, ...] }
-        """
-        projects_data = request.data.get('projects', [])
-        
-        if not projects_data:
-            return Response(
-                {'error': 'Liste de projets requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in projects_data:
-            project_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                project = Project.objects.get(id=project_id, user=request.user)
-                project.display_order = display_order
-                project.save(update_fields=['display_order'])
-            except Project.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-    
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Project ID')
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('proofs', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='proof',
+            name='proofs_proo_content_43582f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='proof',
+            index=models.Index(fields=['content_type', 'object_id', 'display_order', 'created_at'], name='proof_object_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proof',
+            index=models.Index(fields=['user', 'display_order', 'created_at'], name='proof_owner_order_idx'),
+        ),
+    ]
@@ -100,7 +100,11 @@ class Proof(BaseModel, VisibilityMixin, OwnedModel):
         ordering = ['display_order', 'created_at']
         db_table = 'proofs_proof'
         indexes = [
-            models.Index(fields=['content_type', 'object_id']),
+            models.Index(
+                fields=['content_type', 'object_id', 'display_order', 'created_at'],
+                name='proof_object_order_idx',
+            ),
+            models.Index(fields=['user', 'display_order', 'created_at'], name='proof_owner_order_idx'),
         ]
     
     def __str__(self):
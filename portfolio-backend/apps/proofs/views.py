@@ -13,6 +13,8 @@ from django.contrib.contenttypes.models import ContentType
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
+from apps.core.mixins import ReorderMixin, SparseFieldsetMixin
+from apps.core.pagination import OptionalCursorPagination
 from apps.core.permissions import IsOwner
 from apps.core.enums import Visibility
 from .models import Proof
@@ -51,9 +53,12 @@ from .serializers import (
         ]
     )
 )
-class ProofViewSet(viewsets.ModelViewSet):
+class ProofViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """ViewSet for managing proofs."""
+    reorder_key = 'proofs'
+    reorder_required_message = 'Liste de preuves requise'
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = OptionalCursorPagination
     parser_classes = [MultiPartParser, FormParser]
     
     def get_queryset(self):
@@ -106,27 +111,3 @@ class ProofViewSet(viewsets.ModelViewSet):
         
         serializer = self.get_serializer(proofs, many=True)
         return Response(serializer.data)
-    
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """Reorder proofs."""
-        proofs_data = request.data.get('proofs', [])
-        
-        if not proofs_data:
-            return Response(
-                {'error': 'Liste de preuves requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in proofs_data:
-            proof_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                proof = Proof.objects.get(id=proof_id, user=request.user)
-                proof.display_order = display_order
-                proof.save(update_fields=['display_order'])
-            except Proof.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
\ No newline at end of file
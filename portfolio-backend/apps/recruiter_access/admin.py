@@ -5,7 +5,9 @@ from django.contrib import admin
 from django.utils.html import format_html
 
 from apps.core.admin import BaseModelAdmin
-from .models import RecruiterLink
+from .models import RecruiterLink, with_access_counts
+from .revocations import revoked_links
+from .utils import invalidate_link_summary
 
 
 @admin.register(RecruiterLink)
@@ -19,7 +21,7 @@ class RecruiterLinkAdmin(BaseModelAdmin):
         'status_badge',
         'expires_at',
         'time_remaining_display',
-        'access_count',
+        'access_count_display',
         'last_accessed_at',
         'created_at'
     ]
@@ -40,7 +42,7 @@ class RecruiterLinkAdmin(BaseModelAdmin):
     readonly_fields = [
         'id',
         'token',
-        'access_count',
+        'access_count_display',
         'last_accessed_at',
         'created_at',
         'updated_at',
@@ -71,7 +73,7 @@ class RecruiterLinkAdmin(BaseModelAdmin):
         }),
         ('Statistiques', {
             'fields': (
-                'access_count',
+                'access_count_display',
                 'last_accessed_at'
             )
         }),
@@ -105,6 +107,14 @@ class RecruiterLinkAdmin(BaseModelAdmin):
         return obj.get_time_remaining()
     time_remaining_display.short_description = 'Temps restant'
     
+    def get_queryset(self, request):
+        return with_access_counts(super().get_queryset(request))
+    
+    def access_count_display(self, obj):
+        """Display the number of accesses (daily rollups)."""
+        return obj.get_access_count()
+    access_count_display.short_description = 'Nombre d\'accès'
+    
     def full_url_display(self, obj):
         """Display full URL with copy button."""
         url = obj.get_full_url('https://your-portfolio.com')
@@ -118,7 +128,13 @@ class RecruiterLinkAdmin(BaseModelAdmin):
     
     def revoke_selected(self, request, queryset):
         """Action to revoke selected links."""
+        links = list(queryset.values_list('id', 'user_id'))
         count = queryset.update(is_active=False)
+        # update() skips save(): revoke the signed tokens here
+        for link_id, owner_id in links:
+            revoked_links.add(link_id)
+        for owner_id in {owner_id for link_id, owner_id in links}:
+            invalidate_link_summary(owner_id)
         self.message_user(request, f'{count} lien(s) révoqué(s).')
     revoke_selected.short_description = 'Révoquer les liens sélectionnés'
     
@@ -7,4 +7,8 @@ from django.apps import AppConfig
 class RecruiterAccessConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.recruiter_access'
-    verbose_name = 'Accès Recruteurs'
\ No newline at end of file
+    verbose_name = 'Accès Recruteurs'
+    
+    def ready(self):
+        """Import signals when the app is ready."""
+        import apps.recruiter_access.signals
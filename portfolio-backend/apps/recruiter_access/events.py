@@ -0,0 +1,175 @@
+"""
+Write-behind recruiter access log.
+
+Public reads carrying a recruiter token only append an event to an
+in-memory buffer (one per worker process). A background thread
+bulk-inserts the buffer into RecruiterAccessEvent every
+RECRUITER_ACCESS_FLUSH_INTERVAL seconds and updates the links'
+last_accessed_at. The `rollup_recruiter_access` command then turns the
+events into per-link daily counts.
+"""
+import logging
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import Case, Count, DateTimeField, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.core.buffers import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+
+# Minimum delay between two recorded accesses of the same link (per process)
+ACCESS_THROTTLE = timedelta(seconds=10)
+
+# Rows per INSERT statement
+BULK_BATCH_SIZE = 500
+
+
+class AccessEventBuffer(WriteBehindBuffer):
+    """
+    Buffer of pending recruiter access events for the current process.
+    """
+
+    thread_name = 'recruiter-access-events'
+
+    def __init__(self):
+        super().__init__(lambda: settings.RECRUITER_ACCESS_FLUSH_INTERVAL)
+        self._events = []
+        self._last_recorded = {}
+
+    def add(self, link_id, accessed_at=None):
+        """
+        Buffer an access to a link (no database access).
+
+        Returns:
+            bool: False if the access was throttled
+        """
+        accessed_at = accessed_at or timezone.now()
+
+        with self._lock:
+            last_recorded = self._last_recorded.get(link_id)
+            if last_recorded is not None and accessed_at - last_recorded < ACCESS_THROTTLE:
+                return False
+
+            self._last_recorded[link_id] = accessed_at
+            self._events.append((link_id, accessed_at))
+            self._ensure_flusher()
+
+        return True
+
+    def flush(self):
+        """
+        Write the buffered events to the database.
+
+        Returns:
+            int: Number of events written
+        """
+        from .models import RecruiterAccessEvent, RecruiterLink
+
+        with self._lock:
+            events, self._events = self._events, []
+            # Forget throttling state that can no longer matter
+            horizon = timezone.now() - ACCESS_THROTTLE
+            self._last_recorded = {
+                link_id: accessed_at
+                for link_id, accessed_at in self._last_recorded.items()
+                if accessed_at > horizon
+            }
+
+        if not events:
+            return 0
+
+        last_access_by_link = {}
+        for link_id, accessed_at in events:
+            last_access_by_link[link_id] = max(accessed_at, last_access_by_link.get(link_id, accessed_at))
+
+        try:
+            with transaction.atomic():
+                # Links deleted since their access was buffered are dropped
+                existing_ids = set(RecruiterLink.objects.filter(
+                    pk__in=last_access_by_link
+                ).values_list('id', flat=True))
+
+                RecruiterAccessEvent.objects.bulk_create(
+                    [
+                        RecruiterAccessEvent(link_id=link_id, accessed_at=accessed_at)
+                        for link_id, accessed_at in events
+                        if link_id in existing_ids
+                    ],
+                    batch_size=BULK_BATCH_SIZE,
+                )
+
+                if existing_ids:
+                    RecruiterLink.objects.filter(pk__in=existing_ids).update(
+                        last_accessed_at=Case(
+                            *[
+                                When(pk=link_id, then=Value(last_access_by_link[link_id]))
+                                for link_id in existing_ids
+                            ],
+                            output_field=DateTimeField(),
+                        )
+                    )
+        except DatabaseError:
+            # Keep the events for the next flush
+            with self._lock:
+                self._events[:0] = events
+            logger.exception("Échec de l'écriture des accès recruteur")
+            return 0
+
+        return sum(1 for link_id, accessed_at in events if link_id in existing_ids)
+
+
+access_events = AccessEventBuffer()
+
+
+def rollup_access_events(since=None):
+    """
+    Recompute the daily access counts from the event log.
+
+    Every day from `since` onwards is recounted from scratch, so running
+    the rollup several times over the same days is harmless.
+
+    Args:
+        since: First day to recount (date), or None for the whole log
+
+    Returns:
+        int: Number of (link, day) rows written
+    """
+    from .models import RecruiterAccessEvent, RecruiterLink, RecruiterLinkDailyAccess
+
+    events = RecruiterAccessEvent.objects.all()
+    if since is not None:
+        start = timezone.make_aware(datetime.combine(since, time.min))
+        events = events.filter(accessed_at__gte=start)
+
+    rows = events.annotate(
+        day=TruncDate('accessed_at')
+    ).values('link_id', 'day').annotate(total=Count('id')).order_by()
+
+    daily_accesses = [
+        RecruiterLinkDailyAccess(link_id=row['link_id'], date=row['day'], count=row['total'])
+        for row in rows
+    ]
+
+    RecruiterLinkDailyAccess.objects.bulk_create(
+        daily_accesses,
+        batch_size=BULK_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['link', 'date'],
+        update_fields=['count'],
+    )
+
+    # Import inside function to avoid circular imports
+    from .utils import invalidate_link_summary
+
+    owner_ids = RecruiterLink.objects.filter(
+        pk__in={row.link_id for row in daily_accesses}
+    ).values_list('user_id', flat=True).distinct()
+    for owner_id in owner_ids:
+        invalidate_link_summary(owner_id)
+
+    return len(daily_accesses)
@@ -0,0 +1,38 @@
+"""
+Roll up the recruiter access events into per-link daily counts
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.recruiter_access.events import access_events, rollup_access_events
+
+
+class Command(BaseCommand):
+    help = "Agrège les accès recruteur en compteurs quotidiens par lien."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=2,
+            help="Nombre de jours recomptés, aujourd'hui compris (défaut: 2)"
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help="Recompter tout l'historique des accès"
+        )
+
+    def handle(self, *args, **options):
+        # Events buffered by this process (e.g. a shell) are written first
+        access_events.flush()
+
+        since = None
+        if not options['all']:
+            since = timezone.localdate() - timedelta(days=max(options['days'], 1) - 1)
+
+        count = rollup_access_events(since)
+
+        self.stdout.write(self.style.SUCCESS(f"{count} compteur(s) quotidien(s) mis à jour"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.5 on 2026-10-18 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_access', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruiterlink',
+            name='token_expires_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text="Date d'expiration inscrite dans le token signé (vide pour les anciens tokens)", null=True, verbose_name='Expiration signée'),
+        ),
+        migrations.AlterField(
+            model_name='recruiterlink',
+            name='token',
+            field=models.CharField(help_text='Token sécurisé unique', max_length=128, unique=True, verbose_name='Token'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.5 on 2026-10-18 01:54
+
+import django.db.models.deletion
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def move_access_counts_to_rollups(apps, schema_editor):
+    """
+    Keep the accesses counted before the event log as one daily row per link.
+
+    The row is dated at most yesterday, so that rolling up the new events
+    (which start today) never overwrites it.
+    """
+    RecruiterLink = apps.get_model('recruiter_access', 'RecruiterLink')
+    RecruiterLinkDailyAccess = apps.get_model('recruiter_access', 'RecruiterLinkDailyAccess')
+
+    yesterday = timezone.localdate() - timedelta(days=1)
+    daily_accesses = []
+
+    for link in RecruiterLink.objects.filter(access_count__gt=0).iterator():
+        last_access = link.last_accessed_at or link.created_at
+        daily_accesses.append(RecruiterLinkDailyAccess(
+            link_id=link.id,
+            date=min(timezone.localdate(last_access), yesterday),
+            count=link.access_count,
+        ))
+
+    RecruiterLinkDailyAccess.objects.bulk_create(daily_accesses, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_access', '0002_signed_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecruiterAccessEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('accessed_at', models.DateTimeField(verbose_name="Date d'accès")),
+                ('link', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='access_events', to='recruiter_access.recruiterlink', verbose_name='Lien')),
+            ],
+            options={
+                'verbose_name': 'Accès recruteur',
+                'verbose_name_plural': 'Accès recruteurs',
+                'db_table': 'recruiter_access_event',
+                'indexes': [models.Index(fields=['accessed_at'], name='recruiter_event_date_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='RecruiterLinkDailyAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Jour')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name="Nombre d'accès")),
+                ('link', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_accesses', to='recruiter_access.recruiterlink', verbose_name='Lien')),
+            ],
+            options={
+                'verbose_name': 'Accès recruteur par jour',
+                'verbose_name_plural': 'Accès recruteurs par jour',
+                'db_table': 'recruiter_access_daily',
+                'ordering': ['-date'],
+                'constraints': [models.UniqueConstraint(fields=('link', 'date'), name='recruiter_daily_link_date_uniq')],
+            },
+        ),
+        migrations.RunPython(move_access_counts_to_rollups, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='recruiterlink',
+            name='access_count',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.5 on 2026-10-18 01:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_access', '0003_access_event_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='recruiterlink',
+            index=models.Index(fields=['user', 'is_active', 'expires_at'], name='recruiter_link_state_idx'),
+        ),
+    ]
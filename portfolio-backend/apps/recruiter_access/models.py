@@ -1,13 +1,13 @@
 """
 Models for recruiter access links
 """
-import secrets
 from django.db import models
+from django.db.models import Sum
 from django.conf import settings
 from django.utils import timezone
-from datetime import timedelta
 
 from apps.core.models import BaseModel
+from .tokens import make_signed_token
 
 
 class RecruiterLink(BaseModel):
@@ -31,12 +31,20 @@ class RecruiterLink(BaseModel):
     # ===== TOKEN =====
     
     token = models.CharField(
-        max_length=64,
+        max_length=128,
         unique=True,
         verbose_name='Token',
         help_text='Token sécurisé unique'
     )
     
+    token_expires_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name='Expiration signée',
+        help_text='Date d\'expiration inscrite dans le token signé (vide pour les anciens tokens)'
+    )
+    
     # ===== INFORMATIONS =====
     
     name = models.CharField(
@@ -66,12 +74,6 @@ class RecruiterLink(BaseModel):
     
     # ===== TRACKING =====
     
-    access_count = models.PositiveIntegerField(
-        default=0,
-        verbose_name='Nombre d\'accès',
-        help_text='Nombre de fois que ce lien a été utilisé'
-    )
-    
     last_accessed_at = models.DateTimeField(
         blank=True,
         null=True,
@@ -84,14 +86,22 @@ class RecruiterLink(BaseModel):
         verbose_name_plural = 'Liens Recruteurs'
         ordering = ['-created_at']
         db_table = 'recruiter_access_link'
+        indexes = [
+            models.Index(fields=['user', 'is_active', 'expires_at'], name='recruiter_link_state_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.user.email})"
     
-    @classmethod
-    def generate_token(cls):
-        """Generate a secure random token."""
-        return secrets.token_urlsafe(48)
+    def generate_token(self):
+        """Generate the signed token of the link (see tokens.py)."""
+        return make_signed_token(self.id, self.user_id, self.expires_at)
+    
+    def is_token_revoked(self):
+        """Check if the signed token must no longer be trusted on its own."""
+        if self.token_expires_at is None:
+            return False
+        return not self.is_active or self.expires_at < self.token_expires_at
     
     def is_valid(self):
         """Check if the link is still valid."""
@@ -112,15 +122,16 @@ class RecruiterLink(BaseModel):
         self.is_active = False
         self.save(update_fields=['is_active'])
     
-    def increment_access(self):
-        """Increment access counter and update last access time."""
-        if not self.last_accessed_at:
-            self.last_accessed_at = timezone.now()
-            self.save(update_fields=['last_accessed_at'])
-        if timezone.now() > self.last_accessed_at + timedelta(seconds=10): 
-            self.access_count += 1
-            self.last_accessed_at = timezone.now()
-            self.save(update_fields=['access_count', 'last_accessed_at'])
+    def get_access_count(self):
+        """
+        Total number of accesses, read from the daily rollups.
+        
+        Uses the `total_accesses` annotation when the queryset provides it
+        (see with_access_counts). Accesses not rolled up yet aren't counted.
+        """
+        if hasattr(self, 'total_accesses'):
+            return self.total_accesses or 0
+        return self.daily_accesses.aggregate(total=Sum('count'))['total'] or 0
     
     def get_full_url(self, base_url):
         """
@@ -155,4 +166,82 @@ class RecruiterLink(BaseModel):
         """Override save to auto-generate token."""
         if not self.token:
             self.token = self.generate_token()
-        super().save(*args, **kwargs)
\ No newline at end of file
+            self.token_expires_at = self.expires_at
+        super().save(*args, **kwargs)
+        
+        from .revocations import revoked_links
+        if self.is_token_revoked():
+            revoked_links.add(self.id)
+        elif self.token_expires_at is not None:
+            revoked_links.add_live(self.id)
+
+
+def with_access_counts(queryset):
+    """Annotate a RecruiterLink queryset with `total_accesses`."""
+    return queryset.annotate(total_accesses=Sum('daily_accesses__count'))
+
+
+class RecruiterAccessEvent(models.Model):
+    """
+    One access to a recruiter link.
+    
+    Append-only log: events are buffered and bulk-inserted by
+    apps.recruiter_access.events, then rolled up into RecruiterLinkDailyAccess
+    by the `rollup_recruiter_access` command.
+    """
+    
+    link = models.ForeignKey(
+        RecruiterLink,
+        on_delete=models.CASCADE,
+        related_name='access_events',
+        verbose_name='Lien'
+    )
+    
+    accessed_at = models.DateTimeField(
+        verbose_name='Date d\'accès'
+    )
+    
+    class Meta:
+        verbose_name = 'Accès recruteur'
+        verbose_name_plural = 'Accès recruteurs'
+        db_table = 'recruiter_access_event'
+        indexes = [
+            models.Index(fields=['accessed_at'], name='recruiter_event_date_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.link_id} @ {self.accessed_at}"
+
+
+class RecruiterLinkDailyAccess(models.Model):
+    """
+    Number of accesses to a recruiter link on one day (rollup of the events).
+    """
+    
+    link = models.ForeignKey(
+        RecruiterLink,
+        on_delete=models.CASCADE,
+        related_name='daily_accesses',
+        verbose_name='Lien'
+    )
+    
+    date = models.DateField(
+        verbose_name='Jour'
+    )
+    
+    count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Nombre d\'accès'
+    )
+    
+    class Meta:
+        verbose_name = 'Accès recruteur par jour'
+        verbose_name_plural = 'Accès recruteurs par jour'
+        ordering = ['-date']
+        db_table = 'recruiter_access_daily'
+        constraints = [
+            models.UniqueConstraint(fields=['link', 'date'], name='recruiter_daily_link_date_uniq'),
+        ]
+    
+    def __str__(self):
+        return f"{self.link_id} - {self.date}: {self.count}"
@@ -0,0 +1,81 @@
+"""
+In-memory revocation set for signed recruiter tokens.
+
+A signed token stays cryptographically valid until its expiry, so links
+that were revoked, or whose expiry was moved earlier, are listed here
+and checked against the database instead. Links that no longer exist
+(deleted) are treated as revoked too: the set also keeps the ids of the
+live links, and a token whose link isn't among them is checked against
+the database (links created by another process since the last reload
+are found there). Each worker process keeps its own copy of the sets,
+reloaded at most every RECRUITER_REVOCATION_REFRESH_INTERVAL seconds.
+Changes made by the current process are applied to its copy immediately.
+
+Only links whose signed token hasn't expired yet are listed, which
+keeps the sets small: a set of UUIDs is compact enough that a Bloom
+filter isn't worth its false positives here.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+
+class RevocationSet:
+    """
+    Ids of the links whose signed tokens can't be trusted on their own.
+    """
+
+    def __init__(self):
+        self._link_ids = frozenset()
+        self._live_ids = frozenset()
+        self._loaded_at = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, link_id):
+        self._refresh_if_stale()
+        return link_id in self._link_ids or link_id not in self._live_ids
+
+    def add(self, link_id):
+        """Revoke a link's signed token in this process right away."""
+        with self._lock:
+            self._link_ids = self._link_ids | {link_id}
+
+    def add_live(self, link_id):
+        """Trust a link created or reactivated by this process right away."""
+        with self._lock:
+            self._live_ids = self._live_ids | {link_id}
+            self._link_ids = self._link_ids - {link_id}
+
+    def refresh(self):
+        """Reload the sets from the database (one query)."""
+        from .models import RecruiterLink
+
+        rows = RecruiterLink.objects.filter(
+            token_expires_at__gt=timezone.now()
+        ).annotate(
+            revoked=Q(is_active=False) | Q(expires_at__lt=F('token_expires_at'))
+        ).values_list('id', 'revoked')
+
+        live_ids = set()
+        link_ids = set()
+        for link_id, revoked in rows:
+            live_ids.add(link_id)
+            if revoked:
+                link_ids.add(link_id)
+
+        with self._lock:
+            self._link_ids = frozenset(link_ids)
+            self._live_ids = frozenset(live_ids)
+            self._loaded_at = time.monotonic()
+
+    def _refresh_if_stale(self):
+        loaded_at = self._loaded_at
+        interval = settings.RECRUITER_REVOCATION_REFRESH_INTERVAL
+        if loaded_at is None or time.monotonic() - loaded_at >= interval:
+            self.refresh()
+
+
+revoked_links = RevocationSet()
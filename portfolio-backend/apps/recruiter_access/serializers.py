@@ -16,6 +16,7 @@ class RecruiterLinkSerializer(BaseSerializer):
     is_valid = serializers.BooleanField(read_only=True)
     is_expired = serializers.BooleanField(read_only=True)
     time_remaining = serializers.CharField(source='get_time_remaining', read_only=True)
+    access_count = serializers.IntegerField(source='get_access_count', read_only=True)
     
     class Meta:
         model = RecruiterLink
@@ -91,13 +92,14 @@ class RecruiterLinkCreateSerializer(serializers.ModelSerializer):
         )
 
 
-class RecruiterLinkListSerializer(serializers.ModelSerializer):
+class RecruiterLinkListSerializer(BaseSerializer):
     """
     Lightweight serializer for link lists.
     """
     is_valid = serializers.BooleanField(read_only=True)
     is_expired = serializers.BooleanField(read_only=True)
     time_remaining = serializers.CharField(source='get_time_remaining', read_only=True)
+    access_count = serializers.IntegerField(source='get_access_count', read_only=True)
     
     class Meta:
         model = RecruiterLink
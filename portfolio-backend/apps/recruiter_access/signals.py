@@ -0,0 +1,27 @@
+"""
+Signals keeping the recruiter link statistics cache up to date
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import RecruiterLink
+from .revocations import revoked_links
+from .utils import invalidate_link_summary
+
+
+@receiver(post_save, sender=RecruiterLink, dispatch_uid='recruiter_summary_on_save')
+@receiver(post_delete, sender=RecruiterLink, dispatch_uid='recruiter_summary_on_delete')
+def refresh_link_summary(sender, instance, **kwargs):
+    """
+    Invalidate the owner's cached link statistics when a link is written.
+    """
+    invalidate_link_summary(instance.user_id)
+
+
+@receiver(post_delete, sender=RecruiterLink, dispatch_uid='recruiter_revoke_on_delete')
+def revoke_deleted_link(sender, instance, **kwargs):
+    """
+    Stop trusting the signed token of a deleted link in this process
+    (other processes drop it from their live links on their next reload).
+    """
+    revoked_links.add(instance.id)
@@ -0,0 +1,30 @@
+"""
+Tests for the recruiter access utilities
+"""
+import uuid
+
+from apps.recruiter_access.utils import RecruiterContext
+
+
+def test_grants_access_to_compares_uuids():
+    owner_id = uuid.uuid4()
+    context = RecruiterContext(token='jeton', link_id=uuid.uuid4(), owner_id=str(owner_id))
+
+    assert context.grants_access_to(owner_id)
+    assert context.grants_access_to(str(owner_id).upper())
+    assert context.grants_access_to(owner_id.hex)
+    assert not context.grants_access_to(uuid.uuid4())
+
+
+def test_grants_access_to_rejects_malformed_ids():
+    context = RecruiterContext(token='jeton', link_id=uuid.uuid4(), owner_id=str(uuid.uuid4()))
+
+    assert not context.grants_access_to(None)
+    assert not context.grants_access_to('pas-un-uuid')
+    assert not RecruiterContext(token='jeton', link_id=uuid.uuid4(), owner_id='None').grants_access_to('None')
+
+
+def test_invalid_token_grants_no_access():
+    owner_id = uuid.uuid4()
+
+    assert not RecruiterContext(token='jeton', owner_id=owner_id).grants_access_to(owner_id)
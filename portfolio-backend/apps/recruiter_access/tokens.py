@@ -0,0 +1,82 @@
+"""
+Signed recruiter access tokens.
+
+A signed token carries the link id, the owner id and the expiry date,
+authenticated by an HMAC built from SECRET_KEY, so it can be checked
+without any database query:
+
+    <link id hex><owner id hex><expiry timestamp hex>.<signature>
+
+Tokens issued before this format (plain secrets.token_urlsafe strings)
+never contain a '.' and are still checked against the database.
+"""
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from typing import NamedTuple
+
+from django.core import signing
+
+
+TOKEN_SALT = 'apps.recruiter_access.tokens'
+TOKEN_SEPARATOR = '.'
+
+_UUID_HEX_LENGTH = 32
+
+
+class SignedToken(NamedTuple):
+    """Claims of a verified signed token."""
+    link_id: uuid.UUID
+    owner_id: uuid.UUID
+    expires_at: datetime
+
+
+def _get_signer():
+    return signing.Signer(salt=TOKEN_SALT, sep=TOKEN_SEPARATOR)
+
+
+def is_signed_token(token):
+    """Tell signed tokens apart from legacy opaque tokens."""
+    return TOKEN_SEPARATOR in token
+
+
+def make_signed_token(link_id, owner_id, expires_at):
+    """
+    Build the signed token of a recruiter link.
+
+    Args:
+        link_id: UUID of the RecruiterLink
+        owner_id: UUID of the portfolio owner
+        expires_at: Expiry date of the link
+
+    Returns:
+        str: Signed token (at most 116 characters)
+    """
+    value = f"{link_id.hex}{owner_id.hex}{int(expires_at.timestamp()):x}"
+    return _get_signer().sign(value)
+
+
+def read_signed_token(token):
+    """
+    Verify a signed token and return its claims (no database access).
+
+    The expiry date is returned, not checked.
+
+    Returns:
+        SignedToken, or None if the token is not a valid signed token
+    """
+    try:
+        value = _get_signer().unsign(token)
+    except signing.BadSignature:
+        return None
+
+    try:
+        link_id = uuid.UUID(hex=value[:_UUID_HEX_LENGTH])
+        owner_id = uuid.UUID(hex=value[_UUID_HEX_LENGTH:2 * _UUID_HEX_LENGTH])
+        expires_at = datetime.fromtimestamp(
+            int(value[2 * _UUID_HEX_LENGTH:], 16),
+            tz=dt_timezone.utc
+        )
+    except (ValueError, OverflowError):
+        return None
+
+    return SignedToken(link_id, owner_id, expires_at)
@@ -1,7 +1,71 @@
 """
 Utility functions for recruiter access
 """
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from apps.core.enums import Visibility
+from apps.core.utils import on_commit_once
+from .events import access_events
 from .models import RecruiterLink
+from .revocations import revoked_links
+from .tokens import is_signed_token, read_signed_token
+
+
+# Request header accepted as an alternative to the 'access' query param
+RECRUITER_TOKEN_HEADER = 'HTTP_X_RECRUITER_TOKEN'
+
+
+def resolve_recruiter_token(token):
+    """
+    Resolve a recruiter access token to its link.
+    
+    Signed tokens are checked without any database query, unless their
+    link is in the revocation set or their signed expiry has passed (the
+    owner may have extended the link since). Legacy opaque tokens are
+    looked up in the database.
+    
+    Args:
+        token: The token string to resolve
+    
+    Returns:
+        (link_id, owner_id) tuple if the token is valid, None otherwise
+    """
+    if not token:
+        return None
+    
+    if is_signed_token(token):
+        claims = read_signed_token(token)
+        if claims is None:
+            return None
+        
+        if claims.expires_at > timezone.now() and claims.link_id not in revoked_links:
+            return claims.link_id, claims.owner_id
+    
+    link = RecruiterLink.objects.filter(token=token).only(
+        'id', 'user_id', 'is_active', 'expires_at'
+    ).first()
+    
+    if link is None or not link.is_valid():
+        return None
+    
+    return link.id, link.user_id
+
+
+def record_recruiter_access(link_id):
+    """
+    Record an access to a recruiter link in the access log.
+    
+    Buffered in memory and written in batches (see events.py): no
+    database access on the request path.
+    """
+    access_events.add(link_id)
 
 
 def validate_recruiter_token(token):
@@ -14,22 +78,14 @@ def validate_recruiter_token(token):
     Returns:
         bool: True if token is valid, False otherwise
     """
-    if not token:
+    resolved = resolve_recruiter_token(token)
+    if resolved is None:
         return False
     
-    try:
-        link = RecruiterLink.objects.get(token=token)
-        
-        # Check if link is valid
-        if not link.is_valid():
-            return False
-        
-        # Increment access counter
-        link.increment_access()
-        
-        return True
-    except RecruiterLink.DoesNotExist:
-        return False
+    link_id, owner_id = resolved
+    record_recruiter_access(link_id)
+    
+    return True
 
 
 def get_recruiter_link_by_token(token):
@@ -48,4 +104,138 @@ def get_recruiter_link_by_token(token):
             return link
         return None
     except RecruiterLink.DoesNotExist:
-        return None
\ No newline at end of file
+        return None
+
+
+class RecruiterContext:
+    """
+    Recruiter access of one request: the token sent, and the link and
+    portfolio owner it resolved to (both None if the token is missing or
+    invalid). Built once per request by get_recruiter_context.
+    """
+    
+    def __init__(self, token=None, link_id=None, owner_id=None):
+        self.token = token
+        self.link_id = link_id
+        self.owner_id = owner_id
+    
+    @property
+    def is_valid(self):
+        return self.link_id is not None
+    
+    @cached_property
+    def link(self):
+        """RecruiterLink instance (fetched on first use), or None."""
+        if not self.is_valid:
+            return None
+        return RecruiterLink.objects.filter(pk=self.link_id).first()
+    
+    def grants_access_to(self, owner_id):
+        """
+        Check if the token unlocks 'Recruteur' content of this owner.
+        
+        Ids are compared as UUIDs (whatever their case or form); a
+        malformed id grants no access.
+        """
+        if not self.is_valid:
+            return False
+        try:
+            return uuid.UUID(str(owner_id)) == uuid.UUID(str(self.owner_id))
+        except ValueError:
+            return False
+    
+    def get_visibilities(self, owner_id=None):
+        """
+        Return the visibilities this request may read.
+        
+        Args:
+            owner_id: Owner of the content read. When None, a valid token
+                unlocks 'Recruteur' content whatever its owner.
+        """
+        visibilities = [Visibility.PUBLIC]
+        
+        if self.is_valid and (owner_id is None or self.grants_access_to(owner_id)):
+            visibilities.append(Visibility.RECRUTEUR)
+        
+        return visibilities
+
+
+def get_recruiter_context(request):
+    """
+    Return the recruiter context of a request, resolving it on first use.
+    
+    The token is read from the 'access' query param or the
+    X-Recruiter-Token header. It is validated (and its access recorded)
+    at most once per request, however many views, permissions or
+    objects ask for it.
+    
+    Args:
+        request: Django HttpRequest or DRF Request
+    
+    Returns:
+        RecruiterContext
+    """
+    http_request = getattr(request, '_request', request)
+    context = getattr(http_request, 'recruiter_context', None)
+    
+    if context is None:
+        token = http_request.GET.get('access') or http_request.META.get(RECRUITER_TOKEN_HEADER)
+        resolved = resolve_recruiter_token(token)
+        
+        if resolved is None:
+            context = RecruiterContext(token)
+        else:
+            link_id, owner_id = resolved
+            record_recruiter_access(link_id)
+            context = RecruiterContext(token, link_id, owner_id)
+        
+        http_request.recruiter_context = context
+    
+    return context
+
+
+def _summary_key(user_id):
+    return f"recruiter:summary:{user_id}"
+
+
+def get_link_summary(user_id):
+    """
+    Return the statistics of a user's recruiter links.
+    
+    Computed with one aggregate query, and cached for
+    RECRUITER_SUMMARY_CACHE_TIMEOUT seconds (0 disables the cache).
+    Link writes and access rollups invalidate it; the timeout bounds how
+    late links that expire on their own are counted as expired.
+    
+    Returns:
+        dict with total_links, active_links, expired_links and total_accesses
+    """
+    timeout = settings.RECRUITER_SUMMARY_CACHE_TIMEOUT
+    key = _summary_key(user_id)
+    
+    if timeout:
+        summary = cache.get(key)
+        if summary is not None:
+            return summary
+    
+    now = timezone.now()
+    # distinct: the join on the daily rollups repeats each link once per day
+    summary = RecruiterLink.objects.filter(user_id=user_id).aggregate(
+        total_links=Count('id', distinct=True),
+        active_links=Count('id', filter=Q(is_active=True), distinct=True),
+        expired_links=Count('id', filter=Q(expires_at__lt=now), distinct=True),
+        total_accesses=Coalesce(Sum('daily_accesses__count'), 0),
+    )
+    
+    if timeout:
+        cache.set(key, summary, timeout)
+    
+    return summary
+
+
+def invalidate_link_summary(user_id):
+    """Drop a user's cached link statistics once the current transaction commits."""
+    if not user_id:
+        return
+    
+    on_commit_once(('recruiter_summary', user_id), lambda: cache.delete(_summary_key(user_id)))
@@ -1,6 +1,7 @@
 """
 Views for recruiter access management
 """
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -8,7 +9,10 @@ from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
-from .models import RecruiterLink
+from apps.core.mixins import SparseFieldsetMixin
+from apps.core.pagination import OptionalCursorPagination
+from .models import RecruiterLink, with_access_counts
+from .utils import get_link_summary, record_recruiter_access, resolve_recruiter_token
 from .serializers import (
     RecruiterLinkSerializer,
     RecruiterLinkCreateSerializer,
@@ -44,13 +48,18 @@ from .serializers import (
         ]
     )
 )
-class RecruiterLinkViewSet(viewsets.ModelViewSet):
+class RecruiterLinkViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """ViewSet for managing recruiter access links."""
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalCursorPagination
+    # Les liens n'ont pas d'ordre d'affichage: les plus récents d'abord
+    cursor_ordering = ('-created_at', '-id')
     
     def get_queryset(self):
         """Return links for the authenticated user."""
-        return RecruiterLink.objects.filter(user=self.request.user).order_by('-created_at')
+        return with_access_counts(
+            RecruiterLink.objects.filter(user=self.request.user)
+        ).order_by('-created_at')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -104,6 +113,19 @@ class RecruiterLinkViewSet(viewsets.ModelViewSet):
             'is_active': link.is_active
         }, status=status.HTTP_200_OK)
     
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='RecruiterLink ID')
+        ]
+    )
+    @action(detail=True, methods=['get'])
+    def accesses(self, request, pk=None):
+        """Get the daily access history of a link (most recent first)."""
+        link = self.get_object()
+        daily_accesses = link.daily_accesses.values('date', 'count')
+        
+        return Response(list(daily_accesses), status=status.HTTP_200_OK)
+    
     @action(detail=False, methods=['post'], permission_classes=[])
     def validate(self, request):
         """Validate a recruiter token (public endpoint)."""
@@ -115,58 +137,46 @@ class RecruiterLinkViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            link = RecruiterLink.objects.get(token=token)
-            
-            if not link.is_active:
-                return Response({
-                    'valid': False,
-                    'message': 'Ce lien a été désactivé.'
-                }, status=status.HTTP_200_OK)
-                
-            if link.is_expired():
-                return Response({
-                    'valid': False,
-                    'expired': True,
-                    'message': 'Ce lien a expiré.'
-                }, status=status.HTTP_200_OK)
-            
-            # Increment access counter
-            link.increment_access()
+        resolved = resolve_recruiter_token(token)
+        if resolved is not None:
+            link_id, owner_id = resolved
+            record_recruiter_access(link_id)
             
             return Response({
                 'valid': True,
-                'user_id': str(link.user.id)
+                'user_id': str(owner_id)
+            }, status=status.HTTP_200_OK)
+        
+        # Invalid token: look the link up to tell the recruiter why
+        link = RecruiterLink.objects.filter(token=token).first()
+        
+        if link is not None and not link.is_active:
+            return Response({
+                'valid': False,
+                'message': 'Ce lien a été désactivé.'
             }, status=status.HTTP_200_OK)
             
-        except RecruiterLink.DoesNotExist:
+        if link is not None and link.is_expired():
             return Response({
                 'valid': False,
-                'message': 'Lien invalide.'
+                'expired': True,
+                'message': 'Ce lien a expiré.'
             }, status=status.HTTP_200_OK)
+        
+        return Response({
+            'valid': False,
+            'message': 'Lien invalide.'
+        }, status=status.HTTP_200_OK)
     
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get only active and valid links."""
-        links = self.get_queryset().filter(is_active=True)
-        valid_links = [link for link in links if link.is_valid()]
+        links = self.get_queryset().filter(is_active=True, expires_at__gte=timezone.now())
         
-        serializer = RecruiterLinkListSerializer(valid_links, many=True)
+        serializer = RecruiterLinkListSerializer(links, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """Get statistics about recruiter links."""
-        links = self.get_queryset()
-        
-        total = links.count()
-        active = links.filter(is_active=True).count()
-        expired = sum(1 for link in links if link.is_expired())
-        total_accesses = sum(link.access_count for link in links)
-        
-        return Response({
-            'total_links': total,
-            'active_links': active,
-            'expired_links': expired,
-            'total_accesses': total_accesses,
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(get_link_summary(request.user.id), status=status.HTTP_200_OK)
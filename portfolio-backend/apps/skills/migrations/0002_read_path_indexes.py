@@ -0,0 +1,26 @@
+# Generated by Django 5.1.5 on 2026-10-18 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('education', '0003_read_path_indexes'),
+        ('professional', '0003_read_path_indexes'),
+        ('projects', '0004_read_path_indexes'),
+        ('skills', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['user', 'display_order', 'category', 'name'], name='skill_owner_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['user', 'display_order', 'name'], name='skill_public_order_idx'),
+        ),
+    ]
@@ -105,29 +105,62 @@ class Skill(BaseModel, OwnedModel):
         ordering = ['display_order', 'category', 'name']
         unique_together = ['user', 'name']
         db_table = 'skills_skill'
+        indexes = [
+            models.Index(fields=['user', 'display_order', 'category', 'name'], name='skill_owner_order_idx'),
+            # Portfolio public et compétences principales
+            models.Index(fields=['user', 'display_order', 'name'], name='skill_public_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_level_display()})"
     
+    def _get_prefetched(self, relation):
+        """Return the prefetched objects of a relation, or None if not prefetched."""
+        prefetched = getattr(self, '_prefetched_objects_cache', {})
+        if relation in prefetched:
+            return list(prefetched[relation])
+        return None
+    
     def get_justifications_count(self):
-        """Return the total number of justifications."""
-        return (
-            self.related_projects.count() +
-            self.related_certifications.count() +
-            self.related_trainings.count()
-        )
+        """
+        Return the total number of justifications.
+        
+        Uses the `justifications_total` annotation or the prefetched
+        relations when present (see skills.utils.with_justifications).
+        """
+        if hasattr(self, 'justifications_total'):
+            return self.justifications_total
+        
+        total = 0
+        for relation in ('related_projects', 'related_certifications', 'related_trainings'):
+            prefetched = self._get_prefetched(relation)
+            if prefetched is not None:
+                total += len(prefetched)
+            else:
+                total += getattr(self, relation).count()
+        return total
     
     def get_justifications(self):
         """
         Return all justifications for this skill.
-        
         Returns a dict with projects, certifications, and trainings.
         """
-        return {
-            'projects': list(self.related_projects.values('id', 'title')),
-            'certifications': list(self.related_certifications.values('id', 'name')),
-            'trainings': list(self.related_trainings.values('id', 'title'))
-        }
+        justifications = {}
+        
+        for key, relation, label in (
+            ('projects', 'related_projects', 'title'),
+            ('certifications', 'related_certifications', 'name'),
+            ('trainings', 'related_trainings', 'title'),
+        ):
+            prefetched = self._get_prefetched(relation)
+            if prefetched is not None:
+                justifications[key] = [
+                    {'id': obj.id, label: getattr(obj, label)} for obj in prefetched
+                ]
+            else:
+                justifications[key] = list(getattr(self, relation).values('id', label))
+        
+        return justifications
     
     @property
     def has_justifications(self):
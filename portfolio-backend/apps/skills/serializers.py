@@ -134,7 +134,7 @@ class SkillPublicSerializer(serializers.ModelSerializer):
         ]
 
 
-class SkillListSerializer(serializers.ModelSerializer):
+class SkillListSerializer(BaseSerializer):
     """
     Lightweight serializer for skill lists.
     """
@@ -0,0 +1,52 @@
+"""
+Tests for the skill statistics endpoint
+"""
+import datetime
+
+import pytest
+
+from apps.core.enums import SkillCategory, SkillLevel
+from apps.education.models import Certification
+from apps.skills.models import Skill
+
+
+@pytest.fixture
+def skills(user):
+    certification = Certification.objects.create(
+        user=user,
+        name='AWS Solutions Architect',
+        organization='AWS',
+        issue_date=datetime.date(2024, 1, 1),
+    )
+    categories = [SkillCategory.LANGAGE, SkillCategory.FRAMEWORK, SkillCategory.OUTIL]
+    levels = [SkillLevel.DEBUTANT, SkillLevel.INTERMEDIAIRE, SkillLevel.EXPERT]
+
+    skills = []
+    for index in range(9):
+        skill = Skill.objects.create(
+            user=user,
+            name=f'Compétence {index}',
+            category=categories[index % 3],
+            level=levels[index // 3],
+            is_primary=index < 2,
+        )
+        if index % 2 == 0:
+            skill.related_certifications.add(certification)
+        skills.append(skill)
+    return skills
+
+
+@pytest.mark.django_db
+def test_statistics_query_count(client, skills, django_assert_max_num_queries):
+    # User lookup (JWT) + one aggregate
+    with django_assert_max_num_queries(2):
+        response = client.get('/api/skills/statistics/')
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {'total', 'primary', 'by_category', 'by_level', 'with_justifications'}
+    assert data['total'] == 9
+    assert data['primary'] == 2
+    assert data['with_justifications'] == 5
+    assert sum(data['by_category'].values()) == 9
+    assert sum(data['by_level'].values()) == 9
@@ -0,0 +1,127 @@
+"""
+Utility functions for the skills app
+"""
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.core.enums import SkillCategory, SkillLevel
+
+
+def group_skills_by_category(skills):
+    """
+    Group skills by category in a single pass.
+
+    Args:
+        skills: Iterable of skills, already in display order (evaluated once)
+
+    Returns:
+        List of groups in SkillCategory order (empty categories left out),
+        shaped for SkillGroupedSerializer
+    """
+    skills_by_category = {}
+    for skill in skills:
+        skills_by_category.setdefault(skill.category, []).append(skill)
+
+    return [
+        {
+            'category': category_code,
+            'category_display': category_name,
+            'skills': skills_by_category[category_code],
+            'count': len(skills_by_category[category_code]),
+        }
+        for category_code, category_name in SkillCategory.choices
+        if category_code in skills_by_category
+    ]
+
+
+def _count_links(through):
+    """Subquery counting the rows of an M2M through table for the outer skill."""
+    return Coalesce(
+        Subquery(
+            through.objects.filter(
+                skill_id=OuterRef('pk')
+            ).order_by().values('skill_id').annotate(total=Count('pk')).values('total')
+        ),
+        0
+    )
+
+
+def with_justifications(queryset, prefetch=True):
+    """
+    Load the justifications of a Skill queryset without per-skill queries.
+
+    Annotates `justifications_total` (one count subquery per relation)
+    and, unless `prefetch` is False, prefetches the related projects,
+    certifications and trainings with only the fields shown in
+    Skill.get_justifications. The model methods use both when present.
+    """
+    # Import inside function to avoid circular imports
+    from apps.education.models import Certification
+    from apps.professional.models import Training
+    from apps.projects.models import Project
+    from .models import Skill
+
+    queryset = queryset.annotate(
+        justifications_total=(
+            _count_links(Skill.related_projects.through) +
+            _count_links(Skill.related_certifications.through) +
+            _count_links(Skill.related_trainings.through)
+        )
+    )
+
+    if prefetch:
+        queryset = queryset.prefetch_related(
+            Prefetch('related_projects', queryset=Project.objects.only('id', 'title')),
+            Prefetch('related_certifications', queryset=Certification.objects.only('id', 'name')),
+            Prefetch('related_trainings', queryset=Training.objects.only('id', 'title')),
+        )
+
+    return queryset
+
+
+def get_skill_statistics(user_id):
+    """
+    Compute the statistics of a user's skills with one aggregate query.
+
+    Returns:
+        dict with total, primary, by_category and by_level (display names,
+        empty entries left out) and with_justifications
+    """
+    # Import inside function to avoid circular imports
+    from .models import Skill
+
+    has_justifications = (
+        Exists(Skill.related_projects.through.objects.filter(skill_id=OuterRef('pk'))) |
+        Exists(Skill.related_certifications.through.objects.filter(skill_id=OuterRef('pk'))) |
+        Exists(Skill.related_trainings.through.objects.filter(skill_id=OuterRef('pk')))
+    )
+
+    counts = Skill.objects.filter(user_id=user_id).aggregate(
+        total=Count('id'),
+        primary=Count('id', filter=Q(is_primary=True)),
+        with_justifications=Count('id', filter=has_justifications),
+        **{
+            f'category_{code}': Count('id', filter=Q(category=code))
+            for code, name in SkillCategory.choices
+        },
+        **{
+            f'level_{code}': Count('id', filter=Q(level=code))
+            for code, name in SkillLevel.choices
+        },
+    )
+
+    return {
+        'total': counts['total'],
+        'primary': counts['primary'],
+        'by_category': {
+            name: counts[f'category_{code}']
+            for code, name in SkillCategory.choices
+            if counts[f'category_{code}'] > 0
+        },
+        'by_level': {
+            name: counts[f'level_{code}']
+            for code, name in SkillLevel.choices
+            if counts[f'level_{code}'] > 0
+        },
+        'with_justifications': counts['with_justifications'],
+    }
@@ -9,9 +9,11 @@ from django.db.models import Count, Q
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 
+from apps.core.cache import cached_public_action
+from apps.core.mixins import ReorderMixin, SparseFieldsetMixin
 from apps.core.permissions import IsOwner
-from apps.core.enums import SkillCategory, SkillLevel
 from .models import Skill
+from .utils import get_skill_statistics, group_skills_by_category, with_justifications
 from .serializers import (
     SkillSerializer,
     SkillCreateUpdateSerializer,
@@ -49,13 +51,17 @@ from .serializers import (
         ]
     )
 )
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(SparseFieldsetMixin, ReorderMixin, viewsets.ModelViewSet):
     """ViewSet for managing skills."""
+    reorder_key = 'skills'
+    reorder_required_message = 'Liste de compétences requise'
     permission_classes = [IsAuthenticated, IsOwner]
     
     def get_queryset(self):
         """Return skills for the authenticated user."""
-        return Skill.objects.filter(user=self.request.user).order_by('display_order', 'category', 'name')
+        skills = Skill.objects.filter(user=self.request.user).order_by('display_order', 'category', 'name')
+        # The list only shows the justification count: no need to prefetch
+        return with_justifications(skills, prefetch=self.action != 'list')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -70,6 +76,7 @@ class SkillViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('skills.public')
     def public(self, request):
         """Get all public skills for a specific user."""
         user_id = request.query_params.get('user_id')
@@ -86,6 +93,7 @@ class SkillViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('skills.grouped')
     def grouped(self, request):
         """Get skills grouped by category for a specific user."""
         user_id = request.query_params.get('user_id')
@@ -96,26 +104,17 @@ class SkillViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        grouped_skills = []
-        
-        for category_code, category_name in SkillCategory.choices:
-            skills = Skill.objects.filter(
-                user_id=user_id,
-                category=category_code
-            ).order_by('display_order', 'name')
-            
-            if skills.exists():
-                grouped_skills.append({
-                    'category': category_code,
-                    'category_display': category_name,
-                    'skills': SkillPublicSerializer(skills, many=True).data,
-                    'count': skills.count()
-                })
+        # One ordered query, grouped in a single pass (no visibility or
+        # publication fields on skills: every skill of the owner is public)
+        grouped_skills = group_skills_by_category(
+            Skill.objects.filter(user_id=user_id).order_by('display_order', 'name')
+        )
         
         serializer = SkillGroupedSerializer(grouped_skills, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    @cached_public_action('skills.primary')
     def primary(self, request):
         """Get primary skills only for a specific user."""
         user_id = request.query_params.get('user_id')
@@ -134,30 +133,6 @@ class SkillViewSet(viewsets.ModelViewSet):
         serializer = SkillPublicSerializer(skills, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
-    def reorder(self, request):
-        """Reorder skills."""
-        skills_data = request.data.get('skills', [])
-        
-        if not skills_data:
-            return Response(
-                {'error': 'Liste de compétences requise'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        for item in skills_data:
-            skill_id = item.get('id')
-            display_order = item.get('display_order')
-            
-            try:
-                skill = Skill.objects.get(id=skill_id, user=request.user)
-                skill.display_order = display_order
-                skill.save(update_fields=['display_order'])
-            except Skill.DoesNotExist:
-                continue
-        
-        return Response({'message': 'Ordre mis à jour'}, status=status.HTTP_200_OK)
-    
     @extend_schema(
         parameters=[
             OpenApiParameter('id', OpenApiTypes.UUID, OpenApiParameter.PATH, description='Skill ID')
@@ -178,28 +153,4 @@ class SkillViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """Get statistics about user's skills."""
-        skills = self.get_queryset()
-        
-        by_category = {}
-        for category_code, category_name in SkillCategory.choices:
-            count = skills.filter(category=category_code).count()
-            if count > 0:
-                by_category[category_name] = count
-        
-        by_level = {}
-        for level_code, level_name in SkillLevel.choices:
-            count = skills.filter(level=level_code).count()
-            if count > 0:
-                by_level[level_name] = count
-        
-        return Response({
-            'total': skills.count(),
-            'primary': skills.filter(is_primary=True).count(),
-            'by_category': by_category,
-            'by_level': by_level,
-            'with_justifications': skills.filter(
-                Q(related_projects__isnull=False) |
-                Q(related_certifications__isnull=False) |
-                Q(related_trainings__isnull=False)
-            ).distinct().count()
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(get_skill_statistics(request.user.id), status=status.HTTP_200_OK)
@@ -121,12 +121,54 @@ STATICFILES_DIRS = [BASE_DIR / 'static']
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Public URL of the API, used for the absolute media URLs built outside of
+# a request (portfolio snapshots, apps.profiles.snapshots)
+SITE_URL = config('SITE_URL', default='http://localhost:8000')
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
 
+# ==============================================================================
+# CACHE
+# ==============================================================================
+# Local memory by default. Shared backends for multi-worker deployments, e.g.:
+# - CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+#   CACHE_LOCATION=/var/tmp/portfolio_cache
+# - CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#   CACHE_LOCATION=redis://127.0.0.1:6379 (nécessite le paquet redis)
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='portfolio-cache'),
+    }
+}
+
+# Public responses cache (apps.core.cache)
+PUBLIC_CACHE_TIMEOUT = config('PUBLIC_CACHE_TIMEOUT', default=300, cast=int)
+PUBLIC_CACHE_STALE_TIMEOUT = config('PUBLIC_CACHE_STALE_TIMEOUT', default=86400, cast=int)
+
+# Seconds between two writes of the buffered profile views (apps.profiles.counters)
+PROFILE_VIEWS_FLUSH_INTERVAL = config('PROFILE_VIEWS_FLUSH_INTERVAL', default=10, cast=int)
+
+# Seconds between two writes of the buffered recruiter accesses (apps.recruiter_access.events)
+RECRUITER_ACCESS_FLUSH_INTERVAL = config('RECRUITER_ACCESS_FLUSH_INTERVAL', default=10, cast=int)
+
+# Seconds the recruiter link statistics of a user stay cached (0 = no cache)
+RECRUITER_SUMMARY_CACHE_TIMEOUT = config('RECRUITER_SUMMARY_CACHE_TIMEOUT', default=60, cast=int)
+
+# Seconds between two reloads of the recruiter token revocation set (apps.recruiter_access.revocations)
+RECRUITER_REVOCATION_REFRESH_INTERVAL = config('RECRUITER_REVOCATION_REFRESH_INTERVAL', default=30, cast=int)
+
+# Seconds between two polls of the import job queue (run_import_jobs command)
+IMPORT_JOB_POLL_INTERVAL = config('IMPORT_JOB_POLL_INTERVAL', default=2, cast=int)
+
+# Seconds without a heartbeat after which a running import job is considered
+# lost (worker killed); well above apps.profiles.jobs.HEARTBEAT_INTERVAL
+IMPORT_JOB_TIMEOUT = config('IMPORT_JOB_TIMEOUT', default=300, cast=int)
+
 # ==============================================================================
 # DJANGO REST FRAMEWORK
 # ==============================================================================
@@ -221,4 +263,7 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite default port
 ]
 
-CORS_ALLOW_CREDENTIALS = True
\ No newline at end of file
+CORS_ALLOW_CREDENTIALS = True
+
+# Response headers readable by the frontend (archive download progress)
+CORS_EXPOSE_HEADERS = ['Content-Disposition', 'X-Archive-Size']
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures
+"""
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accounts.models import User
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(
+        email='jean.dupont@example.com',
+        password='motdepasse123!',
+        first_name='Jean',
+        last_name='Dupont',
+    )
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    return client
@@ -2,8 +2,8 @@
 import apiClient, { unwrapListResponse } from '../client'
 
 export const diplomasAPI = {
-  getAll: async () => {
-    const response = await apiClient.get('/education/diplomas/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/education/diplomas/', { params })
     return unwrapListResponse(response.data)
   },
 
@@ -50,8 +50,8 @@ export const diplomasAPI = {
 }
 
 export const certificationsAPI = {
-  getAll: async () => {
-    const response = await apiClient.get('/education/certifications/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/education/certifications/', { params })
     return unwrapListResponse(response.data)
   },
 
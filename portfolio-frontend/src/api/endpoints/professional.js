@@ -4,8 +4,8 @@ import apiClient, { unwrapListResponse } from '../client'
  * Endpoints pour les expériences professionnelles
  */
 export const experiencesAPI = {
-  getAll: async () => {
-    const response = await apiClient.get('/professional/experiences/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/professional/experiences/', { params })
     return unwrapListResponse(response.data)
   },
   getById: async (id) => {
@@ -48,8 +48,8 @@ export const experiencesAPI = {
  * Endpoints pour les formations
  */
 export const trainingsAPI = {
-  getAll: async () => {
-    const response = await apiClient.get('/professional/trainings/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/professional/trainings/', { params })
     return unwrapListResponse(response.data)
   },
   getById: async (id) => {
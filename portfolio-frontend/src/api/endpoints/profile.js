@@ -33,10 +33,45 @@ export const profileAPI = {
     return response.data
   },
 
+  /**
+   * Télécharger l'archive ZIP (export JSON + fichiers des preuves)
+   * GET /api/profile/export/archive/
+   * onProgress reçoit un pourcentage calculé avec l'en-tête X-Archive-Size
+   */
+  exportArchive: async (options = {}) => {
+    const response = await apiClient.get('/profile/export/archive/', {
+      params: options?.media ? { media: 1 } : {},
+      responseType: 'blob',
+      onDownloadProgress: (event) => {
+        const total = Number(event.event?.target?.getResponseHeader?.('X-Archive-Size')) || event.total
+        if (options?.onProgress && total) {
+          options.onProgress(Math.min(100, Math.round((event.loaded * 100) / total)))
+        }
+      },
+    })
+    return response.data
+  },
+
+  /**
+   * Mettre un import en file d'attente (traité en arrière-plan)
+   * POST /api/profile/import/
+   * Retourne { message, job } : suivre le job avec getImportJob
+   * Avec options.dryRun, retourne directement { summary } sans rien modifier
+   */
   importPortfolio: async (payload, options = {}) => {
-    const mode = options?.mode
-    const url = mode ? `/profile/import/?mode=${encodeURIComponent(mode)}` : '/profile/import/'
-    const response = await apiClient.post(url, payload)
+    const params = {}
+    if (options?.mode) params.mode = options.mode
+    if (options?.dryRun) params.dry_run = 1
+    const response = await apiClient.post('/profile/import/', payload, { params })
+    return response.data
+  },
+
+  /**
+   * Récupérer la progression et le résultat d'un import
+   * GET /api/profile/import/jobs/{job_id}/
+   */
+  getImportJob: async (jobId) => {
+    const response = await apiClient.get(`/profile/import/jobs/${jobId}/`)
     return response.data
   },
 
@@ -71,6 +106,15 @@ export const profileAPI = {
     return response.data
   },
 
+  /**
+   * Récupérer tous les compteurs du tableau de bord
+   * GET /api/profile/dashboard/
+   */
+  getDashboard: async () => {
+    const response = await apiClient.get('/profile/dashboard/')
+    return response.data
+  },
+
   /**
    * Récupérer un profil public par user_id
    * GET /api/profile/public/{user_id}/
@@ -85,4 +129,13 @@ export const profileAPI = {
     })
     return res.data
   },
+
+  /**
+   * Récupérer le portfolio public complet (profil + sections) en une requête
+   * GET /api/profile/public/slug/{slug}/full/
+   */
+  getPublicPortfolioBySlug: async (slug, params = {}) => {
+    const response = await apiClient.get(`/profile/public/slug/${slug}/full/`, { params })
+    return response.data
+  },
 }
\ No newline at end of file
@@ -7,9 +7,10 @@ export const projectsAPI = {
   /**
    * Lister tous mes projets
    * GET /api/projects/
+   * params.fields / params.omit : ne renvoyer que certains champs (ex: { fields: 'id,title' })
    */
-  getAll: async () => {
-    const response = await apiClient.get('/projects/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/projects/', { params })
     return unwrapListResponse(response.data)
   },
 
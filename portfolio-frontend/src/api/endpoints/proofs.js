@@ -84,5 +84,15 @@ export const proofsAPI = {
       proofs
     })
     return response.data
+  },
+
+  /**
+   * Déplacer une preuve entre deux voisines (seule la preuve déplacée est réécrite)
+   * @param {string} id - ID de la preuve déplacée
+   * @param {Object} neighbours - { after: id précédent | null, before: id suivant | null }
+   */
+  move: async (id, { after = null, before = null }) => {
+    const response = await apiClient.post(`/proofs/${id}/move/`, { after, before })
+    return response.data
   }
 }
\ No newline at end of file
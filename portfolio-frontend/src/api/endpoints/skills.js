@@ -7,8 +7,8 @@ export const skillsAPI = {
   /**
    * Lister toutes les compétences
    */
-  getAll: async () => {
-    const response = await apiClient.get('/skills/')
+  getAll: async (params = {}) => {
+    const response = await apiClient.get('/skills/', { params })
     return unwrapListResponse(response.data)
   },
 
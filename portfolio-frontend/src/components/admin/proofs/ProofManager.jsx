@@ -77,13 +77,11 @@ export function ProofManager({ contentType, objectId }) {
 
         setProofs(newProofs)
 
-        const reorderPayload = newProofs.map((p, index) => ({
-            id: p.id,
-            display_order: index
-        }))
-
         try {
-            await proofsAPI.reorder(reorderPayload)
+            await proofsAPI.move(movedItem.id, {
+                after: newProofs[newIndex - 1]?.id ?? null,
+                before: newProofs[newIndex + 1]?.id ?? null,
+            })
         } catch (err) {
             console.error('Erreur réorganisation:', err)
             loadProofs()
@@ -1,14 +1,9 @@
 import { useState, useEffect } from 'react'
-import { 
-  profileAPI, 
-  projectsAPI, 
-  skillsAPI, 
-  diplomasAPI, 
-  experiencesAPI 
-} from '@/api'
+import { profileAPI } from '@/api'
 
 /**
  * Hook pour récupérer toutes les statistiques du dashboard
+ * (un seul appel : GET /api/profile/dashboard/)
  * 
  * @returns {Object} { stats, loading, error, refresh }
  */
@@ -18,11 +13,14 @@ export function useDashboardStats() {
     projects: { total: 0, featured: 0 },
     skills: { total: 0, primary: 0, byCategory: {} },
     diplomas: { total: 0 },
+    certifications: { total: 0 },
     experiences: { total: 0, current: 0 },
+    trainings: { total: 0 },
+    recruiterAccess: { totalLinks: 0, activeLinks: 0, expiredLinks: 0, totalAccesses: 0 },
   })
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
-  const [partialErrors, setPartialErrors] = useState({})  // ← Nouveau : erreurs par API
+  const [partialErrors, setPartialErrors] = useState({})
 
   const fetchStats = async () => {
     try {
@@ -30,54 +28,40 @@ export function useDashboardStats() {
       setError(null)
       setPartialErrors({})
 
-      // Utiliser allSettled pour gérer erreurs partielles
-      const results = await Promise.allSettled([
-        profileAPI.checkCompleteness(),
-        projectsAPI.getAll(),
-        skillsAPI.getStatistics(),
-        diplomasAPI.getAll(),
-        experiencesAPI.getAll(),
-      ])
-
-      // Traiter chaque résultat
-      const [profileRes, projectsRes, skillsRes, diplomasRes, experiencesRes] = results
-
-      const getValueOrDefault = (name, res, defaultValue) => {
-        if (res.status === 'fulfilled') return res.value
-        console.error('Erreur partielle:', res.reason)
-        setPartialErrors(prev => ({
-          ...prev,
-          [name]: res.reason?.message || 'Erreur inconnue'
-        }))
-        return defaultValue
-      }
-
-      const profileData = getValueOrDefault('profile', profileRes, { is_complete: false, profile_views: 0 })
-      const projectsData = getValueOrDefault('projects', projectsRes, [])
-      const skillsData = getValueOrDefault('skills', skillsRes, { total: 0, primary: 0, by_category: {} })
-      const diplomasData = getValueOrDefault('diplomas', diplomasRes, [])
-      const experiencesData = getValueOrDefault('experiences', experiencesRes, [])
+      const data = await profileAPI.getDashboard()
 
       setStats({
         profileCompletion: {
-          isComplete: profileData.is_complete,
-          views: profileData.profile_views,
+          isComplete: data.profile.is_complete,
+          views: data.profile.profile_views,
         },
         projects: {
-          total: projectsData.length,
-          featured: projectsData.filter(p => p.is_featured).length,
+          total: data.projects.total,
+          featured: data.projects.featured,
         },
         skills: {
-          total: skillsData.total || 0,
-          primary: skillsData.primary || 0,
-          byCategory: skillsData.by_category || {},
+          total: data.skills.total || 0,
+          primary: data.skills.primary || 0,
+          byCategory: data.skills.by_category || {},
         },
         diplomas: {
-          total: diplomasData.length,
+          total: data.diplomas.total,
+        },
+        certifications: {
+          total: data.certifications.total,
         },
         experiences: {
-          total: experiencesData.length,
-          current: experiencesData.filter(e => e.is_current).length,
+          total: data.experiences.total,
+          current: data.experiences.current,
+        },
+        trainings: {
+          total: data.trainings.total,
+        },
+        recruiterAccess: {
+          totalLinks: data.recruiter_access.total_links,
+          activeLinks: data.recruiter_access.active_links,
+          expiredLinks: data.recruiter_access.expired_links,
+          totalAccesses: data.recruiter_access.total_accesses,
         },
       })
     } catch (err) {
@@ -96,7 +80,7 @@ export function useDashboardStats() {
     stats,
     loading,
     error,
-    partialErrors,  // ← Exposer pour affichage ciblé si besoin
+    partialErrors,  // Conservé pour compatibilité avec le Dashboard
     refresh: fetchStats,
   }
-}
\ No newline at end of file
+}
@@ -5,6 +5,9 @@ import { Button, Card, CardHeader, CardTitle, CardContent, Input, Alert, AlertTi
 import { authAPI, profileAPI, projectsAPI, skillsAPI, diplomasAPI, certificationsAPI, experiencesAPI, trainingsAPI } from '@/api'
 import { useAuth } from '@/auth/hooks/useAuth'
 
+// Délai entre deux consultations d'un import en cours (ms)
+const IMPORT_POLL_INTERVAL = 1500
+
 export function Settings() {
   const navigate = useNavigate()
   const { logout } = useAuth()
@@ -20,6 +23,7 @@ export function Settings() {
   const [importFile, setImportFile] = useState(null)
   const [isImporting, setIsImporting] = useState(false)
   const [isExporting, setIsExporting] = useState(false)
+  const [isExportingArchive, setIsExportingArchive] = useState(false)
 
   const [importReplace, setImportReplace] = useState(false)
 
@@ -43,12 +47,13 @@ export function Settings() {
       try {
         const [p, projects, skills, diplomas, certifications, experiences, trainings] = await Promise.all([
           profileAPI.getMyProfile(),
-          projectsAPI.getAll(),
-          skillsAPI.getAll(),
-          diplomasAPI.getAll(),
-          certificationsAPI.getAll(),
-          experiencesAPI.getAll(),
-          trainingsAPI.getAll(),
+          // Seuls les champs utilisés par les vérifications sont demandés
+          projectsAPI.getAll({ fields: 'id,is_published' }),
+          skillsAPI.getAll({ fields: 'id,is_primary' }),
+          diplomasAPI.getAll({ fields: 'id' }),
+          certificationsAPI.getAll({ fields: 'id' }),
+          experiencesAPI.getAll({ fields: 'id' }),
+          trainingsAPI.getAll({ fields: 'id' }),
         ])
 
         const issues = []
@@ -94,6 +99,35 @@ export function Settings() {
     }
   }
 
+  const handleExportArchive = async () => {
+    try {
+      setIsExportingArchive(true)
+      setError('')
+      setSuccess('')
+
+      const blob = await profileAPI.exportArchive({
+        media: true,
+        onProgress: (percent) => setSuccess(`Téléchargement de l'archive... ${percent}%`),
+      })
+      const url = URL.createObjectURL(blob)
+
+      const a = document.createElement('a')
+      a.href = url
+      a.download = 'portfolio-export.zip'
+      document.body.appendChild(a)
+      a.click()
+      a.remove()
+      URL.revokeObjectURL(url)
+
+      setSuccess('Archive ZIP générée.')
+    } catch (err) {
+      setSuccess('')
+      setError('Erreur lors de l\'export de l\'archive')
+    } finally {
+      setIsExportingArchive(false)
+    }
+  }
+
   const handleExport = async () => {
     try {
       setIsExporting(true)
@@ -142,9 +176,32 @@ export function Settings() {
 
       const text = await importFile.text()
       const payload = JSON.parse(text)
-      await profileAPI.importPortfolio(payload, { mode: importReplace ? 'replace' : 'merge' })
+      const { job: queuedJob } = await profileAPI.importPortfolio(payload, { mode: importReplace ? 'replace' : 'merge' })
+
+      // L'import est traité en arrière-plan : on suit sa progression
+      let job = queuedJob
+      while (job.status === 'pending' || job.status === 'running') {
+        setSuccess(`Import en cours... ${job.progress}%`)
+        await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_INTERVAL))
+        job = await profileAPI.getImportJob(job.id)
+      }
+
+      if (job.status === 'failed') {
+        setSuccess('')
+        setError(job.error || 'Erreur lors de l\'import')
+        return
+      }
 
-      setSuccess('Import terminé. Recharge la page pour voir toutes les données à jour.')
+      const totals = { created: 0, updated: 0, unchanged: 0, deleted: 0 }
+      Object.values(job.result || {}).forEach((counts) => {
+        Object.keys(totals).forEach((key) => { totals[key] += counts?.[key] || 0 })
+      })
+
+      setSuccess(
+        `Import terminé : ${totals.created} créé(s), ${totals.updated} modifié(s), ` +
+        `${totals.unchanged} inchangé(s), ${totals.deleted} supprimé(s). ` +
+        'Recharge la page pour voir toutes les données à jour.'
+      )
     } catch (err) {
       const msg = err.response?.data?.error || err.response?.data?.detail || err.message || 'Erreur lors de l\'import'
       setError(msg)
@@ -250,6 +307,16 @@ export function Settings() {
               </Button>
             </div>
 
+            <div className="flex items-center justify-between gap-6">
+              <div>
+                <p className="text-sm font-medium text-gray-900 dark:text-white">Archive ZIP</p>
+                <p className="text-sm text-gray-600 dark:text-gray-400">Export JSON avec les fichiers des preuves, la photo et les images des projets</p>
+              </div>
+              <Button onClick={handleExportArchive} disabled={isExportingArchive} isLoading={isExportingArchive}>
+                Télécharger
+              </Button>
+            </div>
+
             <div className="flex items-center justify-between gap-6">
               <div>
                 <p className="text-sm font-medium text-gray-900 dark:text-white">Import JSON</p>
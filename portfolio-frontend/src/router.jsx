@@ -2,15 +2,7 @@ import { createBrowserRouter, Navigate, useRouteError } from 'react-router-dom'
 import { ProtectedRoute } from './auth/ProtectedRoute'
 
 // API
-import {
-  profileAPI,
-  projectsAPI,
-  skillsAPI,
-  experiencesAPI,
-  diplomasAPI,
-  certificationsAPI,
-  trainingsAPI
-} from '@/api'
+import { profileAPI } from '@/api'
 
 // Pages auth
 import { Login } from './pages/auth/Login'
@@ -73,28 +65,17 @@ export const router = createBrowserRouter([
         const accessToken = url.searchParams.get('access')
         const accessParams = accessToken ? { access: accessToken } : {}
 
-        // Charger le profil
-        const profile = await profileAPI.getPublicBySlug(params.slug, accessParams)
-        const userId = profile.user_id
-
-        // Charger toutes les données publiques associées en parallèle
-        const [projects, skills, experiences, diplomas, certifications, trainings] = await Promise.all([
-          projectsAPI.getPublic?.(userId, accessParams).catch(() => []),
-          skillsAPI.getGrouped?.(userId, accessParams).catch(() => []),
-          experiencesAPI.getPublic?.(userId, accessParams).catch(() => []),
-          diplomasAPI.getPublic?.(userId, accessParams).catch(() => []),
-          certificationsAPI.getPublic?.(userId, accessParams).catch(() => []),
-          trainingsAPI.getPublic?.(userId, accessParams).catch(() => []),
-        ])
+        // Charger le profil et toutes les sections publiques en une seule requête
+        const portfolio = await profileAPI.getPublicPortfolioBySlug(params.slug, accessParams)
 
         return {
-          profile,
-          projects: projects || [],
-          skills: skills || [],
-          experiences: experiences || [],
-          diplomas: diplomas || [],
-          certifications: certifications || [],
-          trainings: trainings || []
+          profile: portfolio.profile,
+          projects: portfolio.projects || [],
+          skills: portfolio.skills || [],
+          experiences: portfolio.experiences || [],
+          diplomas: portfolio.diplomas || [],
+          certifications: portfolio.certifications || [],
+          trainings: portfolio.trainings || []
         }
       } catch (err) {
         console.error('Erreur chargement portfolio:', err)